@@ -5,10 +5,28 @@ and parse their output.
 """
 
 import asyncio
-import json
+import atexit
+import functools
+import getpass
 import os
+import shlex
+import shutil
 import subprocess
-from typing import Any
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import (
+    AbstractAsyncContextManager,
+    asynccontextmanager,
+    contextmanager,
+    nullcontext,
+    suppress,
+)
+from contextvars import ContextVar
+from typing import IO, Any, Literal, TypeVar, overload
+
+import orjson
 
 # Error codes
 ERROR_AEROSPACE_NOT_RUNNING = "AEROSPACE_NOT_RUNNING"
@@ -20,19 +38,44 @@ ERROR_NO_WINDOW_FOCUSED = "NO_WINDOW_FOCUSED"
 ERROR_COMMAND_FAILED = "COMMAND_FAILED"
 
 # Valid directions for focus/move commands
-VALID_DIRECTIONS = {"left", "right", "up", "down"}
+VALID_DIRECTIONS = frozenset({"left", "right", "up", "down"})
 
 # Valid layout modes
-VALID_LAYOUTS = {
-    "tiles",
-    "accordion",
-    "h_tiles",
-    "v_tiles",
-    "h_accordion",
-    "v_accordion",
-    "floating",
-    "tiling",
-}
+VALID_LAYOUTS = frozenset(
+    {
+        "tiles",
+        "accordion",
+        "h_tiles",
+        "v_tiles",
+        "h_accordion",
+        "v_accordion",
+        "floating",
+        "tiling",
+    }
+)
+
+# Sorted forms used in validation error messages
+_VALID_DIRECTIONS_SORTED = tuple(sorted(VALID_DIRECTIONS))
+_VALID_DIRECTIONS_STR = ", ".join(_VALID_DIRECTIONS_SORTED)
+_VALID_LAYOUTS_SORTED = tuple(sorted(VALID_LAYOUTS))
+_VALID_LAYOUTS_STR = ", ".join(_VALID_LAYOUTS_SORTED)
+
+
+# Persistent worker protocol. The aerospace CLI has no batch mode, so the worker
+# is a long-lived shell that reads one shell-quoted argument list per line and
+# runs a single aerospace invocation for it. Each reply is the command's stdout,
+# a sentinel line carrying the exit code, the command's stderr and a closing
+# sentinel line.
+_WORKER_SENTINEL = "__WIN_CTRL_MCP_DONE__"
+_WORKER_SENTINEL_BYTES = _WORKER_SENTINEL.encode()
+_WORKER_EXIT_PREFIX = _WORKER_SENTINEL_BYTES + b" "
+_WORKER_SCRIPT = f"""
+while IFS= read -r line; do
+  eval "set -- $line"
+  {{ err=$(aerospace "$@" 2>&1 1>&3); rc=$?; }} 3>&1
+  printf '\\n%s %s\\n%s\\n%s\\n' {_WORKER_SENTINEL} "$rc" "$err" {_WORKER_SENTINEL}
+done
+"""
 
 
 class AeroSpaceError(Exception):
@@ -56,17 +99,541 @@ class AeroSpaceError(Exception):
         }
 
 
+class _WorkerUnavailable(Exception):
+    """Raised when the persistent worker cannot accept a command."""
+
+
+class _WorkerReply:
+    """Incremental parser for one framed reply from the worker."""
+
+    def __init__(self) -> None:
+        self.stdout: list[bytes] = []
+        self.stderr: list[bytes] = []
+        self.returncode: int | None = None
+
+    def feed(self, line: bytes) -> bool:
+        """Consume one line of worker output.
+
+        Args:
+            line: Raw line including its trailing newline
+
+        Returns:
+            True once the reply is complete
+
+        Raises:
+            EOFError: If the worker closed its output mid-reply
+        """
+        if not line:
+            raise EOFError("AeroSpace worker exited unexpectedly")
+        if self.returncode is None:
+            if line.startswith(_WORKER_EXIT_PREFIX):
+                self.returncode = int(line[len(_WORKER_EXIT_PREFIX) :])
+            else:
+                self.stdout.append(line)
+            return False
+        if line.rstrip(b"\n") == _WORKER_SENTINEL_BYTES:
+            return True
+        self.stderr.append(line)
+        return False
+
+    def result(self) -> tuple[bytes, bytes, int]:
+        """Return the raw (stdout, stderr, return_code) triple.
+
+        The worker adds one newline after each stream to frame it, which is
+        dropped here so both streams match what aerospace wrote.
+        """
+        stdout = b"".join(self.stdout)[:-1]
+        stderr = b"".join(self.stderr)[:-1]
+        return stdout, stderr, self.returncode or 0
+
+
+def _encode_request(args: Sequence[str]) -> bytes:
+    """Encode aerospace arguments as one worker request line.
+
+    Raises:
+        _WorkerUnavailable: If an argument cannot be sent on a single line
+    """
+    if any("\n" in arg for arg in args):
+        raise _WorkerUnavailable("argument contains a newline")
+    return (" ".join(shlex.quote(arg) for arg in args) + "\n").encode("utf-8")
+
+
+class _Worker:
+    """Persistent aerospace worker shared by the sync and async runners.
+
+    The worker runs one command at a time, so the async runner drives it from
+    a thread and the process is not tied to any event loop. A command issued
+    while the worker is busy is reported as unavailable and runs as a one-shot
+    process instead, which keeps concurrent callers overlapping.
+    """
+
+    def __init__(self) -> None:
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._lock = threading.Lock()
+
+    def run(self, args: Sequence[str]) -> tuple[bytes, bytes, int]:
+        """Run one aerospace command through the worker.
+
+        Args:
+            args: Arguments to pass to the aerospace CLI
+
+        Returns:
+            Tuple of (stdout, stderr, return_code) with undecoded output
+
+        Raises:
+            _WorkerUnavailable: If the worker is busy, cannot be started or written to
+            EOFError: If the worker exited before replying
+        """
+        request = _encode_request(args)
+        if not self._lock.acquire(blocking=False):
+            raise _WorkerUnavailable("worker is busy")
+        try:
+            return self._exchange(request)
+        finally:
+            self._lock.release()
+
+    def run_sequence(self, commands: Sequence[Sequence[str]]) -> list[tuple[bytes, bytes, int]]:
+        """Run commands in order, holding the worker until the last one is done.
+
+        The sequence stops at the first command with a non-zero exit code.
+        Commands the worker cannot take (it is busy, or an argument cannot be
+        framed) run as one-shot processes instead.
+
+        Args:
+            commands: Argument lists for the aerospace CLI
+
+        Returns:
+            (stdout, stderr, return_code) of every command that ran
+
+        Raises:
+            EOFError: If the worker exited before replying
+        """
+        held = self._lock.acquire(blocking=False)
+        try:
+            results = []
+            for args in commands:
+                result = None
+                if held:
+                    with suppress(_WorkerUnavailable):
+                        result = self._exchange(_encode_request(args))
+                if result is None:
+                    result = _run_one_shot(["aerospace", *args])
+                results.append(result)
+                if result[2] != 0:
+                    break
+            return results
+        finally:
+            if held:
+                self._lock.release()
+
+    def _exchange(self, request: bytes) -> tuple[bytes, bytes, int]:
+        """Send one encoded request and read its reply; the caller holds the lock."""
+        proc = self._ensure_started()
+        stdin: IO[bytes] = proc.stdin  # type: ignore[assignment]
+        stdout: IO[bytes] = proc.stdout  # type: ignore[assignment]
+        try:
+            stdin.write(request)
+            stdin.flush()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            self.close()
+            raise _WorkerUnavailable(str(e))
+
+        reply = _WorkerReply()
+        try:
+            while not reply.feed(stdout.readline()):
+                pass
+        except EOFError:
+            self.close()
+            raise
+        return reply.result()
+
+    def _ensure_started(self) -> subprocess.Popen[bytes]:
+        if self._proc is not None and self._proc.poll() is None:
+            return self._proc
+        try:
+            self._proc = subprocess.Popen(
+                ["/bin/sh", "-c", _WORKER_SCRIPT],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+        except OSError as e:
+            raise _WorkerUnavailable(str(e))
+        return self._proc
+
+    def close(self) -> None:
+        """Terminate the worker process if it is running."""
+        proc, self._proc = self._proc, None
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+            proc.wait()
+
+
+_worker = _Worker()
+atexit.register(_worker.close)
+
+# Blocking command execution for the async runner happens on this bounded pool
+# rather than through asyncio's subprocess machinery and child watcher.
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="aerospace")
+
+
+# Negative health cache. Once aerospace is found to be unavailable, further
+# commands fail fast for _DAEMON_CHECK_TTL seconds instead of each paying for a
+# process spawn. Any command that completes normally clears the verdict.
+_DAEMON_CHECK_TTL = 2.0
+_daemon_down_at: float | None = None
+
+
+def _check_daemon() -> None:
+    """Raise immediately if aerospace was recently found to be unavailable.
+
+    Raises:
+        AeroSpaceError: If aerospace was unavailable within the last TTL
+    """
+    down_at = _daemon_down_at
+    if down_at is not None and time.monotonic() - down_at < _DAEMON_CHECK_TTL:
+        raise AeroSpaceError(
+            ERROR_AEROSPACE_NOT_RUNNING,
+            "AeroSpace is not available. Please ensure it is installed and running.",
+            {
+                "suggestion": "Run 'aerospace start' or launch AeroSpace from Applications",
+                "retry_after_seconds": _DAEMON_CHECK_TTL,
+            },
+        )
+
+
+def _record_daemon_state(available: bool) -> None:
+    """Remember whether the last command found aerospace available."""
+    global _daemon_down_at
+    _daemon_down_at = None if available else time.monotonic()
+
+
+@functools.cache
+def _aerospace_path() -> str | None:
+    """Locate the aerospace executable on PATH, once per process."""
+    return shutil.which("aerospace")
+
+
+def _run_one_shot(cmd: list[str]) -> tuple[bytes, bytes, int]:
+    """Run an aerospace command in a fresh process.
+
+    Args:
+        cmd: Full command line including the aerospace executable
+
+    Returns:
+        Tuple of (stdout, stderr, return_code) with undecoded output
+    """
+    result = subprocess.run(cmd, capture_output=True)
+    return result.stdout, result.stderr, result.returncode
+
+
+def _decode(stdout: bytes, stderr: bytes, returncode: int, raw: bool) -> tuple[Any, Any, int]:
+    """Return command output as bytes when raw, otherwise as stripped text."""
+    if raw:
+        return stdout, stderr, returncode
+    return stdout.decode("utf-8").strip(), stderr.decode("utf-8").strip(), returncode
+
+
+def _build_cmd(args: tuple[str, ...], json_output: bool) -> list[str]:
+    """Build the full aerospace command line."""
+    cmd = ["aerospace", *args]
+    if json_output:
+        cmd.append("--json")
+    return cmd
+
+
+def _not_running_error() -> AeroSpaceError:
+    """Record that aerospace is unavailable and build the matching error."""
+    _record_daemon_state(False)
+    return AeroSpaceError(
+        ERROR_AEROSPACE_NOT_RUNNING,
+        "AeroSpace daemon is not running. Please start it first.",
+        {"suggestion": "Run 'aerospace start' or launch AeroSpace from Applications"},
+    )
+
+
+def _check_result(
+    cmd: list[str],
+    stdout: bytes,
+    stderr: bytes,
+    returncode: int,
+    check: bool,
+    raw: bool,
+) -> tuple[Any, Any, int]:
+    """Turn a finished command into the runners' return value.
+
+    Args:
+        cmd: Full command line that was run
+        stdout: Undecoded standard output
+        stderr: Undecoded standard error
+        returncode: Process exit code
+        check: If True, raise on a non-zero exit code
+        raw: If True, return stdout and stderr as bytes
+
+    Returns:
+        Tuple of (stdout, stderr, return_code)
+
+    Raises:
+        AeroSpaceError: If the command failed and check is True
+    """
+    if returncode != 127:
+        _record_daemon_state(True)
+    elif _aerospace_path() is None:
+        # The shell could not find the CLI. This is raised even when check is
+        # False, since callers that tolerate a failed query would otherwise
+        # report it as "nothing focused".
+        _record_daemon_state(False)
+        raise AeroSpaceError(
+            ERROR_AEROSPACE_NOT_RUNNING,
+            "AeroSpace CLI not found. Please ensure AeroSpace is installed and in PATH.",
+            {"suggestion": "Install AeroSpace from https://nikitabobko.github.io/AeroSpace/"},
+        )
+
+    if check and returncode != 0:
+        stdout_str, stderr_str, _ = _decode(stdout, stderr, returncode, raw=False)
+        raise AeroSpaceError(
+            ERROR_COMMAND_FAILED,
+            f"AeroSpace command failed: {stderr_str or stdout_str}",
+            {"command": cmd, "return_code": returncode, "stderr": stderr_str},
+        )
+
+    return _decode(stdout, stderr, returncode, raw)
+
+
+def _worker_died_error(cmd: list[str], e: EOFError) -> AeroSpaceError:
+    """Build the error for a worker that exited before replying."""
+    return AeroSpaceError(
+        ERROR_COMMAND_FAILED,
+        f"AeroSpace command failed: {e}",
+        {"command": cmd},
+    )
+
+
+# Subcommands that only read state. Any other command may change windows,
+# workspaces or layout, and bumps the state generation so that cached views of
+# aerospace state can tell they are stale.
+_QUERY_COMMANDS = frozenset(
+    {"list-windows", "list-workspaces", "list-monitors", "list-apps", "debug-windows", "config"}
+)
+_state_generation = 0
+
+
+def state_generation() -> int:
+    """Return a counter that changes whenever a mutating command runs."""
+    return _state_generation
+
+
+def _is_mutating(args: Sequence[str]) -> bool:
+    """Return whether a command may change windows, workspaces or layout."""
+    return bool(args) and args[0] not in _QUERY_COMMANDS
+
+
+@contextmanager
+def _tracking_mutations(*commands: Sequence[str]) -> Iterator[None]:
+    """Bump the state generation around commands that may change state."""
+    global _state_generation
+    mutating = any(_is_mutating(args) for args in commands)
+    if mutating:
+        _state_generation += 1
+    try:
+        yield
+    finally:
+        if mutating:
+            _state_generation += 1
+
+
+class _CommandGate:
+    """Keeps single mutating commands out of a running command sequence.
+
+    Sequences act on whatever window is focused, so a focus change from a
+    concurrent call between two of their steps would send the later steps to
+    the wrong window. Single commands take the gate shared and still overlap
+    with each other; a sequence takes it exclusively, waiting for the single
+    commands in flight and holding back new ones until it is done. Queries do
+    not change focus and skip the gate.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self._cond = asyncio.Condition()
+        self._shared = 0
+        self._exclusive = False
+        self._exclusive_waiting = 0
+
+    @asynccontextmanager
+    async def shared(self) -> AsyncIterator[None]:
+        """Hold the gate alongside other single commands."""
+        async with self._cond:
+            # Waiting sequences go first, so a stream of commands cannot starve them
+            await self._cond.wait_for(lambda: not self._exclusive and not self._exclusive_waiting)
+            self._shared += 1
+        try:
+            yield
+        finally:
+            async with self._cond:
+                self._shared -= 1
+                self._cond.notify_all()
+
+    @asynccontextmanager
+    async def exclusive(self) -> AsyncIterator[None]:
+        """Hold the gate alone for the length of a sequence."""
+        async with self._cond:
+            self._exclusive_waiting += 1
+            try:
+                await self._cond.wait_for(lambda: not self._exclusive and not self._shared)
+            finally:
+                self._exclusive_waiting -= 1
+            self._exclusive = True
+        try:
+            yield
+        finally:
+            async with self._cond:
+                self._exclusive = False
+                self._cond.notify_all()
+
+
+_command_gate_instance: _CommandGate | None = None
+
+
+def _command_gate() -> _CommandGate:
+    """Return the command gate for the running event loop."""
+    global _command_gate_instance
+    loop = asyncio.get_running_loop()
+    # asyncio primitives belong to one loop, so a new loop gets a new gate
+    if _command_gate_instance is None or _command_gate_instance.loop is not loop:
+        _command_gate_instance = _CommandGate(loop)
+    return _command_gate_instance
+
+
+# Direct daemon connection. The aerospace CLI is a thin client that sends its
+# arguments to the daemon as one JSON request over a Unix socket and prints the
+# JSON answer, so sending the request ourselves skips starting a process at all.
+# The request format is internal to AeroSpace, so this is opt-in.
+AEROSPACE_SOCKET_ENV = "WIN_CTRL_MCP_AEROSPACE_SOCKET"
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+@functools.cache
+def _socket_path() -> str:
+    """Return the path of the aerospace daemon's socket for this user."""
+    return f"/tmp/bobko.aerospace-{getpass.getuser()}.sock"
+
+
+def _socket_enabled() -> bool:
+    """Return whether commands should try the daemon socket first."""
+    return os.environ.get(AEROSPACE_SOCKET_ENV, "") not in ("", "0")
+
+
+async def _socket_request(cmd: list[str]) -> tuple[bytes, bytes, int] | None:
+    """Send one command straight to the aerospace daemon.
+
+    Args:
+        cmd: Full command line including the aerospace executable
+
+    Returns:
+        Tuple of (stdout, stderr, return_code) with undecoded output, or None
+        if the socket cannot be connected to and the CLI should be used
+
+    Raises:
+        AeroSpaceError: If the daemon accepted the request but gave no usable
+            answer. The command may have run, so it is not retried.
+    """
+    try:
+        reader, writer = await asyncio.open_unix_connection(_socket_path())
+    except OSError:
+        return None
+
+    try:
+        writer.write(orjson.dumps({"command": "", "args": cmd[1:], "stdin": ""}))
+        await writer.drain()
+        # The daemon keeps the connection open for further requests, so the
+        # answer ends when it parses as a complete JSON object
+        data = bytearray()
+        while chunk := await reader.read(_STREAM_CHUNK_SIZE):
+            data += chunk
+            with suppress(orjson.JSONDecodeError):
+                answer = orjson.loads(data)
+                return (
+                    answer["stdout"].encode("utf-8"),
+                    answer["stderr"].encode("utf-8"),
+                    int(answer["exitCode"]),
+                )
+        reason = "connection closed before a complete answer"
+    except (OSError, KeyError, TypeError, ValueError, AttributeError) as e:
+        reason = f"unexpected answer: {e!r}"
+    finally:
+        writer.close()
+    raise AeroSpaceError(
+        ERROR_COMMAND_FAILED,
+        f"AeroSpace command failed: {reason}",
+        {"command": cmd},
+    )
+
+
+async def _socket_sequence(
+    commands: Sequence[Sequence[str]],
+) -> list[tuple[bytes, bytes, int]] | None:
+    """Send a sequence of commands to the aerospace daemon, stopping at a failure.
+
+    Requests are sent one at a time: the daemon reads each request with a
+    single read and has no framing between requests, so writing the next one
+    before the previous answer arrives could merge them.
+
+    Returns:
+        One result per command that ran, or None if the socket cannot be
+        connected to and the sequence should go through the CLI
+
+    Raises:
+        AeroSpaceError: If the daemon stopped answering partway through
+    """
+    results: list[tuple[bytes, bytes, int]] = []
+    for args in commands:
+        cmd = ["aerospace", *args]
+        result = await _socket_request(cmd)
+        if result is None:
+            if not results:
+                return None
+            raise AeroSpaceError(
+                ERROR_COMMAND_FAILED,
+                "AeroSpace command failed: daemon socket went away mid-sequence",
+                {"command": cmd},
+            )
+        results.append(result)
+        if result[2] != 0:
+            break
+    return results
+
+
+@overload
+async def run_aerospace_command(
+    *args: str,
+    json_output: bool = ...,
+    check: bool = ...,
+    raw: Literal[False] = ...,
+) -> tuple[str, str, int]: ...
+
+
+@overload
+async def run_aerospace_command(
+    *args: str,
+    json_output: bool = ...,
+    check: bool = ...,
+    raw: Literal[True],
+) -> tuple[bytes, bytes, int]: ...
+
+
 async def run_aerospace_command(
     *args: str,
     json_output: bool = False,
     check: bool = True,
-) -> tuple[str, str, int]:
+    raw: bool = False,
+) -> tuple[Any, Any, int]:
     """Run an aerospace CLI command asynchronously.
 
     Args:
         *args: Command arguments to pass to aerospace CLI
         json_output: If True, add --json flag
         check: If True, raise exception on non-zero exit code
+        raw: If True, return stdout and stderr as undecoded bytes
 
     Returns:
         Tuple of (stdout, stderr, return_code)
@@ -74,57 +641,59 @@ async def run_aerospace_command(
     Raises:
         AeroSpaceError: If command fails and check is True
     """
-    cmd = ["aerospace", *args]
-    if json_output:
-        cmd.append("--json")
-
+    _check_daemon()
+    cmd = _build_cmd(args, json_output)
+    loop = asyncio.get_running_loop()
+    gate: AbstractAsyncContextManager[None] = (
+        _command_gate().shared() if _is_mutating(args) else nullcontext()
+    )
     try:
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await proc.communicate()
-        stdout_str = stdout.decode("utf-8").strip()
-        stderr_str = stderr.decode("utf-8").strip()
-
-        if check and proc.returncode != 0:
-            # Check for common error conditions
-            if "aerospace" not in os.environ.get("PATH", "") and proc.returncode == 127:
-                raise AeroSpaceError(
-                    ERROR_AEROSPACE_NOT_RUNNING,
-                    "AeroSpace CLI not found. Please ensure AeroSpace is installed and in PATH.",
-                    {
-                        "suggestion": "Install AeroSpace from https://nikitabobko.github.io/AeroSpace/"
-                    },
-                )
-            raise AeroSpaceError(
-                ERROR_COMMAND_FAILED,
-                f"AeroSpace command failed: {stderr_str or stdout_str}",
-                {"command": cmd, "return_code": proc.returncode, "stderr": stderr_str},
-            )
+        async with gate:
+            with _tracking_mutations(args):
+                result = await _socket_request(cmd) if _socket_enabled() else None
+                if result is None:
+                    try:
+                        result = await loop.run_in_executor(_EXECUTOR, _worker.run, cmd[1:])
+                    except _WorkerUnavailable:
+                        result = await loop.run_in_executor(_EXECUTOR, _run_one_shot, cmd)
+    except EOFError as e:
+        raise _worker_died_error(cmd, e)
+    except FileNotFoundError:
+        raise _not_running_error()
+    return _check_result(cmd, *result, check=check, raw=raw)
 
-        return stdout_str, stderr_str, proc.returncode or 0
 
-    except FileNotFoundError:
-        raise AeroSpaceError(
-            ERROR_AEROSPACE_NOT_RUNNING,
-            "AeroSpace daemon is not running. Please start it first.",
-            {"suggestion": "Run 'aerospace start' or launch AeroSpace from Applications"},
-        )
+@overload
+def run_aerospace_command_sync(
+    *args: str,
+    json_output: bool = ...,
+    check: bool = ...,
+    raw: Literal[False] = ...,
+) -> tuple[str, str, int]: ...
+
+
+@overload
+def run_aerospace_command_sync(
+    *args: str,
+    json_output: bool = ...,
+    check: bool = ...,
+    raw: Literal[True],
+) -> tuple[bytes, bytes, int]: ...
 
 
 def run_aerospace_command_sync(
     *args: str,
     json_output: bool = False,
     check: bool = True,
-) -> tuple[str, str, int]:
+    raw: bool = False,
+) -> tuple[Any, Any, int]:
     """Run an aerospace CLI command synchronously.
 
     Args:
         *args: Command arguments to pass to aerospace CLI
         json_output: If True, add --json flag
         check: If True, raise exception on non-zero exit code
+        raw: If True, return stdout and stderr as undecoded bytes
 
     Returns:
         Tuple of (stdout, stderr, return_code)
@@ -132,44 +701,117 @@ def run_aerospace_command_sync(
     Raises:
         AeroSpaceError: If command fails and check is True
     """
-    cmd = ["aerospace", *args]
-    if json_output:
-        cmd.append("--json")
-
+    _check_daemon()
+    cmd = _build_cmd(args, json_output)
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-        )
-        stdout_str = result.stdout.strip()
-        stderr_str = result.stderr.strip()
-
-        if check and result.returncode != 0:
-            if result.returncode == 127:
-                raise AeroSpaceError(
-                    ERROR_AEROSPACE_NOT_RUNNING,
-                    "AeroSpace CLI not found. Please ensure AeroSpace is installed and in PATH.",
-                    {
-                        "suggestion": "Install AeroSpace from https://nikitabobko.github.io/AeroSpace/"
-                    },
-                )
-            raise AeroSpaceError(
-                ERROR_COMMAND_FAILED,
-                f"AeroSpace command failed: {stderr_str or stdout_str}",
-                {"command": cmd, "return_code": result.returncode, "stderr": stderr_str},
-            )
+        with _tracking_mutations(args):
+            try:
+                result = _worker.run(cmd[1:])
+            except _WorkerUnavailable:
+                result = _run_one_shot(cmd)
+    except EOFError as e:
+        raise _worker_died_error(cmd, e)
+    except FileNotFoundError:
+        raise _not_running_error()
+    return _check_result(cmd, *result, check=check, raw=raw)
+
+
+async def run_aerospace_commands(*commands: Sequence[str]) -> None:
+    """Run a sequence of aerospace commands as one unit.
 
-        return stdout_str, stderr_str, result.returncode
+    The aerospace CLI runs one command per invocation, so each command is
+    still its own process. The whole sequence is handed to the worker at
+    once, which costs a single thread hop; with the daemon socket enabled the
+    commands are sent over it in turn instead. Mutating commands issued
+    through run_aerospace_command while the sequence runs wait until it is
+    done, so they cannot change focus between its steps. Queries are not held
+    back, and neither is anything run through run_aerospace_command_sync.
 
+    Args:
+        *commands: Argument lists for the aerospace CLI, in order
+
+    Raises:
+        AeroSpaceError: If a command fails; the commands after it are not run
+    """
+    _check_daemon()
+    loop = asyncio.get_running_loop()
+    try:
+        async with _command_gate().exclusive():
+            with _tracking_mutations(*commands):
+                results = await _socket_sequence(commands) if _socket_enabled() else None
+                if results is None:
+                    results = await loop.run_in_executor(_EXECUTOR, _worker.run_sequence, commands)
+    except EOFError as e:
+        raise _worker_died_error(["aerospace"], e)
     except FileNotFoundError:
-        raise AeroSpaceError(
-            ERROR_AEROSPACE_NOT_RUNNING,
-            "AeroSpace daemon is not running. Please start it first.",
-            {"suggestion": "Run 'aerospace start' or launch AeroSpace from Applications"},
-        )
+        raise _not_running_error()
+    for args, result in zip(commands, results, strict=False):
+        _check_result(["aerospace", *args], *result, check=True, raw=False)
 
 
+# Per-request memo for read-only queries. While a request scope is active the
+# variable holds a dict keyed by (function name, args, kwargs, state generation)
+# whose values are the tasks computing each result; outside of one it is None
+# and queries always hit aerospace.
+_request_cache: ContextVar[dict[Any, asyncio.Future[Any]] | None] = ContextVar(
+    "_request_cache", default=None
+)
+
+_F = TypeVar("_F", bound=Callable[..., Awaitable[Any]])
+
+
+def memoize_per_request(func: _F) -> _F:
+    """Cache a query's result for the duration of the current request scope.
+
+    Concurrent callers of the same query share one in-flight task, and the key
+    includes the state generation, so a query issued after a mutating command
+    runs again instead of returning what was seen before the change. Failed
+    queries are dropped from the cache so that a later call retries them.
+    Every caller receives the same result object, so callers must not modify
+    it.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        cache = _request_cache.get()
+        if cache is None:
+            return await func(*args, **kwargs)
+        key = (func.__name__, args, tuple(sorted(kwargs.items())), _state_generation)
+        task = cache.get(key)
+        if task is None:
+            task = cache[key] = asyncio.ensure_future(func(*args, **kwargs))
+        try:
+            # Shielded so that one cancelled caller doesn't cancel the others
+            return await asyncio.shield(task)
+        except BaseException:
+            if task.done() and cache.get(key) is task:
+                del cache[key]
+            raise
+
+    return wrapper  # type: ignore[return-value]
+
+
+def request_scope(func: _F) -> _F:
+    """Run a coroutine function with a fresh per-request query cache.
+
+    Repeated calls to the list/focused queries inside the scope are served from
+    the cache. Nested scopes share the outermost cache.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if _request_cache.get() is not None:
+            return await func(*args, **kwargs)
+        token = _request_cache.set({})
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _request_cache.reset(token)
+
+    return wrapper  # type: ignore[return-value]
+
+
+@memoize_per_request
 async def list_windows(
     workspace: str | None = None,
     monitor: str | None = None,
@@ -193,14 +835,15 @@ async def list_windows(
     if monitor:
         args.extend(["--monitor", monitor])
 
-    stdout, _, _ = await run_aerospace_command(*args, json_output=True)
+    stdout, _, _ = await run_aerospace_command(*args, json_output=True, raw=True)
     if not stdout:
         return []
 
-    result: list[dict[str, Any]] = json.loads(stdout)
+    result: list[dict[str, Any]] = orjson.loads(stdout)
     return result
 
 
+@memoize_per_request
 async def list_workspaces(
     all_workspaces: bool = True,
     monitor: str | None = None,
@@ -228,14 +871,15 @@ async def list_workspaces(
     if focused:
         args.append("--focused")
 
-    stdout, _, _ = await run_aerospace_command(*args, json_output=True)
+    stdout, _, _ = await run_aerospace_command(*args, json_output=True, raw=True)
     if not stdout:
         return []
 
-    result: list[dict[str, Any]] = json.loads(stdout)
+    result: list[dict[str, Any]] = orjson.loads(stdout)
     return result
 
 
+@memoize_per_request
 async def list_monitors() -> list[dict[str, Any]]:
     """List all monitors.
 
@@ -243,14 +887,15 @@ async def list_monitors() -> list[dict[str, Any]]:
         List of monitor dictionaries
     """
     args = ["list-monitors"]
-    stdout, _, _ = await run_aerospace_command(*args, json_output=True)
+    stdout, _, _ = await run_aerospace_command(*args, json_output=True, raw=True)
     if not stdout:
         return []
 
-    result: list[dict[str, Any]] = json.loads(stdout)
+    result: list[dict[str, Any]] = orjson.loads(stdout)
     return result
 
 
+@memoize_per_request
 async def get_focused_window() -> dict[str, Any] | None:
     """Get the currently focused window.
 
@@ -258,14 +903,15 @@ async def get_focused_window() -> dict[str, Any] | None:
         Window dictionary or None if no window is focused
     """
     args = ["list-windows", "--focused"]
-    stdout, _, code = await run_aerospace_command(*args, json_output=True, check=False)
+    stdout, _, code = await run_aerospace_command(*args, json_output=True, check=False, raw=True)
     if code != 0 or not stdout:
         return None
 
-    windows = json.loads(stdout)
+    windows = orjson.loads(stdout)
     return windows[0] if windows else None
 
 
+@memoize_per_request
 async def get_focused_workspace() -> dict[str, Any] | None:
     """Get the currently focused workspace.
 
@@ -273,14 +919,15 @@ async def get_focused_workspace() -> dict[str, Any] | None:
         Workspace dictionary or None
     """
     args = ["list-workspaces", "--focused"]
-    stdout, _, code = await run_aerospace_command(*args, json_output=True, check=False)
+    stdout, _, code = await run_aerospace_command(*args, json_output=True, check=False, raw=True)
     if code != 0 or not stdout:
         return None
 
-    workspaces = json.loads(stdout)
+    workspaces = orjson.loads(stdout)
     return workspaces[0] if workspaces else None
 
 
+@memoize_per_request
 async def get_focused_monitor() -> dict[str, Any] | None:
     """Get the currently focused monitor.
 
@@ -288,11 +935,11 @@ async def get_focused_monitor() -> dict[str, Any] | None:
         Monitor dictionary or None
     """
     args = ["list-monitors", "--focused"]
-    stdout, _, code = await run_aerospace_command(*args, json_output=True, check=False)
+    stdout, _, code = await run_aerospace_command(*args, json_output=True, check=False, raw=True)
     if code != 0 or not stdout:
         return None
 
-    monitors = json.loads(stdout)
+    monitors = orjson.loads(stdout)
     return monitors[0] if monitors else None
 
 
@@ -308,8 +955,8 @@ def validate_direction(direction: str) -> None:
     if direction not in VALID_DIRECTIONS:
         raise AeroSpaceError(
             ERROR_INVALID_DIRECTION,
-            f"Invalid direction '{direction}'. Must be one of: {', '.join(sorted(VALID_DIRECTIONS))}",
-            {"provided": direction, "valid_options": sorted(VALID_DIRECTIONS)},
+            f"Invalid direction '{direction}'. Must be one of: {_VALID_DIRECTIONS_STR}",
+            {"provided": direction, "valid_options": list(_VALID_DIRECTIONS_SORTED)},
         )
 
 
@@ -325,22 +972,42 @@ def validate_layout(layout: str) -> None:
     if layout not in VALID_LAYOUTS:
         raise AeroSpaceError(
             ERROR_INVALID_LAYOUT,
-            f"Invalid layout '{layout}'. Must be one of: {', '.join(sorted(VALID_LAYOUTS))}",
-            {"provided": layout, "valid_options": sorted(VALID_LAYOUTS)},
+            f"Invalid layout '{layout}'. Must be one of: {_VALID_LAYOUTS_STR}",
+            {"provided": layout, "valid_options": list(_VALID_LAYOUTS_SORTED)},
         )
 
 
+@memoize_per_request
+async def _windows_by_id() -> dict[int, dict[str, Any]]:
+    """Index all windows by window ID."""
+    windows = await list_windows(all_windows=True)
+    return {w["window-id"]: w for w in windows if "window-id" in w}
+
+
 async def get_window_by_id(window_id: int) -> dict[str, Any] | None:
     """Get a window by its ID.
 
+    The aerospace CLI cannot filter list-windows by window ID, so this looks
+    the ID up in an index of all windows, which is shared by every lookup in
+    the same request scope.
+
     Args:
         window_id: Window ID to find
 
     Returns:
         Window dictionary or None if not found
     """
-    windows = await list_windows(all_windows=True)
-    for window in windows:
-        if window.get("window-id") == window_id:
-            return window
-    return None
+    return (await _windows_by_id()).get(window_id)
+
+
+async def list_window_ids() -> list[int]:
+    """List the IDs of all windows.
+
+    The IDs come from the same index as get_window_by_id, so reporting the
+    available windows after a failed lookup needs no further query within a
+    request scope.
+
+    Returns:
+        Window IDs in list-windows order
+    """
+    return list(await _windows_by_id())
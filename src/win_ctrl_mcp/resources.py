@@ -3,6 +3,8 @@
 This module provides read-only resources for querying AeroSpace state.
 """
 
+import asyncio
+from collections import Counter, defaultdict
 from typing import Any
 
 from win_ctrl_mcp.aerospace import (
@@ -15,11 +17,20 @@ from win_ctrl_mcp.aerospace import (
     list_monitors,
     list_windows,
     list_workspaces,
-    run_aerospace_command,
+    request_scope,
 )
 from win_ctrl_mcp.tools.display import get_display_by_id, get_display_info
 
 
+def _workspaces_by_monitor(workspaces: list[dict[str, Any]]) -> dict[Any, list[Any]]:
+    """Group workspace names by the monitor they are on."""
+    by_monitor: defaultdict[Any, list[Any]] = defaultdict(list)
+    for ws in workspaces:
+        by_monitor[ws.get("monitor")].append(ws.get("workspace"))
+    return by_monitor
+
+
+@request_scope
 async def get_windows_resource() -> dict[str, Any]:
     """Get list of all windows with metadata.
 
@@ -30,23 +41,27 @@ async def get_windows_resource() -> dict[str, Any]:
     """
     windows = await list_windows(all_windows=True)
 
-    result = []
-    for w in windows:
-        # Get focused status
-        focused_window = await get_focused_window()
-        is_focused = focused_window and focused_window.get("window-id") == w.get("window-id")
+    # The focused window is the same for every entry, so query it once
+    focused_window = await get_focused_window()
+    focused_id = focused_window.get("window-id") if focused_window else None
 
-        result.append(
+    result: list[dict[str, Any]] = []
+    append = result.append
+    for w in windows:
+        # Bind the lookup once per row; this loop runs for every window
+        get = w.get
+        window_id = get("window-id")
+        append(
             {
-                "window_id": w.get("window-id"),
-                "app_name": w.get("app-name"),
-                "app_bundle_id": w.get("app-bundle-id", ""),
-                "title": w.get("title", ""),
-                "workspace": w.get("workspace"),
-                "monitor": w.get("monitor", ""),
-                "is_focused": is_focused,
-                "is_fullscreen": w.get("is-fullscreen", False),
-                "is_floating": w.get("is-floating", False),
+                "window_id": window_id,
+                "app_name": get("app-name"),
+                "app_bundle_id": get("app-bundle-id", ""),
+                "title": get("title", ""),
+                "workspace": get("workspace"),
+                "monitor": get("monitor", ""),
+                "is_focused": focused_id is not None and window_id == focused_id,
+                "is_fullscreen": get("is-fullscreen", False),
+                "is_floating": get("is-floating", False),
             }
         )
 
@@ -56,6 +71,7 @@ async def get_windows_resource() -> dict[str, Any]:
     }
 
 
+@request_scope
 async def get_window_resource(window_id: int) -> dict[str, Any]:
     """Get details for a specific window.
 
@@ -71,33 +87,34 @@ async def get_window_resource(window_id: int) -> dict[str, Any]:
         AeroSpaceError: If window not found
     """
     windows = await list_windows(all_windows=True)
+    by_id = {w.get("window-id"): w for w in windows}
 
-    for w in windows:
-        if w.get("window-id") == window_id:
-            focused_window = await get_focused_window()
-            is_focused = focused_window and focused_window.get("window-id") == window_id
+    w = by_id.get(window_id)
+    if w is None:
+        raise AeroSpaceError(
+            ERROR_WINDOW_NOT_FOUND,
+            f"Window with ID {window_id} not found",
+            {"requested_window_id": window_id, "available_windows": list(by_id)},
+        )
 
-            return {
-                "window_id": window_id,
-                "app_name": w.get("app-name"),
-                "app_bundle_id": w.get("app-bundle-id", ""),
-                "title": w.get("title", ""),
-                "workspace": w.get("workspace"),
-                "monitor": w.get("monitor", ""),
-                "is_focused": is_focused,
-                "is_fullscreen": w.get("is-fullscreen", False),
-                "is_floating": w.get("is-floating", False),
-                "parent_container": w.get("parent-container", ""),
-            }
+    focused_window = await get_focused_window()
+    is_focused = focused_window and focused_window.get("window-id") == window_id
 
-    available_ids = [w.get("window-id") for w in windows]
-    raise AeroSpaceError(
-        ERROR_WINDOW_NOT_FOUND,
-        f"Window with ID {window_id} not found",
-        {"requested_window_id": window_id, "available_windows": available_ids},
-    )
+    return {
+        "window_id": window_id,
+        "app_name": w.get("app-name"),
+        "app_bundle_id": w.get("app-bundle-id", ""),
+        "title": w.get("title", ""),
+        "workspace": w.get("workspace"),
+        "monitor": w.get("monitor", ""),
+        "is_focused": is_focused,
+        "is_fullscreen": w.get("is-fullscreen", False),
+        "is_floating": w.get("is-floating", False),
+        "parent_container": w.get("parent-container", ""),
+    }
 
 
+@request_scope
 async def get_workspaces_resource() -> dict[str, Any]:
     """Get list of all workspaces.
 
@@ -106,28 +123,27 @@ async def get_workspaces_resource() -> dict[str, Any]:
     Returns:
         Dictionary with workspaces list and count
     """
-    workspaces = await list_workspaces(all_workspaces=True)
+    # Fetch windows, focus and visibility once, concurrently, rather than per workspace
+    workspaces, focused_ws, visible_workspaces, windows = await asyncio.gather(
+        list_workspaces(all_workspaces=True),
+        get_focused_workspace(),
+        list_workspaces(visible=True),
+        list_windows(all_windows=True),
+    )
+    window_counts = Counter(w.get("workspace") for w in windows)
+    focused_name = focused_ws.get("workspace") if focused_ws else None
+    visible_names = {v.get("workspace") for v in visible_workspaces}
 
     result = []
     for ws in workspaces:
-        # Get window count for workspace
-        windows = await list_windows(workspace=ws.get("workspace"))
-
-        # Check if focused
-        focused_ws = await get_focused_workspace()
-        is_focused = focused_ws and focused_ws.get("workspace") == ws.get("workspace")
-
-        # Check if visible
-        visible_workspaces = await list_workspaces(visible=True)
-        is_visible = any(v.get("workspace") == ws.get("workspace") for v in visible_workspaces)
-
+        name = ws.get("workspace")
         result.append(
             {
-                "name": ws.get("workspace"),
+                "name": name,
                 "monitor": ws.get("monitor"),
-                "is_focused": is_focused,
-                "is_visible": is_visible,
-                "window_count": len(windows),
+                "is_focused": focused_name is not None and name == focused_name,
+                "is_visible": name in visible_names,
+                "window_count": window_counts[name],
             }
         )
 
@@ -137,6 +153,7 @@ async def get_workspaces_resource() -> dict[str, Any]:
     }
 
 
+@request_scope
 async def get_workspace_resource(workspace_name: str) -> dict[str, Any]:
     """Get details for a specific workspace.
 
@@ -192,6 +209,7 @@ async def get_workspace_resource(workspace_name: str) -> dict[str, Any]:
     )
 
 
+@request_scope
 async def get_monitors_resource() -> dict[str, Any]:
     """Get list of all monitors.
 
@@ -200,31 +218,27 @@ async def get_monitors_resource() -> dict[str, Any]:
     Returns:
         Dictionary with monitors list and count
     """
-    monitors = await list_monitors()
-    workspaces = await list_workspaces(all_workspaces=True)
+    monitors, workspaces, visible_workspaces = await asyncio.gather(
+        list_monitors(),
+        list_workspaces(all_workspaces=True),
+        list_workspaces(visible=True),
+    )
+
+    # Group workspaces by monitor once instead of filtering per monitor
+    workspaces_by_monitor = _workspaces_by_monitor(workspaces)
+    visible_by_monitor: dict[Any, Any] = {}
+    for vws in visible_workspaces:
+        visible_by_monitor.setdefault(vws.get("monitor"), vws.get("workspace"))
 
     result = []
     for i, m in enumerate(monitors):
-        # Get workspaces for this monitor
-        monitor_workspaces = [
-            ws.get("workspace") for ws in workspaces if ws.get("monitor") == m.get("name")
-        ]
-
-        # Get focused workspace for this monitor
-        focused_ws = None
-        visible_workspaces = await list_workspaces(visible=True)
-        for vws in visible_workspaces:
-            if vws.get("monitor") == m.get("name"):
-                focused_ws = vws.get("workspace")
-                break
-
         result.append(
             {
                 "id": i + 1,
                 "name": m.get("name"),
                 "is_main": i == 0,  # First monitor is typically main
-                "workspaces": monitor_workspaces,
-                "focused_workspace": focused_ws,
+                "workspaces": workspaces_by_monitor.get(m.get("name"), []),
+                "focused_workspace": visible_by_monitor.get(m.get("name")),
             }
         )
 
@@ -234,6 +248,7 @@ async def get_monitors_resource() -> dict[str, Any]:
     }
 
 
+@request_scope
 async def get_tree_resource() -> dict[str, Any]:
     """Get the current window tree structure.
 
@@ -242,13 +257,7 @@ async def get_tree_resource() -> dict[str, Any]:
     Returns:
         Dictionary with tree structure
     """
-    # Use debug-windows to get tree structure
-    stdout, _, _ = await run_aerospace_command("debug-windows", check=False)
-
-    # Parse the tree output
-    # The debug-windows command outputs a text representation
-    # For simplicity, we'll return the focused workspace tree
-
+    # Build the tree for the focused workspace from its window list
     focused_ws = await get_focused_workspace()
     ws_name = focused_ws.get("workspace") if focused_ws else "1"
 
@@ -276,6 +285,7 @@ async def get_tree_resource() -> dict[str, Any]:
     return {"tree": tree}
 
 
+@request_scope
 async def get_focused_resource() -> dict[str, Any]:
     """Get currently focused window, workspace, and monitor info.
 
@@ -284,9 +294,10 @@ async def get_focused_resource() -> dict[str, Any]:
     Returns:
         Dictionary with focused state
     """
-    window = await get_focused_window()
-    workspace = await get_focused_workspace()
-    monitor = await get_focused_monitor()
+    window, workspace, monitor = await asyncio.gather(
+        get_focused_window(), get_focused_workspace(), get_focused_monitor()
+    )
+    window_count = len(await list_windows(workspace=workspace.get("workspace"))) if workspace else 0
 
     return {
         "window": {
@@ -298,9 +309,7 @@ async def get_focused_resource() -> dict[str, Any]:
         else None,
         "workspace": {
             "name": workspace.get("workspace") if workspace else None,
-            "window_count": len(await list_windows(workspace=workspace.get("workspace")))
-            if workspace
-            else 0,
+            "window_count": window_count,
         }
         if workspace
         else None,
@@ -313,6 +322,7 @@ async def get_focused_resource() -> dict[str, Any]:
     }
 
 
+@request_scope
 async def get_displays_resource() -> dict[str, Any]:
     """Get complete display configuration information.
 
@@ -326,11 +336,9 @@ async def get_displays_resource() -> dict[str, Any]:
     # Add workspace information to each display
     workspaces = await list_workspaces(all_workspaces=True)
 
+    workspaces_by_monitor = _workspaces_by_monitor(workspaces)
     for display in display_info.get("displays", []):
-        display_name = display.get("name")
-        display["workspaces"] = [
-            ws.get("workspace") for ws in workspaces if ws.get("monitor") == display_name
-        ]
+        display["workspaces"] = workspaces_by_monitor.get(display.get("name"), [])
 
     # Add category description
     from win_ctrl_mcp.tools.display import _calculate_display_category
@@ -341,6 +349,7 @@ async def get_displays_resource() -> dict[str, Any]:
     return display_info
 
 
+@request_scope
 async def get_display_resource(display_id: int) -> dict[str, Any]:
     """Get individual display details.
 
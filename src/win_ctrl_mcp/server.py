@@ -3,11 +3,18 @@
 This module defines the FastMCP server with all tools, resources, and prompts.
 """
 
-from typing import Annotated, Any
-
+import asyncio
+import functools
+import inspect
+import time
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from dataclasses import dataclass, field
+from typing import Annotated, Any, TypeVar, cast
+
+import orjson
 from fastmcp import FastMCP
 
-from win_ctrl_mcp.aerospace import AeroSpaceError
+from win_ctrl_mcp.aerospace import AeroSpaceError, state_generation
 from win_ctrl_mcp.prompts import PROMPTS
 from win_ctrl_mcp.resources import (
     get_display_resource,
@@ -70,320 +77,374 @@ def handle_error(e: Exception) -> dict[str, Any]:
     }
 
 
-# =============================================================================
-# Window Management Tools
-# =============================================================================
-
-
-@mcp.tool()
-async def tool_focus_window(
-    direction: Annotated[str | None, "Direction to focus: left, right, up, down"] = None,
-    window_id: Annotated[int | None, "Specific window ID to focus"] = None,
-) -> dict[str, Any]:
-    """Focus a window by direction or window ID.
-
-    Either direction or window_id must be provided, but not both.
-    """
-    try:
-        return await focus_window(direction=direction, window_id=window_id)
-    except Exception as e:
-        return handle_error(e)
-
-
-@mcp.tool()
-async def tool_focus_monitor(
-    target: Annotated[str, "Monitor identifier: direction, name, or pattern"],
-) -> dict[str, Any]:
-    """Focus a specific monitor by name, pattern, or direction."""
-    try:
-        return await focus_monitor(target=target)
-    except Exception as e:
-        return handle_error(e)
-
-
-@mcp.tool()
-async def tool_focus_workspace(
-    workspace: Annotated[str, "Workspace name or number (e.g., '1', 'dev', 'mail')"],
-) -> dict[str, Any]:
-    """Switch to a specific workspace by name or number."""
-    try:
-        return await focus_workspace(workspace=workspace)
-    except Exception as e:
-        return handle_error(e)
-
-
-@mcp.tool()
-async def tool_move_window(
-    target_type: Annotated[str, "Type of move: workspace, monitor, or direction"],
-    target: Annotated[str, "Target destination (workspace name, monitor name, or direction)"],
-    window_id: Annotated[int | None, "Specific window ID to move (defaults to focused)"] = None,
-) -> dict[str, Any]:
-    """Move the focused window to a different workspace, monitor, or position."""
-    try:
-        return await move_window(target_type=target_type, target=target, window_id=window_id)
-    except Exception as e:
-        return handle_error(e)
+ToolFunc = TypeVar("ToolFunc", bound=Callable[..., Awaitable[dict[str, Any]]])
 
 
-@mcp.tool()
-async def tool_resize_window(
-    dimension: Annotated[str, "Dimension to resize: smart, width, height"],
-    amount: Annotated[str, "Resize amount with sign: +50, -50, +10%, -10%"],
-) -> dict[str, Any]:
-    """Resize the focused window."""
-    try:
-        return await resize_window(dimension=dimension, amount=amount)
-    except Exception as e:
-        return handle_error(e)
+def mcp_tool_safe(func: ToolFunc) -> ToolFunc:
+    """Wrap an async tool function so that it reports errors as dicts.
 
+    Exceptions raised by the tool are converted with handle_error, so tool
+    implementations don't each need their own try/except.
 
-@mcp.tool()
-async def tool_close_window(
-    window_id: Annotated[int | None, "Specific window ID to close (defaults to focused)"] = None,
-) -> dict[str, Any]:
-    """Close the focused window or a specific window by ID."""
-    try:
-        return await close_window(window_id=window_id)
-    except Exception as e:
-        return handle_error(e)
-
-
-@mcp.tool()
-async def tool_fullscreen_toggle(
-    window_id: Annotated[int | None, "Specific window ID (defaults to focused)"] = None,
-) -> dict[str, Any]:
-    """Toggle fullscreen mode for the focused window.
+    Args:
+        func: Tool coroutine function
 
-    Uses AeroSpace's native fullscreen, not macOS native fullscreen.
+    Returns:
+        The wrapped function
     """
-    try:
-        return await fullscreen_toggle(window_id=window_id)
-    except Exception as e:
-        return handle_error(e)
 
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            return handle_error(e)
 
-@mcp.tool()
-async def tool_minimize_window(
-    window_id: Annotated[int | None, "Specific window ID (defaults to focused)"] = None,
-) -> dict[str, Any]:
-    """Minimize the focused window or a specific window."""
-    try:
-        return await minimize_window(window_id=window_id)
-    except Exception as e:
-        return handle_error(e)
+    return cast(ToolFunc, wrapper)
 
 
 # =============================================================================
-# Layout Management Tools
+# Resource Caching
 # =============================================================================
 
+# Serialized resource bodies are reused for this many seconds so that bursts of
+# polling share one round of aerospace queries. Entries are also discarded as
+# soon as a command that may change aerospace state runs.
+RESOURCE_CACHE_TTL = 0.25
 
-@mcp.tool()
-async def tool_set_layout(
-    layout: Annotated[
-        str,
-        "Layout mode: tiles, accordion, h_tiles, v_tiles, h_accordion, v_accordion, floating, tiling",
-    ],
-) -> dict[str, Any]:
-    """Change the layout mode for the focused window's container."""
-    try:
-        return await set_layout(layout=layout)
-    except Exception as e:
-        return handle_error(e)
-
-
-@mcp.tool()
-async def tool_split_window(
-    orientation: Annotated[str, "Split orientation: horizontal or vertical"],
-) -> dict[str, Any]:
-    """Split the current container to prepare for a new window."""
-    try:
-        return await split_window(orientation=orientation)
-    except Exception as e:
-        return handle_error(e)
-
-
-@mcp.tool()
-async def tool_flatten_workspace(
-    workspace: Annotated[str | None, "Workspace to flatten (defaults to current)"] = None,
-) -> dict[str, Any]:
-    """Flatten the workspace tree, removing nested containers."""
-    try:
-        return await flatten_workspace(workspace=workspace)
-    except Exception as e:
-        return handle_error(e)
-
-
-@mcp.tool()
-async def tool_balance_sizes() -> dict[str, Any]:
-    """Balance window sizes in the current workspace."""
-    try:
-        return await balance_sizes()
-    except Exception as e:
-        return handle_error(e)
 
+class _AsyncTTLCache:
+    """Short-lived cache of serialized resource bodies.
 
-# =============================================================================
-# Capture Tools
-# =============================================================================
-
+    Keys include client-supplied template parameters such as window IDs, so
+    nothing is kept past its usefulness: every insert drops expired entries
+    and entries from an older state generation, and a key's lock is removed
+    once no caller holds or waits for it.
+    """
 
-@mcp.tool()
-async def tool_capture_window(
-    window_id: Annotated[int | None, "Specific window ID to capture (defaults to focused)"] = None,
-    output_path: Annotated[str | None, "Path to save the screenshot (defaults to temp)"] = None,
-    format: Annotated[str, "Image format: png, jpg, pdf"] = "png",  # noqa: A002
-) -> dict[str, Any]:
-    """Capture a screenshot of the currently focused window."""
-    try:
-        return await capture_window(window_id=window_id, output_path=output_path, format=format)
-    except Exception as e:
-        return handle_error(e)
-
-
-@mcp.tool()
-async def tool_capture_workspace(
-    workspace: Annotated[str | None, "Workspace name to capture (defaults to focused)"] = None,
-    output_path: Annotated[str | None, "Path to save the screenshot (defaults to temp)"] = None,
-    format: Annotated[str, "Image format: png, jpg, pdf"] = "png",  # noqa: A002
-) -> dict[str, Any]:
-    """Capture a screenshot of the currently focused workspace (and monitor)."""
-    try:
-        return await capture_workspace(workspace=workspace, output_path=output_path, format=format)
-    except Exception as e:
-        return handle_error(e)
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._entries: dict[Hashable, tuple[float, int, str]] = {}
+        self._locks: dict[Hashable, asyncio.Lock] = {}
+        self._lock_users: dict[Hashable, int] = {}
+
+    async def get_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[str]]) -> str:
+        """Return the cached value for key, computing it if missing or stale.
+
+        Concurrent callers for the same key wait for a single computation.
+
+        Args:
+            key: Cache key
+            compute: Coroutine function producing the value
+
+        Returns:
+            The cached or freshly computed value
+        """
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        self._lock_users[key] = self._lock_users.get(key, 0) + 1
+        try:
+            async with lock:
+                generation = state_generation()
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] > time.monotonic() and entry[1] == generation:
+                    return entry[2]
+                value = await compute()
+                self._evict(generation)
+                self._entries[key] = (time.monotonic() + self.ttl, generation, value)
+                return value
+        finally:
+            self._lock_users[key] -= 1
+            if not self._lock_users[key]:
+                del self._lock_users[key]
+                del self._locks[key]
+
+    def _evict(self, generation: int) -> None:
+        """Drop entries that have expired or predate the given state generation."""
+        now = time.monotonic()
+        self._entries = {
+            key: entry
+            for key, entry in self._entries.items()
+            if entry[0] > now and entry[1] == generation
+        }
+
+    def clear(self) -> None:
+        """Drop all cached values."""
+        self._entries.clear()
+
+
+_resource_cache = _AsyncTTLCache(RESOURCE_CACHE_TTL)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a resource body as indented JSON."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _cached_resource(
+    func: Callable[..., Awaitable[str]],
+) -> Callable[..., Awaitable[str]]:
+    """Serve a resource function's result from the resource cache."""
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> str:
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        return await _resource_cache.get_or_compute(key, lambda: func(*args, **kwargs))
+
+    return wrapper
 
 
 # =============================================================================
-# Display Information Tools
+# Tools
 # =============================================================================
 
 
-@mcp.tool()
-async def tool_get_display_info() -> dict[str, Any]:
-    """Get detailed information about all connected displays.
+@dataclass(frozen=True, slots=True)
+class _ToolSpec:
+    """Registration data for one MCP tool.
 
-    Returns resolution, scale factor, size, position, and PPI for each display.
+    Attributes:
+        name: Tool name exposed over MCP
+        func: Tool implementation
+        description: Tool description shown to clients
+        params: Description of each parameter of func, by name
     """
-    try:
-        return await get_display_info()
-    except Exception as e:
-        return handle_error(e)
-
 
-@mcp.tool()
-async def tool_get_display_category() -> dict[str, Any]:
-    """Get simplified display configuration category with recommended strategy.
-
-    Categories: small_single, medium_single, large_single, dual_display, triple_plus.
-    """
-    try:
-        return await get_display_category()
-    except Exception as e:
-        return handle_error(e)
-
-
-# =============================================================================
-# Smart Focus Tools
-# =============================================================================
+    name: str
+    func: Callable[..., Awaitable[dict[str, Any]]]
+    description: str
+    params: Mapping[str, str] = field(default_factory=dict)
+
+
+_TOOLS: tuple[_ToolSpec, ...] = (
+    # Window Management Tools
+    _ToolSpec(
+        "tool_focus_window",
+        focus_window,
+        "Focus a window by direction or window ID.\n\n"
+        "Either direction or window_id must be provided, but not both.",
+        {
+            "direction": "Direction to focus: left, right, up, down",
+            "window_id": "Specific window ID to focus",
+        },
+    ),
+    _ToolSpec(
+        "tool_focus_monitor",
+        focus_monitor,
+        "Focus a specific monitor by name, pattern, or direction.",
+        {
+            "target": "Monitor identifier: direction, name, or pattern",
+        },
+    ),
+    _ToolSpec(
+        "tool_focus_workspace",
+        focus_workspace,
+        "Switch to a specific workspace by name or number.",
+        {
+            "workspace": "Workspace name or number (e.g., '1', 'dev', 'mail')",
+        },
+    ),
+    _ToolSpec(
+        "tool_move_window",
+        move_window,
+        "Move the focused window to a different workspace, monitor, or position.",
+        {
+            "target_type": "Type of move: workspace, monitor, or direction",
+            "target": "Target destination (workspace name, monitor name, or direction)",
+            "window_id": "Specific window ID to move (defaults to focused)",
+        },
+    ),
+    _ToolSpec(
+        "tool_resize_window",
+        resize_window,
+        "Resize the focused window.",
+        {
+            "dimension": "Dimension to resize: smart, width, height",
+            "amount": "Resize amount with sign: +50, -50, +10%, -10%",
+        },
+    ),
+    _ToolSpec(
+        "tool_close_window",
+        close_window,
+        "Close the focused window or a specific window by ID.",
+        {
+            "window_id": "Specific window ID to close (defaults to focused)",
+        },
+    ),
+    _ToolSpec(
+        "tool_fullscreen_toggle",
+        fullscreen_toggle,
+        "Toggle fullscreen mode for the focused window.\n\n"
+        "Uses AeroSpace's native fullscreen, not macOS native fullscreen.",
+        {
+            "window_id": "Specific window ID (defaults to focused)",
+        },
+    ),
+    _ToolSpec(
+        "tool_minimize_window",
+        minimize_window,
+        "Minimize the focused window or a specific window.",
+        {
+            "window_id": "Specific window ID (defaults to focused)",
+        },
+    ),
+    # Layout Management Tools
+    _ToolSpec(
+        "tool_set_layout",
+        set_layout,
+        "Change the layout mode for the focused window's container.",
+        {
+            "layout": "Layout mode: tiles, accordion, h_tiles, v_tiles, h_accordion, v_accordion, floating, tiling",
+        },
+    ),
+    _ToolSpec(
+        "tool_split_window",
+        split_window,
+        "Split the current container to prepare for a new window.",
+        {
+            "orientation": "Split orientation: horizontal or vertical",
+        },
+    ),
+    _ToolSpec(
+        "tool_flatten_workspace",
+        flatten_workspace,
+        "Flatten the workspace tree, removing nested containers.",
+        {
+            "workspace": "Workspace to flatten (defaults to current)",
+        },
+    ),
+    _ToolSpec(
+        "tool_balance_sizes",
+        balance_sizes,
+        "Balance window sizes in the current workspace.",
+    ),
+    # Capture Tools
+    _ToolSpec(
+        "tool_capture_window",
+        capture_window,
+        "Capture a screenshot of the currently focused window.",
+        {
+            "window_id": "Specific window ID to capture (defaults to focused)",
+            "output_path": "Path to save the screenshot (defaults to temp)",
+            "format": "Image format: png, jpg, pdf",
+        },
+    ),
+    _ToolSpec(
+        "tool_capture_workspace",
+        capture_workspace,
+        "Capture a screenshot of the currently focused workspace (and monitor).",
+        {
+            "workspace": "Workspace name to capture (defaults to focused)",
+            "output_path": "Path to save the screenshot (defaults to temp)",
+            "format": "Image format: png, jpg, pdf",
+        },
+    ),
+    # Display Information Tools
+    _ToolSpec(
+        "tool_get_display_info",
+        get_display_info,
+        "Get detailed information about all connected displays.\n\n"
+        "Returns resolution, scale factor, size, position, and PPI for each display.",
+    ),
+    _ToolSpec(
+        "tool_get_display_category",
+        get_display_category,
+        "Get simplified display configuration category with recommended strategy.\n\n"
+        "Categories: small_single, medium_single, large_single, dual_display, triple_plus.",
+    ),
+    # Smart Focus Tools
+    _ToolSpec(
+        "tool_apply_focus_preset",
+        apply_focus_preset,
+        "Apply a predefined or saved focus layout based on display category.",
+        {
+            "preset": "Preset name: auto, small_single_focus, medium_split, large_centered, dual_monitor_focus, triple_monitor_focus, or saved preset name",
+            "focus_window_id": "Window to focus (defaults to currently focused)",
+            "reference_apps": "Apps to keep visible as reference",
+            "hide_communication": "Move communication apps to separate workspace",
+        },
+    ),
+    _ToolSpec(
+        "tool_save_focus_preset",
+        save_focus_preset,
+        "Save the current window arrangement as a named focus preset.",
+        {
+            "name": "Name for the preset",
+            "description": "Human-readable description",
+        },
+    ),
+    _ToolSpec(
+        "tool_load_focus_preset",
+        load_focus_preset,
+        "Load and apply a previously saved focus preset.",
+        {
+            "name": "Name of the preset to load",
+            "adapt_to_displays": "Adapt preset if display config changed",
+        },
+    ),
+    _ToolSpec(
+        "tool_resize_window_optimal",
+        resize_window_optimal,
+        "Resize a window to optimal dimensions based on its content type.",
+        {
+            "window_id": "Window to resize (defaults to focused)",
+            "content_type": "Content type: code_editor, browser, terminal, document, communication",
+            "max_width_percent": "Maximum width as percentage of screen",
+            "min_width_percent": "Minimum width as percentage of screen",
+        },
+    ),
+    _ToolSpec(
+        "tool_set_window_zone",
+        set_window_zone,
+        "Position a window in a named zone rather than explicit coordinates.",
+        {
+            "window_id": "Window to position (defaults to focused)",
+            "zone": "Zone name: center_focus, left_reference, right_reference, top_reference, bottom_reference, floating_pip",
+            "monitor": "Monitor: primary, secondary, or monitor ID",
+        },
+    ),
+    _ToolSpec(
+        "tool_move_app_category_to_monitor",
+        move_app_category_to_monitor,
+        "Move all windows belonging to an application category to a specific monitor.",
+        {
+            "category": "App category: communication, development, reference, media",
+            "monitor": "Target monitor: primary, secondary, tertiary, or monitor ID",
+            "layout": "Layout for moved windows: tiled, accordion, stacked",
+        },
+    ),
+)
 
 
-@mcp.tool()
-async def tool_apply_focus_preset(
-    preset: Annotated[
-        str,
-        "Preset name: auto, small_single_focus, medium_split, large_centered, dual_monitor_focus, triple_monitor_focus, or saved preset name",
-    ] = "auto",
-    focus_window_id: Annotated[
-        int | None, "Window to focus (defaults to currently focused)"
-    ] = None,
-    reference_apps: Annotated[list[str] | None, "Apps to keep visible as reference"] = None,
-    hide_communication: Annotated[bool, "Move communication apps to separate workspace"] = False,
-) -> dict[str, Any]:
-    """Apply a predefined or saved focus layout based on display category."""
-    try:
-        return await apply_focus_preset(
-            preset=preset,
-            focus_window_id=focus_window_id,
-            reference_apps=reference_apps,
-            hide_communication=hide_communication,
-        )
-    except Exception as e:
-        return handle_error(e)
-
-
-@mcp.tool()
-async def tool_save_focus_preset(
-    name: Annotated[str, "Name for the preset"],
-    description: Annotated[str | None, "Human-readable description"] = None,
-) -> dict[str, Any]:
-    """Save the current window arrangement as a named focus preset."""
-    try:
-        return await save_focus_preset(name=name, description=description)
-    except Exception as e:
-        return handle_error(e)
+def _register_tool(spec: _ToolSpec) -> None:
+    """Register a tool, describing its parameters from the spec.
 
+    The parameter types and defaults come from the implementation's own
+    signature; the spec adds the name, description and parameter
+    descriptions that make up the tool schema.
 
-@mcp.tool()
-async def tool_load_focus_preset(
-    name: Annotated[str, "Name of the preset to load"],
-    adapt_to_displays: Annotated[bool, "Adapt preset if display config changed"] = True,
-) -> dict[str, Any]:
-    """Load and apply a previously saved focus preset."""
-    try:
-        return await load_focus_preset(name=name, adapt_to_displays=adapt_to_displays)
-    except Exception as e:
-        return handle_error(e)
-
-
-@mcp.tool()
-async def tool_resize_window_optimal(
-    window_id: Annotated[int | None, "Window to resize (defaults to focused)"] = None,
-    content_type: Annotated[
-        str, "Content type: code_editor, browser, terminal, document, communication"
-    ] = "code_editor",
-    max_width_percent: Annotated[int, "Maximum width as percentage of screen"] = 80,
-    min_width_percent: Annotated[int, "Minimum width as percentage of screen"] = 40,
-) -> dict[str, Any]:
-    """Resize a window to optimal dimensions based on its content type."""
-    try:
-        return await resize_window_optimal(
-            window_id=window_id,
-            content_type=content_type,
-            max_width_percent=max_width_percent,
-            min_width_percent=min_width_percent,
-        )
-    except Exception as e:
-        return handle_error(e)
-
-
-@mcp.tool()
-async def tool_set_window_zone(
-    window_id: Annotated[int | None, "Window to position (defaults to focused)"] = None,
-    zone: Annotated[
-        str,
-        "Zone name: center_focus, left_reference, right_reference, top_reference, bottom_reference, floating_pip",
-    ] = "center_focus",
-    monitor: Annotated[str, "Monitor: primary, secondary, or monitor ID"] = "primary",
-) -> dict[str, Any]:
-    """Position a window in a named zone rather than explicit coordinates."""
-    try:
-        return await set_window_zone(window_id=window_id, zone=zone, monitor=monitor)
-    except Exception as e:
-        return handle_error(e)
-
-
-@mcp.tool()
-async def tool_move_app_category_to_monitor(
-    category: Annotated[str, "App category: communication, development, reference, media"],
-    monitor: Annotated[str, "Target monitor: primary, secondary, tertiary, or monitor ID"],
-    layout: Annotated[str, "Layout for moved windows: tiled, accordion, stacked"] = "tiled",
-) -> dict[str, Any]:
-    """Move all windows belonging to an application category to a specific monitor."""
-    try:
-        return await move_app_category_to_monitor(category=category, monitor=monitor, layout=layout)
-    except Exception as e:
-        return handle_error(e)
+    Args:
+        spec: Tool to register
+    """
+    signature = inspect.signature(spec.func)
+    parameters = [
+        param.replace(annotation=Annotated[param.annotation, spec.params[param.name]])
+        if param.name in spec.params
+        else param
+        for param in signature.parameters.values()
+    ]
+    tool: Any = mcp_tool_safe(spec.func)
+    tool.__name__ = tool.__qualname__ = spec.name
+    tool.__doc__ = spec.description
+    tool.__signature__ = signature.replace(parameters=parameters)
+    tool.__annotations__ = {param.name: param.annotation for param in parameters}
+    tool.__annotations__["return"] = signature.return_annotation
+    mcp.tool()(tool)
+
+
+for _spec in _TOOLS:
+    _register_tool(_spec)
 
 
 # =============================================================================
@@ -392,93 +453,84 @@ async def tool_move_app_category_to_monitor(
 
 
 @mcp.resource("aerospace://windows")
+@_cached_resource
 async def resource_windows() -> str:
     """List of all windows with metadata."""
-    import json
-
     result = await get_windows_resource()
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.resource("aerospace://windows/{window_id}")
+@_cached_resource
 async def resource_window(window_id: int) -> str:
     """Details for a specific window."""
-    import json
-
     try:
         result = await get_window_resource(window_id)
-        return json.dumps(result, indent=2)
+        return _dumps(result)
     except AeroSpaceError as e:
-        return json.dumps(e.to_dict(), indent=2)
+        return _dumps(e.to_dict())
 
 
 @mcp.resource("aerospace://workspaces")
+@_cached_resource
 async def resource_workspaces() -> str:
     """List of all workspaces."""
-    import json
-
     result = await get_workspaces_resource()
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.resource("aerospace://workspaces/{workspace_name}")
+@_cached_resource
 async def resource_workspace(workspace_name: str) -> str:
     """Details for a specific workspace."""
-    import json
-
     try:
         result = await get_workspace_resource(workspace_name)
-        return json.dumps(result, indent=2)
+        return _dumps(result)
     except AeroSpaceError as e:
-        return json.dumps(e.to_dict(), indent=2)
+        return _dumps(e.to_dict())
 
 
 @mcp.resource("aerospace://monitors")
+@_cached_resource
 async def resource_monitors() -> str:
     """List of all monitors."""
-    import json
-
     result = await get_monitors_resource()
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.resource("aerospace://tree")
+@_cached_resource
 async def resource_tree() -> str:
     """Current window tree structure."""
-    import json
-
     result = await get_tree_resource()
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.resource("aerospace://focused")
+@_cached_resource
 async def resource_focused() -> str:
     """Currently focused window, workspace, and monitor info."""
-    import json
-
     result = await get_focused_resource()
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.resource("aerospace://displays")
+@_cached_resource
 async def resource_displays() -> str:
     """Complete display configuration."""
-    import json
-
     result = await get_displays_resource()
-    return json.dumps(result, indent=2)
+    return _dumps(result)
 
 
 @mcp.resource("aerospace://displays/{display_id}")
+@_cached_resource
 async def resource_display(display_id: int) -> str:
     """Individual display details."""
-    import json
-
     try:
         result = await get_display_resource(display_id)
-        return json.dumps(result, indent=2)
+        return _dumps(result)
     except AeroSpaceError as e:
-        return json.dumps(e.to_dict(), indent=2)
+        return _dumps(e.to_dict())
 
 
 # =============================================================================
@@ -489,7 +541,7 @@ async def resource_display(display_id: int) -> str:
 @mcp.prompt()
 def prompt_organize_windows(strategy: str | None = None) -> str:
     """Help me organize my current windows efficiently based on the apps I have open."""
-    template: str = str(PROMPTS["organize_windows"]["template"])
+    template = PROMPTS["organize_windows"].template
     if strategy:
         template = f"Strategy requested: {strategy}\n\n{template}"
     return template
@@ -504,7 +556,7 @@ def prompt_smart_focus(
     undo: bool = False,
 ) -> str:
     """Display-aware focus mode that adapts window arrangement based on display configuration."""
-    template: str = str(PROMPTS["smart_focus"]["template"])
+    template = PROMPTS["smart_focus"].template
 
     args: list[str] = []
     if strategy:
@@ -530,7 +582,7 @@ def prompt_presentation_layout(
     notes_app: str | None = None,
 ) -> str:
     """Arrange my windows for a presentation or screen sharing session."""
-    template: str = str(PROMPTS["presentation_layout"]["template"])
+    template = PROMPTS["presentation_layout"].template
 
     args: list[str] = []
     if presenter_app:
@@ -550,7 +602,7 @@ def prompt_debug_app_gui(
     baseline: str | None = None,
 ) -> str:
     """Debug the GUI of an app under development."""
-    template: str = str(PROMPTS["debug_app_gui"]["template"])
+    template = PROMPTS["debug_app_gui"].template
 
     args: list[str] = []
     if app_name:
@@ -18,9 +18,34 @@ from win_ctrl_mcp.aerospace import (
     get_focused_workspace,
     get_window_by_id,
     list_monitors,
+    list_window_ids,
     list_windows,
+    request_scope,
 )
 
+# File extension and screencapture format flag for each accepted image format
+_FORMAT_EXTENSIONS = {"png": ".png", "jpg": ".jpg", "jpeg": ".jpg", "pdf": ".pdf"}
+_FORMAT_FLAGS = {"png": "png", "jpg": "jpg", "jpeg": "jpg", "pdf": "pdf"}
+_VALID_FORMATS = frozenset(_FORMAT_FLAGS)
+_VALID_FORMATS_SORTED = tuple(sorted(_VALID_FORMATS))
+
+# Default location for captures without an explicit output path
+_TMPDIR = tempfile.gettempdir()
+
+
+def _ensure_parent_dir(path: str) -> None:
+    """Create the directory containing path if needed.
+
+    The directory is checked on every capture rather than remembered, since
+    it may have been removed since the last capture into it.
+
+    Args:
+        path: File path about to be written
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
 
 async def _run_screencapture(
     *args: str,
@@ -55,40 +80,7 @@ async def _run_screencapture(
         )
 
 
-def _get_format_extension(format_type: str) -> str:
-    """Get file extension for format type.
-
-    Args:
-        format_type: Image format (png, jpg, pdf)
-
-    Returns:
-        File extension including dot
-    """
-    return {
-        "png": ".png",
-        "jpg": ".jpg",
-        "jpeg": ".jpg",
-        "pdf": ".pdf",
-    }.get(format_type.lower(), ".png")
-
-
-def _get_format_flag(format_type: str) -> str:
-    """Get screencapture format flag.
-
-    Args:
-        format_type: Image format
-
-    Returns:
-        Format flag for screencapture
-    """
-    return {
-        "png": "png",
-        "jpg": "jpg",
-        "jpeg": "jpg",
-        "pdf": "pdf",
-    }.get(format_type.lower(), "png")
-
-
+@request_scope
 async def capture_window(
     window_id: int | None = None,
     output_path: str | None = None,
@@ -105,20 +97,19 @@ async def capture_window(
         Result dictionary with capture info
     """
     # Validate format
-    valid_formats = {"png", "jpg", "jpeg", "pdf"}
-    if format.lower() not in valid_formats:
+    fmt = format.lower()
+    if fmt not in _VALID_FORMATS:
         raise AeroSpaceError(
             "INVALID_PARAMETERS",
             f"Invalid format '{format}'. Must be: png, jpg, or pdf",
-            {"provided": format, "valid_options": list(valid_formats)},
+            {"provided": format, "valid_options": list(_VALID_FORMATS_SORTED)},
         )
 
     # Get the window to capture
     if window_id is not None:
         window = await get_window_by_id(window_id)
         if window is None:
-            available = await list_windows(all_windows=True)
-            available_ids = [w.get("window-id") for w in available]
+            available_ids = await list_window_ids()
             raise AeroSpaceError(
                 ERROR_WINDOW_NOT_FOUND,
                 f"Window with ID {window_id} not found",
@@ -136,24 +127,20 @@ async def capture_window(
 
     # Determine output path
     if output_path is None:
-        ext = _get_format_extension(format)
-        output_path = os.path.join(
-            tempfile.gettempdir(),
-            f"window_capture_{window_id}{ext}",
-        )
-
-    # Ensure directory exists
-    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        ext = _FORMAT_EXTENSIONS[fmt]
+        output_path = os.path.join(_TMPDIR, f"window_capture_{window_id}{ext}")
+    else:
+        # The temp directory always exists; only user-supplied paths may need one
+        _ensure_parent_dir(output_path)
 
     # Capture the window
     # screencapture -l <window_id> captures a specific window by its CGWindowID
     # Note: AeroSpace window IDs should be CGWindowIDs
-    format_flag = _get_format_flag(format)
     await _run_screencapture(
         "-l",
         str(window_id),
         "-t",
-        format_flag,
+        _FORMAT_FLAGS[fmt],
         "-o",  # No shadow
         output_path=output_path,
     )
@@ -168,7 +155,7 @@ async def capture_window(
             "app_name": window.get("app-name"),
             "title": window.get("title", ""),
             "file_path": output_path,
-            "format": format.lower(),
+            "format": fmt,
             "dimensions": {
                 "width": None,  # Would require image analysis
                 "height": None,
@@ -177,6 +164,7 @@ async def capture_window(
     }
 
 
+@request_scope
 async def capture_workspace(
     workspace: str | None = None,
     output_path: str | None = None,
@@ -193,12 +181,12 @@ async def capture_workspace(
         Result dictionary with capture info
     """
     # Validate format
-    valid_formats = {"png", "jpg", "jpeg", "pdf"}
-    if format.lower() not in valid_formats:
+    fmt = format.lower()
+    if fmt not in _VALID_FORMATS:
         raise AeroSpaceError(
             "INVALID_PARAMETERS",
             f"Invalid format '{format}'. Must be: png, jpg, or pdf",
-            {"provided": format, "valid_options": list(valid_formats)},
+            {"provided": format, "valid_options": list(_VALID_FORMATS_SORTED)},
         )
 
     # Get workspace info
@@ -208,12 +196,19 @@ async def capture_workspace(
 
         await run_aerospace_command("workspace", workspace)
 
-    current_workspace = await get_focused_workspace()
-    ws_name = workspace or (current_workspace.get("workspace") if current_workspace else "unknown")
-
-    # Get monitor info
-    monitor = await get_focused_monitor()
-    monitors = await list_monitors()
+    # Query monitors and windows concurrently. The window query needs the
+    # workspace name, so without an explicit workspace it waits for focus.
+    if workspace:
+        ws_name = workspace
+        monitor, monitors, windows = await asyncio.gather(
+            get_focused_monitor(), list_monitors(), list_windows(workspace=ws_name)
+        )
+    else:
+        current_workspace, monitor, monitors = await asyncio.gather(
+            get_focused_workspace(), get_focused_monitor(), list_monitors()
+        )
+        ws_name = current_workspace.get("workspace") if current_workspace else "unknown"
+        windows = await list_windows(workspace=ws_name)
 
     # Find the monitor ID (display index for screencapture)
     display_index = 1  # Default to main display
@@ -223,30 +218,24 @@ async def capture_workspace(
                 display_index = i
                 break
 
-    # Get windows in workspace
-    windows = await list_windows(workspace=ws_name)
     window_info = [
         {"window_id": w.get("window-id"), "app_name": w.get("app-name")} for w in windows
     ]
 
     # Determine output path
     if output_path is None:
-        ext = _get_format_extension(format)
-        output_path = os.path.join(
-            tempfile.gettempdir(),
-            f"workspace_capture_{ws_name}{ext}",
-        )
-
-    # Ensure directory exists
-    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        ext = _FORMAT_EXTENSIONS[fmt]
+        output_path = os.path.join(_TMPDIR, f"workspace_capture_{ws_name}{ext}")
+    else:
+        # The temp directory always exists; only user-supplied paths may need one
+        _ensure_parent_dir(output_path)
 
     # Capture the display
-    format_flag = _get_format_flag(format)
     await _run_screencapture(
         "-D",
         str(display_index),
         "-t",
-        format_flag,
+        _FORMAT_FLAGS[fmt],
         output_path=output_path,
     )
 
@@ -256,7 +245,7 @@ async def capture_workspace(
             "workspace": ws_name,
             "monitor": monitor.get("name") if monitor else "Unknown",
             "file_path": output_path,
-            "format": format.lower(),
+            "format": fmt,
             "dimensions": {
                 "width": None,  # Would require image analysis
                 "height": None,
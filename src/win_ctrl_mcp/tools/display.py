@@ -5,23 +5,205 @@ Uses system_profiler and AeroSpace monitor info.
 """
 
 import asyncio
-import json
-import re
+import hashlib
+import os
+import tempfile
+import time
+from bisect import bisect_right
+from collections.abc import Mapping
+from dataclasses import dataclass
+from math import hypot
+from types import MappingProxyType
 from typing import Any
 
-from win_ctrl_mcp.aerospace import list_monitors, list_workspaces
+import orjson
+
+from win_ctrl_mcp.aerospace import (
+    AeroSpaceError,
+    list_monitors,
+    list_windows,
+    list_workspaces,
+    memoize_per_request,
+)
+
+# Display topology changes on a human timescale, so display info is reused for
+# this many seconds instead of re-running system_profiler for every caller.
+DISPLAY_INFO_TTL = 2.0
+
+_display_info_cache: tuple[float, tuple["_DisplayRecord", ...]] | None = None
+_display_info_lock: asyncio.Lock | None = None
+
+# Setting this environment variable (to anything but "0") keeps parsed
+# system_profiler output on disk, so new server processes can skip the slow
+# query while the display topology is unchanged.
+DISPLAY_DISK_CACHE_ENV = "WIN_CTRL_MCP_DISPLAY_CACHE"
+
+# Seconds a display info file on disk is trusted
+DISPLAY_DISK_CACHE_MAX_AGE = 60.0
+
+
+def _round1(value: float) -> float:
+    """Round a non-negative value to one decimal place, halves rounding up."""
+    return int(value * 10.0 + 0.5) / 10.0
+
+
+def _parse_wxh(text: str) -> tuple[int, int] | None:
+    """Parse the leading "W x H" of a system_profiler resolution string.
+
+    Args:
+        text: Resolution string like "2560 x 1600 @ 60 Hz" or "5120 x 2880"
+
+    Returns:
+        Tuple of (width, height), or None if the string has no resolution
+    """
+    width, sep, rest = text.partition("x")
+    if not sep:
+        return None
+    try:
+        return int(width), int(rest.split(None, 1)[0])
+    except (ValueError, IndexError):
+        return None
+
+
+def _disk_cache_path() -> str:
+    """Return the path of the display info file kept across processes."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "win-ctrl-mcp", "displays.json")
+
+
+async def _display_fingerprint() -> str | None:
+    """Fingerprint the connected displays.
+
+    Combines the IORegistry display connections with AeroSpace's monitor list.
+    On some Macs the IORegistry entries stay the same when a display is
+    plugged in or removed, but the monitor list always changes.
+
+    Returns:
+        Hash of the display connections, or None if either source is unavailable
+    """
+    try:
+        ioreg_output, monitors = await asyncio.gather(_ioreg_display_connections(), list_monitors())
+    except AeroSpaceError:
+        return None
+    if ioreg_output is None:
+        return None
+    digest = hashlib.sha256(ioreg_output)
+    digest.update(orjson.dumps(monitors, option=orjson.OPT_SORT_KEYS))
+    return digest.hexdigest()
+
+
+async def _ioreg_display_connections() -> bytes | None:
+    """List the display connections in the IORegistry.
+
+    Returns:
+        Raw ioreg output, or None if ioreg is unavailable
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "ioreg",
+            "-l",
+            "-d",
+            "1",
+            "-c",
+            "IODisplayConnect",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except OSError:
+        return None
+    stdout, _ = await proc.communicate()
+    if proc.returncode != 0:
+        return None
+    return stdout
+
+
+def _read_disk_cache(fingerprint: str) -> list[dict[str, Any]] | None:
+    """Load system display info saved for the given fingerprint.
+
+    Args:
+        fingerprint: Current display fingerprint
+
+    Returns:
+        Saved display list, or None if it is missing, stale or mismatched
+    """
+    path = _disk_cache_path()
+    try:
+        if time.time() - os.path.getmtime(path) >= DISPLAY_DISK_CACHE_MAX_AGE:
+            return None
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+    if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+        return None
+    displays = data.get("displays")
+    return displays if isinstance(displays, list) else None
+
+
+def _write_disk_cache(fingerprint: str, displays: list[dict[str, Any]]) -> None:
+    """Save system display info for other processes, ignoring write errors.
+
+    Args:
+        fingerprint: Display fingerprint the info belongs to
+        displays: Parsed system display info
+    """
+    path = _disk_cache_path()
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        # Write to a temporary file first so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps({"fingerprint": fingerprint, "displays": displays}))
+            os.replace(tmp_path, path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
 
 
 async def _get_system_display_info() -> list[dict[str, Any]]:
     """Get display information from system_profiler.
 
+    With the disk cache enabled (see DISPLAY_DISK_CACHE_ENV), output saved by
+    any process within DISPLAY_DISK_CACHE_MAX_AGE seconds is reused as long as
+    the display fingerprint still matches.
+
     Returns:
         List of display information dictionaries
     """
+    if os.environ.get(DISPLAY_DISK_CACHE_ENV, "") in ("", "0"):
+        return await _query_system_profiler()
+
+    fingerprint = await _display_fingerprint()
+    if fingerprint is None:
+        return await _query_system_profiler()
+
+    displays = _read_disk_cache(fingerprint)
+    if displays is None:
+        displays = await _query_system_profiler()
+        if displays:
+            _write_disk_cache(fingerprint, displays)
+    return displays
+
+
+async def _query_system_profiler() -> list[dict[str, Any]]:
+    """Run system_profiler and parse its display information.
+
+    Returns:
+        List of display information dictionaries
+    """
+    # The mini detail level skips identifying details (serial numbers and the
+    # like) that are slow to gather and unused here; resolutions are kept.
     proc = await asyncio.create_subprocess_exec(
         "system_profiler",
-        "SPDisplaysDataType",
         "-json",
+        "-detailLevel",
+        "mini",
+        "SPDisplaysDataType",
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE,
     )
@@ -31,49 +213,94 @@ async def _get_system_display_info() -> list[dict[str, Any]]:
         return []
 
     try:
-        data = json.loads(stdout.decode("utf-8"))
+        data = orjson.loads(stdout)
         displays = []
 
         # Navigate the system_profiler JSON structure
         for item in data.get("SPDisplaysDataType", []):
             for display in item.get("spdisplays_ndrvs", []):
+                # Parse resolution string like "2560 x 1600 @ 60 Hz"
+                resolution_str = display.get("_spdisplays_resolution", "")
+                width, height = _parse_wxh(resolution_str) or (0, 0)
                 display_info = {
                     "name": display.get("_name", "Unknown"),
-                    "resolution_str": display.get("_spdisplays_resolution", ""),
+                    "resolution_str": resolution_str,
                     "is_builtin": display.get("spdisplays_builtin") == "spdisplays_yes",
                     "is_main": display.get("spdisplays_main") == "spdisplays_yes",
+                    "resolution": {"width": width, "height": height},
                 }
 
-                # Parse resolution string like "2560 x 1600 @ 60 Hz"
-                res_match = re.match(
-                    r"(\d+)\s*x\s*(\d+)",
-                    display_info["resolution_str"],
-                )
-                if res_match:
-                    display_info["resolution"] = {
-                        "width": int(res_match.group(1)),
-                        "height": int(res_match.group(2)),
-                    }
-                else:
-                    display_info["resolution"] = {"width": 0, "height": 0}
-
                 # Get pixels info for scale factor calculation
-                pixels = display.get("_spdisplays_pixels", "")
-                pixels_match = re.match(r"(\d+)\s*x\s*(\d+)", pixels)
-                if pixels_match:
-                    display_info["native_resolution"] = {
-                        "width": int(pixels_match.group(1)),
-                        "height": int(pixels_match.group(2)),
-                    }
+                native = _parse_wxh(display.get("_spdisplays_pixels", ""))
+                if native:
+                    display_info["native_resolution"] = {"width": native[0], "height": native[1]}
 
                 displays.append(display_info)
 
         return displays
 
-    except (json.JSONDecodeError, KeyError):
+    except (orjson.JSONDecodeError, KeyError):
         return []
 
 
+# (category, description) results of _calculate_display_category
+_CATEGORY_NONE = ("unknown", "No displays detected")
+_CATEGORY_DUAL = ("dual_display", "Two monitors: focus on primary, reference on secondary")
+_CATEGORY_TRIPLE = (
+    "triple_plus",
+    "Three or more monitors: focus=primary, reference=secondary, communication=tertiary",
+)
+
+# Single-display categories by diagonal size, split at 15" and 27"
+_SIZE_THRESHOLDS_INCHES = (15, 27)
+_SINGLE_BY_SIZE = (
+    ("small_single", 'Small single display (<15"): fullscreen focus, workspaces for others'),
+    ("medium_single", 'Medium single display (15-24"): 70/30 split with sidebar'),
+    ("large_single", 'Large single display (27"+): centered focus with flanking reference'),
+)
+
+# Fallback by pixel count, split at 1280x810 and 2560x1440
+_MEDIUM_PX = 1280 * 810
+_LARGE_PX = 2560 * 1440
+_PIXEL_THRESHOLDS = (_MEDIUM_PX, _LARGE_PX)
+_SINGLE_BY_PIXELS = (
+    ("small_single", "Small single display: fullscreen focus, workspaces for others"),
+    ("medium_single", "Medium single display: 70/30 split with sidebar"),
+    ("large_single", "Large single display: centered focus with flanking reference"),
+)
+_SIZE_NAMES = ("small", "medium", "large")
+
+# Diagonal inches per horizontal pixel, assuming a 16:10 aspect ratio at the
+# 220 PPI of retina panels or the 110 PPI of typical external displays
+_DIAGONAL_PER_WIDTH = hypot(1.0, 0.625)
+_DIAGONAL_PER_PX_RETINA = _DIAGONAL_PER_WIDTH / 220
+_DIAGONAL_PER_PX_EXTERNAL = _DIAGONAL_PER_WIDTH / 110
+
+# Shared stand-in for a missing resolution
+_EMPTY_RESOLUTION: Mapping[str, int] = MappingProxyType({})
+
+# Recommended window strategy for each display category
+_STRATEGIES: Mapping[str, str] = MappingProxyType(
+    {
+        "small_single": "fullscreen_focus",
+        "medium_single": "split_sidebar",
+        "large_single": "centered_focus",
+        "dual_display": "primary_focus_secondary_reference",
+        "triple_plus": "dedicated_monitors",
+    }
+)
+
+
+def _resolution_of(display: Mapping[str, Any]) -> Mapping[str, int]:
+    """Return a display's effective resolution, falling back to its raw one."""
+    return display.get("effective_resolution") or display.get("resolution") or _EMPTY_RESOLUTION
+
+
+def _pixels(resolution: Mapping[str, int]) -> int:
+    """Return the pixel count of a resolution mapping."""
+    return resolution.get("width", 0) * resolution.get("height", 0)
+
+
 def _calculate_display_category(
     displays: list[dict[str, Any]],
 ) -> tuple[str, str]:
@@ -88,52 +315,28 @@ def _calculate_display_category(
     num_displays = len(displays)
 
     if num_displays == 0:
-        return "unknown", "No displays detected"
+        return _CATEGORY_NONE
 
     if num_displays >= 3:
-        return (
-            "triple_plus",
-            "Three or more monitors: focus=primary, reference=secondary, communication=tertiary",
-        )
+        return _CATEGORY_TRIPLE
 
     if num_displays == 2:
-        return "dual_display", "Two monitors: focus on primary, reference on secondary"
+        return _CATEGORY_DUAL
 
     # Single display - categorize by size
     display = displays[0]
-    resolution = display.get("effective_resolution") or display.get("resolution", {})
-    width = resolution.get("width", 0)
-    height = resolution.get("height", 0)
-    total_pixels = width * height
 
-    # Calculate diagonal in inches if we have size info
+    # Use the diagonal in inches if we have size info
     size_inches = display.get("size_inches", 0)
-
-    # Heuristics for display size category
     if size_inches > 0:
-        if size_inches >= 27:
-            return (
-                "large_single",
-                'Large single display (27"+): centered focus with flanking reference',
-            )
-        elif size_inches >= 15:
-            return "medium_single", 'Medium single display (15-24"): 70/30 split with sidebar'
-        else:
-            return (
-                "small_single",
-                'Small single display (<15"): fullscreen focus, workspaces for others',
-            )
-    else:
-        # Fallback to resolution-based detection
-        if total_pixels >= 3686400:  # >= 2560x1440
-            return "large_single", "Large single display: centered focus with flanking reference"
-        elif total_pixels >= 1036800:  # >= 1280x810
-            return "medium_single", "Medium single display: 70/30 split with sidebar"
-        else:
-            return "small_single", "Small single display: fullscreen focus, workspaces for others"
+        return _SINGLE_BY_SIZE[bisect_right(_SIZE_THRESHOLDS_INCHES, size_inches)]
 
+    # Fallback to resolution-based detection
+    total_pixels = _pixels(_resolution_of(display))
+    return _SINGLE_BY_PIXELS[bisect_right(_PIXEL_THRESHOLDS, total_pixels)]
 
-def _get_size_category(resolution: dict[str, int]) -> str:
+
+def _get_size_category(resolution: Mapping[str, int]) -> str:
     """Get size category based on resolution.
 
     Args:
@@ -142,95 +345,72 @@ def _get_size_category(resolution: dict[str, int]) -> str:
     Returns:
         Size category: small, medium, or large
     """
-    width = resolution.get("width", 0)
-    height = resolution.get("height", 0)
-    total_pixels = width * height
-
-    if total_pixels >= 3686400:  # >= 2560x1440
-        return "large"
-    elif total_pixels >= 1036800:  # >= 1280x810
-        return "medium"
-    else:
-        return "small"
+    return _SIZE_NAMES[bisect_right(_PIXEL_THRESHOLDS, _pixels(resolution))]
 
 
-async def get_display_info() -> dict[str, Any]:
-    """Get detailed information about all connected displays.
+@dataclass(frozen=True, slots=True)
+class _DisplayRecord:
+    """One display merged from aerospace and system_profiler info.
 
-    Returns:
-        Dictionary with display information
+    Records are kept in the display info cache and converted to dictionaries
+    for each caller by to_dict.
     """
-    # Get AeroSpace monitor info
-    monitors = await list_monitors()
 
-    # Get system display info
-    system_displays = await _get_system_display_info()
-
-    # Merge the information
-    displays = []
-    for i, monitor in enumerate(monitors):
-        display = {
-            "id": i + 1,
-            "name": monitor.get("name", f"Display {i + 1}"),
+    id: int
+    name: str
+    resolution: tuple[int, int]
+    effective_resolution: tuple[int, int]
+    scale_factor: float
+    size_inches: float
+    ppi: int
+    is_primary: bool
+    is_builtin: bool
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the display dictionary returned by the display tools."""
+        width, height = self.resolution
+        effective_width, effective_height = self.effective_resolution
+        return {
+            "id": self.id,
+            "name": self.name,
+            "resolution": {"width": width, "height": height},
+            "is_builtin": self.is_builtin,
+            "is_primary": self.is_primary,
+            "scale_factor": self.scale_factor,
+            "effective_resolution": {"width": effective_width, "height": effective_height},
+            "size_inches": self.size_inches,
+            "ppi": self.ppi,
+            # Position (not available from aerospace, would need AppKit)
+            "position": {"x": 0, "y": 0},
         }
 
-        # Try to match with system display info
-        system_display = None
-        for sd in system_displays:
-            if sd.get("name") in display["name"] or display["name"] in sd.get("name", ""):
-                system_display = sd
-                break
-            # Also check for built-in matching
-            if sd.get("is_builtin") and "built-in" in display["name"].lower():
-                system_display = sd
-                break
-
-        if system_display:
-            display["resolution"] = system_display.get("resolution", {"width": 0, "height": 0})
-            display["is_builtin"] = system_display.get("is_builtin", False)
-            display["is_primary"] = system_display.get("is_main", i == 0)
-
-            # Calculate scale factor
-            native = system_display.get("native_resolution")
-            effective = system_display.get("resolution")
-            if native and effective and effective.get("width"):
-                scale = native.get("width", 0) / effective.get("width", 1)
-                display["scale_factor"] = round(scale, 1)
-                display["effective_resolution"] = effective
-            else:
-                display["scale_factor"] = 1.0
-                display["effective_resolution"] = display["resolution"]
-
-            # Estimate size in inches (rough calculation)
-            # Assume 110 PPI for external, 220 for retina laptop
-            ppi = 220 if display.get("is_builtin") else 110
-            if display["scale_factor"] > 1:
-                ppi = 220  # Retina display
-            width_px = display["resolution"].get("width", 0)
-            if ppi > 0 and width_px > 0:
-                width_inches = width_px / ppi
-                # Assume 16:10 aspect ratio for height estimate
-                height_inches = width_inches * 0.625
-                diagonal = (width_inches**2 + height_inches**2) ** 0.5
-                display["size_inches"] = round(diagonal, 1)
-                display["ppi"] = ppi
-            else:
-                display["size_inches"] = 0
-                display["ppi"] = 0
-        else:
-            # Defaults when we can't get system info
-            display["resolution"] = {"width": 0, "height": 0}
-            display["scale_factor"] = 1.0
-            display["effective_resolution"] = {"width": 0, "height": 0}
-            display["size_inches"] = 0
-            display["is_primary"] = i == 0
-            display["is_builtin"] = False
-            display["ppi"] = 0
 
-        # Position (not available from aerospace, would need AppKit)
-        display["position"] = {"x": 0, "y": 0}
+def clear_display_info_cache() -> None:
+    """Discard cached display info so the next query reads it afresh."""
+    global _display_info_cache, _display_info_lock
+    _display_info_cache = None
+    _display_info_lock = None
+
+
+async def get_display_info() -> dict[str, Any]:
+    """Get detailed information about all connected displays.
+
+    Display records are cached for DISPLAY_INFO_TTL seconds. Each caller
+    receives freshly built dictionaries, so it is free to modify the result.
 
-        displays.append(display)
+    Returns:
+        Dictionary with display information
+    """
+    global _display_info_cache, _display_info_lock
+    if _display_info_lock is None:
+        _display_info_lock = asyncio.Lock()
+    async with _display_info_lock:
+        cached = _display_info_cache
+        if cached is None or time.monotonic() - cached[0] >= DISPLAY_INFO_TTL:
+            cached = (time.monotonic(), await _collect_displays())
+            _display_info_cache = cached
+
+    displays = [record.to_dict() for record in cached[1]]
 
     # Calculate arrangement
     if len(displays) == 1:
@@ -241,11 +421,10 @@ async def get_display_info() -> dict[str, Any]:
         arrangement = "multiple"
 
     # Calculate total effective pixels
-    total_pixels = sum(
-        d.get("effective_resolution", {}).get("width", 0)
-        * d.get("effective_resolution", {}).get("height", 0)
-        for d in displays
-    )
+    total_pixels = 0
+    for record in cached[1]:
+        effective_width, effective_height = record.effective_resolution
+        total_pixels += effective_width * effective_height
 
     # Get category
     category, _ = _calculate_display_category(displays)
@@ -258,12 +437,110 @@ async def get_display_info() -> dict[str, Any]:
     }
 
 
+async def _collect_displays() -> tuple[_DisplayRecord, ...]:
+    """Query aerospace and system_profiler for the connected displays.
+
+    Returns:
+        One record per aerospace monitor, in aerospace order
+    """
+    # AeroSpace monitor info and system display info are independent, so
+    # overlap the aerospace query with the much slower system_profiler run
+    monitors, system_displays = await asyncio.gather(list_monitors(), _get_system_display_info())
+
+    # Index system displays by name; monitors usually match one exactly
+    system_by_name: dict[Any, dict[str, Any]] = {}
+    for sd in system_displays:
+        system_by_name.setdefault(sd.get("name"), sd)
+
+    # Merge the information
+    records = []
+    for i, monitor in enumerate(monitors):
+        name = monitor.get("name", f"Display {i + 1}")
+
+        # Try to match with system display info, falling back to partial names
+        system_display = system_by_name.get(name)
+        if system_display is None:
+            looks_builtin = "built-in" in name.lower()
+            for sd in system_displays:
+                if sd.get("name") in name or name in sd.get("name", ""):
+                    system_display = sd
+                    break
+                # Also check for built-in matching
+                if looks_builtin and sd.get("is_builtin"):
+                    system_display = sd
+                    break
+
+        if not system_display:
+            # Defaults when we can't get system info
+            records.append(
+                _DisplayRecord(
+                    id=i + 1,
+                    name=name,
+                    resolution=(0, 0),
+                    effective_resolution=(0, 0),
+                    scale_factor=1.0,
+                    size_inches=0,
+                    ppi=0,
+                    is_primary=i == 0,
+                    is_builtin=False,
+                )
+            )
+            continue
+
+        resolution_info = system_display.get("resolution") or _EMPTY_RESOLUTION
+        resolution = (resolution_info.get("width", 0), resolution_info.get("height", 0))
+        is_builtin = system_display.get("is_builtin", False)
+
+        # Calculate scale factor
+        native = system_display.get("native_resolution")
+        scale_factor = 1.0
+        if native and resolution[0]:
+            scale_factor = _round1(native.get("width", 0) / resolution[0])
+
+        # Estimate size in inches (rough calculation)
+        # Assume 110 PPI for external, 220 for retina laptop or scaled displays
+        size_inches: float = 0
+        ppi = 0
+        if resolution[0] > 0:
+            if is_builtin or scale_factor > 1:
+                ppi, inches_per_px = 220, _DIAGONAL_PER_PX_RETINA
+            else:
+                ppi, inches_per_px = 110, _DIAGONAL_PER_PX_EXTERNAL
+            size_inches = _round1(resolution[0] * inches_per_px)
+
+        records.append(
+            _DisplayRecord(
+                id=i + 1,
+                name=name,
+                resolution=resolution,
+                effective_resolution=resolution,
+                scale_factor=scale_factor,
+                size_inches=size_inches,
+                ppi=ppi,
+                is_primary=system_display.get("is_main", i == 0),
+                is_builtin=is_builtin,
+            )
+        )
+
+    return tuple(records)
+
+
 async def get_display_category() -> dict[str, Any]:
     """Get simplified display configuration category with recommended strategy.
 
+    Within a request scope the category is computed once, and each caller
+    gets its own copy of it.
+
     Returns:
         Dictionary with category and strategy info
     """
+    category = await _display_category()
+    return {**category, "secondary_sizes": list(category["secondary_sizes"])}
+
+
+@memoize_per_request
+async def _display_category() -> dict[str, Any]:
+    """Compute the display category shared by callers within a request scope."""
     display_info = await get_display_info()
     displays = display_info.get("displays", [])
 
@@ -274,30 +551,21 @@ async def get_display_category() -> dict[str, Any]:
     secondary_sizes = []
 
     if displays:
-        primary_display = next((d for d in displays if d.get("is_primary")), displays[0])
-        primary_size = _get_size_category(
-            primary_display.get("effective_resolution") or primary_display.get("resolution", {})
-        )
-
+        # One pass finds the primary display and sizes every other one
+        primary_display = None
         for d in displays:
-            if not d.get("is_primary"):
-                size = _get_size_category(d.get("effective_resolution") or d.get("resolution", {}))
-                secondary_sizes.append(size)
-
-    # Recommended strategy based on category
-    strategies = {
-        "small_single": "fullscreen_focus",
-        "medium_single": "split_sidebar",
-        "large_single": "centered_focus",
-        "dual_display": "primary_focus_secondary_reference",
-        "triple_plus": "dedicated_monitors",
-    }
+            if d.get("is_primary"):
+                if primary_display is None:
+                    primary_display = d
+            else:
+                secondary_sizes.append(_get_size_category(_resolution_of(d)))
+        primary_size = _get_size_category(_resolution_of(primary_display or displays[0]))
 
     return {
         "category": category,
         "primary_size": primary_size,
         "secondary_sizes": secondary_sizes,
-        "recommended_strategy": strategies.get(category, "fullscreen_focus"),
+        "recommended_strategy": _STRATEGIES.get(category, "fullscreen_focus"),
         "description": description,
     }
 
@@ -311,37 +579,38 @@ async def get_display_by_id(display_id: int) -> dict[str, Any] | None:
     Returns:
         Display dictionary or None if not found
     """
+    # Display IDs number the aerospace monitors, so unknown IDs can be turned
+    # away without running system_profiler
+    monitors = await list_monitors()
+    if not 1 <= display_id <= len(monitors):
+        return None
+
     display_info = await get_display_info()
     displays: list[dict[str, Any]] = display_info.get("displays", [])
 
-    for display in displays:
-        if display.get("id") == display_id:
-            # Add workspace information
-            workspaces = await list_workspaces(all_workspaces=True)
-            display_workspaces = [
-                w.get("workspace") for w in workspaces if w.get("monitor") == display.get("name")
-            ]
-
-            # Find focused workspace on this display
-            focused_workspaces = await list_workspaces(focused=True)
-            focused_ws = None
-            for fw in focused_workspaces:
-                if fw.get("monitor") == display.get("name"):
-                    focused_ws = fw.get("workspace")
-                    break
-
-            display["workspaces"] = display_workspaces
-            display["focused_workspace"] = focused_ws
-            display["size_category"] = _get_size_category(
-                display.get("effective_resolution") or display.get("resolution", {})
-            )
+    display = next((d for d in displays if d.get("id") == display_id), None)
+    if display is None:
+        return None
+
+    # Once the display is known, its workspaces, focus and windows are
+    # independent queries
+    name = display.get("name")
+    workspaces, focused_workspaces, windows = await asyncio.gather(
+        list_workspaces(all_workspaces=True),
+        list_workspaces(focused=True),
+        list_windows(monitor=name),
+    )
 
-            # Count windows on this display
-            from win_ctrl_mcp.aerospace import list_windows
+    # Add workspace information
+    display["workspaces"] = [w.get("workspace") for w in workspaces if w.get("monitor") == name]
 
-            windows = await list_windows(monitor=display.get("name"))
-            display["window_count"] = len(windows)
+    # Find focused workspace on this display
+    display["focused_workspace"] = next(
+        (fw.get("workspace") for fw in focused_workspaces if fw.get("monitor") == name), None
+    )
+    display["size_category"] = _get_size_category(_resolution_of(display))
 
-            return display
+    # Count windows on this display
+    display["window_count"] = len(windows)
 
-    return None
+    return display
@@ -4,11 +4,17 @@ This module provides MCP tools for intelligent window arrangement
 based on display configuration.
 """
 
-import json
+import asyncio
+import functools
+import os
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+import orjson
+
 from win_ctrl_mcp.aerospace import (
     ERROR_NO_WINDOW_FOCUSED,
     ERROR_WINDOW_NOT_FOUND,
@@ -16,14 +22,20 @@ from win_ctrl_mcp.aerospace import (
     get_focused_window,
     get_window_by_id,
     list_monitors,
+    list_window_ids,
     list_windows,
+    request_scope,
     run_aerospace_command,
+    run_aerospace_commands,
 )
 from win_ctrl_mcp.tools.display import get_display_category, get_display_info
 
 # Preset storage directory
 PRESET_DIR = Path.home() / ".config" / "win-ctrl-mcp" / "presets"
 
+# Preset directories already created (or found to exist) by this process
+_created_preset_dirs: set[str] = set()
+
 # App categories for organization
 APP_CATEGORIES: dict[str, list[str]] = {
     "communication": [
@@ -113,6 +125,83 @@ OPTIMAL_DIMENSIONS: dict[str, dict[str, Any]] = {
 }
 
 
+# Preset applied by "auto" for each display category
+_AUTO_PRESETS = MappingProxyType(
+    {
+        "small_single": "small_single_focus",
+        "medium_single": "medium_split",
+        "large_single": "large_centered",
+        "dual_display": "dual_monitor_focus",
+        "triple_plus": "triple_monitor_focus",
+    }
+)
+
+# Presets that check the monitor count before arranging anything
+_MULTI_MONITOR_PRESETS = frozenset({"dual_monitor_focus", "triple_monitor_focus"})
+
+_VALID_CONTENT_TYPES = frozenset(
+    {"code_editor", "browser", "terminal", "document", "communication"}
+)
+_VALID_CONTENT_TYPES_SORTED = tuple(sorted(_VALID_CONTENT_TYPES))
+
+_VALID_ZONES = frozenset(
+    {
+        "center_focus",
+        "left_reference",
+        "right_reference",
+        "top_reference",
+        "bottom_reference",
+        "floating_pip",
+    }
+)
+_VALID_ZONES_SORTED = tuple(sorted(_VALID_ZONES))
+
+# AeroSpace layout for each move_app_category_to_monitor layout option
+_CATEGORY_LAYOUTS = MappingProxyType(
+    {
+        "tiled": "h_tiles",
+        "accordion": "h_accordion",
+        "stacked": "v_accordion",
+    }
+)
+_VALID_CATEGORY_LAYOUTS_SORTED = tuple(sorted(_CATEGORY_LAYOUTS))
+
+# App names per category as sets, for exact matches
+_CATEGORY_APPS: dict[str, frozenset[str]] = {
+    category: frozenset(apps) for category, apps in APP_CATEGORIES.items()
+}
+
+# Lowercased app names per category, and the same as one flat (name, category)
+# sequence in category order, for case-insensitive substring matching
+_CATEGORY_TOKENS: dict[str, tuple[str, ...]] = {
+    category: tuple(app.lower() for app in apps) for category, apps in APP_CATEGORIES.items()
+}
+_APP_TOKENS: tuple[tuple[str, str], ...] = tuple(
+    (token, category) for category, tokens in _CATEGORY_TOKENS.items() for token in tokens
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _match_app_category(app_name: str) -> str | None:
+    """Find the first category with an app name contained in app_name.
+
+    Results are cached, so a given app name is lowercased and scanned only
+    once however many of its windows are categorized.
+    """
+    name = app_name.lower()
+    for token, category in _APP_TOKENS:
+        if token in name:
+            return category
+    return None
+
+
+# Category of every listed app name, resolved like any other name so that an
+# exact match never disagrees with the substring rules
+_APP_TO_CATEGORY: dict[str, str | None] = {
+    app: _match_app_category(app) for apps in APP_CATEGORIES.values() for app in apps
+}
+
+
 def _get_app_category(app_name: str) -> str | None:
     """Get the category for an app.
 
@@ -122,12 +211,121 @@ def _get_app_category(app_name: str) -> str | None:
     Returns:
         Category name or None if not categorized
     """
-    for category, apps in APP_CATEGORIES.items():
-        if app_name in apps or any(app.lower() in app_name.lower() for app in apps):
-            return category
-    return None
+    if app_name in _APP_TO_CATEGORY:
+        return _APP_TO_CATEGORY[app_name]
+    return _match_app_category(app_name)
+
 
+@functools.lru_cache(maxsize=4)
+def _scan_preset_names(directory: str, mtime_ns: int) -> frozenset[str]:  # noqa: ARG001
+    """List the presets saved in a directory.
 
+    The directory's modification time is part of the cache key, so adding,
+    removing or renaming a preset file produces a fresh listing. Filesystems
+    with coarse timestamps can miss a change made in the same tick, so
+    save_focus_preset also clears the cache.
+    """
+    with os.scandir(directory) as entries:
+        return frozenset(
+            entry.name[: -len(".json")]
+            for entry in entries
+            if entry.name.endswith(".json") and entry.is_file()
+        )
+
+
+def _preset_path(name: str) -> str:
+    """Return the file path of a saved preset.
+
+    Preset paths are built as plain strings, which skips constructing and
+    parsing a Path object for every preset operation.
+    """
+    return os.path.join(os.fspath(PRESET_DIR), name + ".json")
+
+
+def _write_preset(name: str, data: bytes) -> None:
+    """Write a preset file, creating the preset directory on first use.
+
+    The directory is only created once per process, but if it has been
+    removed since (cleaned up by the user, say), the write creates it again
+    and retries.
+    """
+    directory = os.fspath(PRESET_DIR)
+    if directory not in _created_preset_dirs:
+        os.makedirs(directory, exist_ok=True)
+        _created_preset_dirs.add(directory)
+    path = _preset_path(name)
+    try:
+        with open(path, "wb") as f:
+            f.write(data)
+    except FileNotFoundError:
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+
+
+def _preset_names() -> frozenset[str]:
+    """Return the names of all saved presets."""
+    try:
+        directory = os.fspath(PRESET_DIR)
+        return _scan_preset_names(directory, os.stat(directory).st_mtime_ns)
+    except FileNotFoundError:
+        return frozenset()
+
+
+async def _resolve_window(window_id: int | None) -> dict[str, Any]:
+    """Get a window by ID, or the focused window when no ID is given.
+
+    Args:
+        window_id: Window ID to look up, or None for the focused window
+
+    Returns:
+        Window dictionary
+
+    Raises:
+        AeroSpaceError: If the window does not exist or no window is focused
+    """
+    if window_id is None:
+        window = await get_focused_window()
+        if window is None:
+            raise AeroSpaceError(
+                ERROR_NO_WINDOW_FOCUSED,
+                "No window is currently focused",
+                {"suggestion": "Focus a window first"},
+            )
+        return window
+
+    window = await get_window_by_id(window_id)
+    if window is None:
+        # The tools run in a request scope, so this reuses the lookup's listing
+        available_ids = await list_window_ids()
+        raise AeroSpaceError(
+            ERROR_WINDOW_NOT_FOUND,
+            f"Window with ID {window_id} not found",
+            {"requested_window_id": window_id, "available_windows": available_ids},
+        )
+    return window
+
+
+async def _run_concurrently(commands: Sequence[Sequence[str]]) -> list[bool]:
+    """Run independent aerospace commands concurrently.
+
+    Args:
+        commands: Argument lists, none depending on another's effect
+
+    Returns:
+        Whether each command succeeded. Commands failing with an AeroSpaceError
+        (usually because their window has closed) count as unsuccessful.
+    """
+    results = await asyncio.gather(
+        *(run_aerospace_command(*args) for args in commands), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, AeroSpaceError):
+            raise result
+    return [not isinstance(result, AeroSpaceError) for result in results]
+
+
+@request_scope
 async def apply_focus_preset(
     preset: str = "auto",
     focus_window_id: int | None = None,
@@ -153,60 +351,51 @@ async def apply_focus_preset(
 
     # Determine which preset to use
     if preset == "auto":
-        preset_map = {
-            "small_single": "small_single_focus",
-            "medium_single": "medium_split",
-            "large_single": "large_centered",
-            "dual_display": "dual_monitor_focus",
-            "triple_plus": "triple_monitor_focus",
-        }
-        preset = preset_map.get(category, "medium_split")
+        preset = _AUTO_PRESETS.get(category, "medium_split")
 
     # Check if it's a saved preset
-    saved_preset_path = PRESET_DIR / f"{preset}.json"
-    if saved_preset_path.exists():
+    if preset in _preset_names():
         return await load_focus_preset(name=preset)
 
     # Get the focus window
-    if focus_window_id is not None:
-        focus_win = await get_window_by_id(focus_window_id)
-        if focus_win is None:
-            available = await list_windows(all_windows=True)
-            available_ids = [w.get("window-id") for w in available]
-            raise AeroSpaceError(
-                ERROR_WINDOW_NOT_FOUND,
-                f"Window with ID {focus_window_id} not found",
-                {"requested_window_id": focus_window_id, "available_windows": available_ids},
-            )
-    else:
-        focus_win = await get_focused_window()
-        if focus_win is None:
-            raise AeroSpaceError(
-                ERROR_NO_WINDOW_FOCUSED,
-                "No window is currently focused",
-                {"suggestion": "Focus a window first"},
-            )
-        focus_window_id = focus_win.get("window-id")
-
-    # Get all windows
-    all_windows = await list_windows(all_windows=True)
-    monitors = await list_monitors()
+    focus_win = await _resolve_window(focus_window_id)
+    focus_window_id = focus_win.get("window-id")
+
+    # Only presets that move other windows need the window list, and only the
+    # multi-monitor presets need the monitors. Fullscreening or resizing the
+    # focus window alone skips both queries and the categorization below.
+    needs_windows = hide_communication or preset == "dual_monitor_focus"
+    needs_monitors = preset in _MULTI_MONITOR_PRESETS
+    all_windows: list[dict[str, Any]] = []
+    monitors: list[dict[str, Any]] = []
+    if needs_windows and needs_monitors:
+        all_windows, monitors = await asyncio.gather(
+            list_windows(all_windows=True), list_monitors()
+        )
+    elif needs_windows:
+        all_windows = await list_windows(all_windows=True)
+    elif needs_monitors:
+        monitors = await list_monitors()
 
     # Categorize windows
     reference_windows = []
     hidden_windows = []
 
-    reference_apps = reference_apps or []
+    reference_set = frozenset(reference_apps or ())
 
     for window in all_windows:
         if window.get("window-id") == focus_window_id:
             continue
 
+        # Apps the caller named are reference windows without categorizing them
         app_name = window.get("app-name", "")
-        app_category = _get_app_category(app_name)
+        if app_name in reference_set:
+            reference_windows.append(window)
+            continue
 
         # Check if this should be a reference window
-        if app_name in reference_apps or app_category == "reference":
+        app_category = _get_app_category(app_name)
+        if app_category == "reference":
             reference_windows.append(window)
         elif hide_communication and app_category == "communication":
             hidden_windows.append(window)
@@ -233,8 +422,7 @@ async def apply_focus_preset(
 
     elif preset == "medium_split":
         # 70/30 split - focus window larger
-        await run_aerospace_command("layout", "h_tiles")
-        await run_aerospace_command("resize", "width", "+30%")
+        await run_aerospace_commands(("layout", "h_tiles"), ("resize", "width", "+30%"))
         layout_result["focus_window"]["arrangement"] = "tiled_70"
 
     elif preset == "large_centered":
@@ -249,15 +437,16 @@ async def apply_focus_preset(
             layout_result["focus_window"]["arrangement"] = "fullscreen"
             layout_result["focus_window"]["monitor"] = 1
 
-            # Move reference windows to secondary monitor
-            for ref_win in reference_windows:
-                try:
-                    await run_aerospace_command(
-                        "focus",
-                        "--window-id",
-                        str(ref_win.get("window-id")),
-                    )
-                    await run_aerospace_command("move-node-to-monitor", "next")
+            # Move reference windows to secondary monitor. Addressing each
+            # window by ID leaves focus alone, so the moves can overlap.
+            moved = await _run_concurrently(
+                [
+                    ("move-node-to-monitor", "--window-id", str(ref_win.get("window-id")), "next")
+                    for ref_win in reference_windows
+                ]
+            )
+            for ref_win, ok in zip(reference_windows, moved, strict=True):
+                if ok:  # Otherwise the window might have closed
                     layout_result["reference_windows"].append(
                         {
                             "window_id": ref_win.get("window-id"),
@@ -265,8 +454,6 @@ async def apply_focus_preset(
                             "arrangement": "tiled",
                         }
                     )
-                except AeroSpaceError:
-                    pass  # Window might have closed
 
     elif preset == "triple_monitor_focus":
         # Primary for focus, secondary for reference, tertiary for communication
@@ -277,22 +464,25 @@ async def apply_focus_preset(
 
     # Hide communication windows if requested
     if hide_communication:
-        for hidden_win in hidden_windows:
-            try:
-                await run_aerospace_command(
-                    "focus",
+        moved = await _run_concurrently(
+            [
+                (
+                    "move-node-to-workspace",
                     "--window-id",
                     str(hidden_win.get("window-id")),
+                    "communication",
                 )
-                await run_aerospace_command("move-node-to-workspace", "communication")
+                for hidden_win in hidden_windows
+            ]
+        )
+        for hidden_win, ok in zip(hidden_windows, moved, strict=True):
+            if ok:
                 layout_result["hidden_windows"].append(
                     {
                         "window_id": hidden_win.get("window-id"),
                         "moved_to_workspace": "communication",
                     }
                 )
-            except AeroSpaceError:
-                pass
 
     # Refocus the main window
     await run_aerospace_command("focus", "--window-id", str(focus_window_id))
@@ -305,6 +495,7 @@ async def apply_focus_preset(
     }
 
 
+@request_scope
 async def save_focus_preset(
     name: str,
     description: str | None = None,
@@ -344,10 +535,8 @@ async def save_focus_preset(
         )
 
     # Save to file
-    PRESET_DIR.mkdir(parents=True, exist_ok=True)
-    preset_path = PRESET_DIR / f"{name}.json"
-    with open(preset_path, "w") as f:
-        json.dump(preset_data, f, indent=2)
+    _write_preset(name, orjson.dumps(preset_data, option=orjson.OPT_INDENT_2))
+    _scan_preset_names.cache_clear()
 
     return {
         "success": True,
@@ -361,12 +550,18 @@ async def save_focus_preset(
     }
 
 
+@request_scope
 async def load_focus_preset(
     name: str,
     adapt_to_displays: bool = True,
 ) -> dict[str, Any]:
     """Load and apply a previously saved focus preset.
 
+    Each preset entry arranges its own window: entries for the same app take
+    that app's windows in listing order, and entries left over once the app
+    runs out of windows are skipped. Windows are moved by ID, so focus stays
+    where it is.
+
     Args:
         name: Name of the preset to load
         adapt_to_displays: Adapt preset if display config changed (default: True)
@@ -374,23 +569,16 @@ async def load_focus_preset(
     Returns:
         Result dictionary with loaded preset info
     """
-    preset_path = PRESET_DIR / f"{name}.json"
-
-    if not preset_path.exists():
-        # List available presets
-        available = []
-        if PRESET_DIR.exists():
-            available = [f.stem for f in PRESET_DIR.glob("*.json")]
-
+    try:
+        with open(_preset_path(name), "rb") as f:
+            preset_data = orjson.loads(f.read())
+    except FileNotFoundError:
         raise AeroSpaceError(
             "PRESET_NOT_FOUND",
             f"Preset '{name}' not found",
-            {"available_presets": available},
+            {"available_presets": sorted(_preset_names())},
         )
 
-    with open(preset_path) as f:
-        preset_data = json.load(f)
-
     # Check display compatibility
     current_category = (await get_display_category()).get("category")
     saved_category = preset_data.get("display_category")
@@ -410,29 +598,38 @@ async def load_focus_preset(
     # Get current windows
     all_windows = await list_windows(all_windows=True)
     windows_arranged = 0
+    moves = []
+
+    # Index windows by app, in listing order. Each preset entry claims the
+    # next unclaimed window of its app, so entries for an app with several
+    # windows arrange different windows.
+    windows_by_app: dict[Any, list[dict[str, Any]]] = {}
+    for window in reversed(all_windows):
+        windows_by_app.setdefault(window.get("app-name"), []).append(window)
 
     for preset_window in preset_data.get("windows", []):
         app_name = preset_window.get("app_name")
         workspace = preset_window.get("workspace")
 
         # Find matching window
-        for window in all_windows:
-            if window.get("app-name") == app_name:
-                try:
-                    await run_aerospace_command(
-                        "focus",
-                        "--window-id",
-                        str(window.get("window-id")),
-                    )
-                    if workspace:
-                        await run_aerospace_command(
-                            "move-node-to-workspace",
-                            workspace,
-                        )
-                    windows_arranged += 1
-                except AeroSpaceError:
-                    pass
-                break
+        candidates = windows_by_app.get(app_name)
+        if not candidates:
+            continue
+        window = candidates.pop()
+        if workspace:
+            moves.append(
+                (
+                    "move-node-to-workspace",
+                    "--window-id",
+                    str(window.get("window-id")),
+                    workspace,
+                )
+            )
+        else:
+            # Nothing to move; the window is already where it belongs
+            windows_arranged += 1
+
+    windows_arranged += sum(await _run_concurrently(moves))
 
     return {
         "success": True,
@@ -442,6 +639,7 @@ async def load_focus_preset(
     }
 
 
+@request_scope
 async def resize_window_optimal(
     window_id: int | None = None,
     content_type: str = "code_editor",
@@ -459,34 +657,16 @@ async def resize_window_optimal(
     Returns:
         Result dictionary with new dimensions
     """
-    valid_types = {"code_editor", "browser", "terminal", "document", "communication"}
-    if content_type not in valid_types:
+    if content_type not in _VALID_CONTENT_TYPES:
         raise AeroSpaceError(
             "INVALID_PARAMETERS",
             f"Invalid content_type '{content_type}'",
-            {"valid_options": list(valid_types)},
+            {"valid_options": list(_VALID_CONTENT_TYPES_SORTED)},
         )
 
     # Get the window
-    if window_id is not None:
-        window = await get_window_by_id(window_id)
-        if window is None:
-            available = await list_windows(all_windows=True)
-            available_ids = [w.get("window-id") for w in available]
-            raise AeroSpaceError(
-                ERROR_WINDOW_NOT_FOUND,
-                f"Window with ID {window_id} not found",
-                {"requested_window_id": window_id, "available_windows": available_ids},
-            )
-    else:
-        window = await get_focused_window()
-        if window is None:
-            raise AeroSpaceError(
-                ERROR_NO_WINDOW_FOCUSED,
-                "No window is currently focused",
-                {"suggestion": "Focus a window first"},
-            )
-        window_id = window.get("window-id")
+    window = await _resolve_window(window_id)
+    window_id = window.get("window-id")
 
     # Get display info for screen size
     display_info = await get_display_info()
@@ -516,16 +696,16 @@ async def resize_window_optimal(
 
     final_width = max(min_px, min(optimal_px, max_px))
 
-    # Focus and resize the window
-    await run_aerospace_command("focus", "--window-id", str(window_id))
-
     # Calculate resize amount (this is approximate since we don't know current size)
     # We'll set to a percentage-based width
     target_percent = int(final_width / screen_width * 100)
 
-    # Resize using layout and resize commands
-    await run_aerospace_command("layout", "h_tiles")
-    await run_aerospace_command("resize", "width", f"{target_percent}%")
+    # Focus the window, then resize it using layout and resize commands
+    await run_aerospace_commands(
+        ("focus", "--window-id", str(window_id)),
+        ("layout", "h_tiles"),
+        ("resize", "width", f"{target_percent}%"),
+    )
 
     return {
         "success": True,
@@ -539,6 +719,7 @@ async def resize_window_optimal(
     }
 
 
+@request_scope
 async def set_window_zone(
     window_id: int | None = None,
     zone: str = "center_focus",
@@ -555,55 +736,30 @@ async def set_window_zone(
     Returns:
         Result dictionary with position info
     """
-    valid_zones = {
-        "center_focus",
-        "left_reference",
-        "right_reference",
-        "top_reference",
-        "bottom_reference",
-        "floating_pip",
-    }
-    if zone not in valid_zones:
+    if zone not in _VALID_ZONES:
         raise AeroSpaceError(
             "INVALID_PARAMETERS",
             f"Invalid zone '{zone}'",
-            {"valid_options": list(valid_zones)},
+            {"valid_options": list(_VALID_ZONES_SORTED)},
         )
 
     # Get the window
-    if window_id is not None:
-        window = await get_window_by_id(window_id)
-        if window is None:
-            available = await list_windows(all_windows=True)
-            available_ids = [w.get("window-id") for w in available]
-            raise AeroSpaceError(
-                ERROR_WINDOW_NOT_FOUND,
-                f"Window with ID {window_id} not found",
-                {"requested_window_id": window_id, "available_windows": available_ids},
-            )
-    else:
-        window = await get_focused_window()
-        if window is None:
-            raise AeroSpaceError(
-                ERROR_NO_WINDOW_FOCUSED,
-                "No window is currently focused",
-                {"suggestion": "Focus a window first"},
-            )
-        window_id = window.get("window-id")
+    window = await _resolve_window(window_id)
+    window_id = window.get("window-id")
 
     # Focus the window
-    await run_aerospace_command("focus", "--window-id", str(window_id))
+    commands: list[tuple[str, ...]] = [("focus", "--window-id", str(window_id))]
 
     # Move to correct monitor if needed
     if monitor == "secondary":
-        await run_aerospace_command("move-node-to-monitor", "next")
+        commands.append(("move-node-to-monitor", "next"))
     elif monitor != "primary" and monitor.isdigit():
         # Move to specific monitor by index
         monitors = await list_monitors()
         if int(monitor) <= len(monitors):
             target_name = monitors[int(monitor) - 1].get("name")
             if target_name:
-                await run_aerospace_command("move-node-to-monitor", target_name)
+                commands.append(("move-node-to-monitor", target_name))
 
     # Apply zone layout
     # Get display info for calculations
@@ -623,39 +779,32 @@ async def set_window_zone(
         width = int(screen_width * 0.65)
         x = int((screen_width - width) / 2)
         bounds = {"x": x, "y": 0, "width": width, "height": screen_height}
-        await run_aerospace_command("layout", "tiling")
-        await run_aerospace_command("resize", "width", "65%")
+        commands += [("layout", "tiling"), ("resize", "width", "65%")]
 
     elif zone == "left_reference":
         # 25-30% width on left
         width = int(screen_width * 0.28)
         bounds = {"x": 0, "y": 0, "width": width, "height": screen_height}
-        await run_aerospace_command("layout", "h_tiles")
-        await run_aerospace_command("move", "left")
-        await run_aerospace_command("resize", "width", "-40%")
+        commands += [("layout", "h_tiles"), ("move", "left"), ("resize", "width", "-40%")]
 
     elif zone == "right_reference":
         # 25-30% width on right
         width = int(screen_width * 0.28)
         x = screen_width - width
         bounds = {"x": x, "y": 0, "width": width, "height": screen_height}
-        await run_aerospace_command("layout", "h_tiles")
-        await run_aerospace_command("move", "right")
-        await run_aerospace_command("resize", "width", "-40%")
+        commands += [("layout", "h_tiles"), ("move", "right"), ("resize", "width", "-40%")]
 
     elif zone == "top_reference":
         # Top half
         height = int(screen_height / 2)
         bounds = {"x": 0, "y": 0, "width": screen_width, "height": height}
-        await run_aerospace_command("layout", "v_tiles")
-        await run_aerospace_command("move", "up")
+        commands += [("layout", "v_tiles"), ("move", "up")]
 
     elif zone == "bottom_reference":
         # Bottom half
         height = int(screen_height / 2)
         bounds = {"x": 0, "y": height, "width": screen_width, "height": height}
-        await run_aerospace_command("layout", "v_tiles")
-        await run_aerospace_command("move", "down")
+        commands += [("layout", "v_tiles"), ("move", "down")]
 
     elif zone == "floating_pip":
         # Small floating window in corner (picture-in-picture style)
@@ -664,7 +813,10 @@ async def set_window_zone(
         x = screen_width - width - 20
         y = screen_height - height - 20
         bounds = {"x": x, "y": y, "width": width, "height": height}
-        await run_aerospace_command("layout", "floating")
+        commands.append(("layout", "floating"))
+
+    # Focus, move and arrange the window in one pass
+    await run_aerospace_commands(*commands)
 
     return {
         "success": True,
@@ -675,6 +827,7 @@ async def set_window_zone(
     }
 
 
+@request_scope
 async def move_app_category_to_monitor(
     category: str,
     monitor: str,
@@ -697,12 +850,11 @@ async def move_app_category_to_monitor(
             {"valid_options": list(APP_CATEGORIES.keys())},
         )
 
-    valid_layouts = {"tiled", "accordion", "stacked"}
-    if layout not in valid_layouts:
+    if layout not in _CATEGORY_LAYOUTS:
         raise AeroSpaceError(
             "INVALID_PARAMETERS",
             f"Invalid layout '{layout}'",
-            {"valid_options": list(valid_layouts)},
+            {"valid_options": list(_VALID_CATEGORY_LAYOUTS_SORTED)},
         )
 
     # Get monitors
@@ -738,39 +890,38 @@ async def move_app_category_to_monitor(
     # Get all windows
     all_windows = await list_windows(all_windows=True)
 
-    # Find windows in the category
-    category_apps = APP_CATEGORIES[category]
+    # Find windows in the category, trying an exact app name before substrings
+    category_apps = _CATEGORY_APPS[category]
+    category_tokens = _CATEGORY_TOKENS[category]
     windows_moved = []
 
+    category_windows = []
     for window in all_windows:
         app_name = window.get("app-name", "")
-        if app_name in category_apps or any(
-            cat_app.lower() in app_name.lower() for cat_app in category_apps
-        ):
-            try:
-                await run_aerospace_command(
-                    "focus",
-                    "--window-id",
-                    str(window.get("window-id")),
-                )
-                await run_aerospace_command("move-node-to-monitor", target_monitor)
-                windows_moved.append(
-                    {
-                        "window_id": window.get("window-id"),
-                        "app_name": app_name,
-                    }
-                )
-            except AeroSpaceError:
-                pass  # Window might have closed
+        if app_name in category_apps:
+            category_windows.append(window)
+            continue
+        name = app_name.lower()
+        if any(token in name for token in category_tokens):
+            category_windows.append(window)
+    moved = await _run_concurrently(
+        [
+            ("move-node-to-monitor", "--window-id", str(window.get("window-id")), target_monitor)
+            for window in category_windows
+        ]
+    )
+    for window, ok in zip(category_windows, moved, strict=True):
+        if ok:  # Otherwise the window might have closed
+            windows_moved.append(
+                {
+                    "window_id": window.get("window-id"),
+                    "app_name": window.get("app-name", ""),
+                }
+            )
 
     # Apply layout to moved windows
     if windows_moved:
-        layout_map = {
-            "tiled": "h_tiles",
-            "accordion": "h_accordion",
-            "stacked": "v_accordion",
-        }
-        aerospace_layout = layout_map.get(layout, "h_tiles")
+        aerospace_layout = _CATEGORY_LAYOUTS.get(layout, "h_tiles")
 
         # Focus first moved window and apply layout
         try:
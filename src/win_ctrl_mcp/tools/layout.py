@@ -12,6 +12,9 @@ from win_ctrl_mcp.aerospace import (
     validate_layout,
 )
 
+_VALID_ORIENTATIONS = frozenset({"horizontal", "vertical"})
+_VALID_ORIENTATIONS_SORTED = tuple(sorted(_VALID_ORIENTATIONS))
+
 
 async def set_layout(layout: str) -> dict[str, Any]:
     """Change the layout mode for the focused window's container.
@@ -50,14 +53,13 @@ async def split_window(orientation: str) -> dict[str, Any]:
     Returns:
         Result dictionary with split info
     """
-    valid_orientations = {"horizontal", "vertical"}
-    if orientation not in valid_orientations:
+    if orientation not in _VALID_ORIENTATIONS:
         from win_ctrl_mcp.aerospace import AeroSpaceError
 
         raise AeroSpaceError(
             "INVALID_PARAMETERS",
             f"Invalid orientation '{orientation}'. Must be: horizontal or vertical",
-            {"provided": orientation, "valid_options": list(valid_orientations)},
+            {"provided": orientation, "valid_options": list(_VALID_ORIENTATIONS_SORTED)},
         )
 
     await run_aerospace_command("split", orientation)
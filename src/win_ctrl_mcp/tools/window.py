@@ -3,6 +3,8 @@
 This module provides MCP tools for window focus, movement, and control.
 """
 
+import asyncio
+from types import MappingProxyType
 from typing import Any
 
 from win_ctrl_mcp.aerospace import (
@@ -11,12 +13,28 @@ from win_ctrl_mcp.aerospace import (
     AeroSpaceError,
     get_focused_window,
     get_window_by_id,
+    list_window_ids,
     list_windows,
+    request_scope,
     run_aerospace_command,
     validate_direction,
 )
 
+_VALID_DIMENSIONS = frozenset({"smart", "width", "height"})
+_VALID_DIMENSIONS_SORTED = tuple(sorted(_VALID_DIMENSIONS))
 
+# Move command for each move_window target type
+_MOVE_COMMANDS = MappingProxyType(
+    {
+        "workspace": "move-node-to-workspace",
+        "monitor": "move-node-to-monitor",
+        "direction": "move",
+    }
+)
+_MOVE_TARGET_TYPES = tuple(_MOVE_COMMANDS)
+
+
+@request_scope
 async def focus_window(
     direction: str | None = None,
     window_id: int | None = None,
@@ -54,8 +72,7 @@ async def focus_window(
         # Focus by window ID
         window = await get_window_by_id(window_id)  # type: ignore[arg-type]
         if window is None:
-            available = await list_windows(all_windows=True)
-            available_ids = [w.get("window-id") for w in available]
+            available_ids = await list_window_ids()
             raise AeroSpaceError(
                 ERROR_WINDOW_NOT_FOUND,
                 f"Window with ID {window_id} not found",
@@ -63,6 +80,16 @@ async def focus_window(
             )
         await run_aerospace_command("focus", "--window-id", str(window_id))
 
+        # The window just looked up is now the focused one
+        return {
+            "success": True,
+            "focused_window": {
+                "window_id": window_id,
+                "app_name": window.get("app-name"),
+                "title": window.get("title", ""),
+            },
+        }
+
     # Get the newly focused window
     focused = await get_focused_window()
     if focused is None:
@@ -78,6 +105,7 @@ async def focus_window(
     }
 
 
+@request_scope
 async def focus_monitor(target: str) -> dict[str, Any]:
     """Focus a specific monitor by name, pattern, or direction.
 
@@ -93,16 +121,12 @@ async def focus_monitor(target: str) -> dict[str, Any]:
     # We'll get the focused workspace's monitor
     from win_ctrl_mcp.aerospace import get_focused_workspace, list_monitors
 
-    workspace = await get_focused_workspace()
-    monitors = await list_monitors()
+    workspace, monitors = await asyncio.gather(get_focused_workspace(), list_monitors())
 
     focused_monitor = None
     if workspace and monitors:
         monitor_name = workspace.get("monitor")
-        for m in monitors:
-            if m.get("name") == monitor_name:
-                focused_monitor = m
-                break
+        focused_monitor = next((m for m in monitors if m.get("name") == monitor_name), None)
 
     return {
         "success": True,
@@ -113,6 +137,7 @@ async def focus_monitor(target: str) -> dict[str, Any]:
     }
 
 
+@request_scope
 async def focus_workspace(workspace: str) -> dict[str, Any]:
     """Switch to a specific workspace by name or number.
 
@@ -127,15 +152,11 @@ async def focus_workspace(workspace: str) -> dict[str, Any]:
     # Get workspace info
     from win_ctrl_mcp.aerospace import list_workspaces
 
-    workspaces = await list_workspaces(all_workspaces=True)
-    ws_info = None
-    for ws in workspaces:
-        if ws.get("workspace") == workspace:
-            ws_info = ws
-            break
-
-    # Get window count for workspace
-    windows = await list_windows(workspace=workspace)
+    # The workspace list and the workspace's windows are independent queries
+    workspaces, windows = await asyncio.gather(
+        list_workspaces(all_workspaces=True), list_windows(workspace=workspace)
+    )
+    ws_info = {ws.get("workspace"): ws for ws in workspaces}.get(workspace)
 
     return {
         "success": True,
@@ -147,6 +168,7 @@ async def focus_workspace(workspace: str) -> dict[str, Any]:
     }
 
 
+@request_scope
 async def move_window(
     target_type: str,
     target: str,
@@ -162,44 +184,41 @@ async def move_window(
     Returns:
         Result dictionary with move info
     """
+    # Pick the move command based on target_type
+    command = _MOVE_COMMANDS.get(target_type)
+    if command is None:
+        raise AeroSpaceError(
+            "INVALID_PARAMETERS",
+            f"Invalid target_type '{target_type}'. Must be: workspace, monitor, or direction",
+            {"provided": target_type, "valid_options": list(_MOVE_TARGET_TYPES)},
+        )
+    if target_type == "direction":
+        validate_direction(target)
+
     # Get the window to move
     if window_id is not None:
         window = await get_window_by_id(window_id)
         if window is None:
-            available = await list_windows(all_windows=True)
-            available_ids = [w.get("window-id") for w in available]
+            available_ids = await list_window_ids()
             raise AeroSpaceError(
                 ERROR_WINDOW_NOT_FOUND,
                 f"Window with ID {window_id} not found",
                 {"requested_window_id": window_id, "available_windows": available_ids},
             )
-        # Focus the window first if specified
-        await run_aerospace_command("focus", "--window-id", str(window_id))
+        # Address the window directly instead of focusing it first
+        await run_aerospace_command(command, "--window-id", str(window_id), target)
         actual_window_id = window_id
     else:
         focused = await get_focused_window()
-        if focused is None:
+        focused_id = focused.get("window-id") if focused is not None else None
+        if focused_id is None:
             raise AeroSpaceError(
                 ERROR_NO_WINDOW_FOCUSED,
                 "No window is currently focused",
                 {"suggestion": "Focus a window first"},
             )
-        actual_window_id = int(focused.get("window-id", 0))
-
-    # Execute the move based on target_type
-    if target_type == "workspace":
-        await run_aerospace_command("move-node-to-workspace", target)
-    elif target_type == "monitor":
-        await run_aerospace_command("move-node-to-monitor", target)
-    elif target_type == "direction":
-        validate_direction(target)
-        await run_aerospace_command("move", target)
-    else:
-        raise AeroSpaceError(
-            "INVALID_PARAMETERS",
-            f"Invalid target_type '{target_type}'. Must be: workspace, monitor, or direction",
-            {"provided": target_type, "valid_options": ["workspace", "monitor", "direction"]},
-        )
+        actual_window_id = focused_id
+        await run_aerospace_command(command, target)
 
     return {
         "success": True,
@@ -211,6 +230,7 @@ async def move_window(
     }
 
 
+@request_scope
 async def resize_window(
     dimension: str,
     amount: str,
@@ -224,12 +244,11 @@ async def resize_window(
     Returns:
         Result dictionary with resize info
     """
-    valid_dimensions = {"smart", "width", "height"}
-    if dimension not in valid_dimensions:
+    if dimension not in _VALID_DIMENSIONS:
         raise AeroSpaceError(
             "INVALID_PARAMETERS",
             f"Invalid dimension '{dimension}'. Must be: smart, width, or height",
-            {"provided": dimension, "valid_options": list(valid_dimensions)},
+            {"provided": dimension, "valid_options": list(_VALID_DIMENSIONS_SORTED)},
         )
 
     focused = await get_focused_window()
@@ -252,6 +271,7 @@ async def resize_window(
     }
 
 
+@request_scope
 async def close_window(window_id: int | None = None) -> dict[str, Any]:
     """Close the focused window or a specific window by ID.
 
@@ -264,8 +284,7 @@ async def close_window(window_id: int | None = None) -> dict[str, Any]:
     if window_id is not None:
         window = await get_window_by_id(window_id)
         if window is None:
-            available = await list_windows(all_windows=True)
-            available_ids = [w.get("window-id") for w in available]
+            available_ids = await list_window_ids()
             raise AeroSpaceError(
                 ERROR_WINDOW_NOT_FOUND,
                 f"Window with ID {window_id} not found",
@@ -298,6 +317,7 @@ async def close_window(window_id: int | None = None) -> dict[str, Any]:
     }
 
 
+@request_scope
 async def fullscreen_toggle(window_id: int | None = None) -> dict[str, Any]:
     """Toggle fullscreen mode for the focused window.
 
@@ -312,43 +332,37 @@ async def fullscreen_toggle(window_id: int | None = None) -> dict[str, Any]:
     if window_id is not None:
         window = await get_window_by_id(window_id)
         if window is None:
-            available = await list_windows(all_windows=True)
-            available_ids = [w.get("window-id") for w in available]
+            available_ids = await list_window_ids()
             raise AeroSpaceError(
                 ERROR_WINDOW_NOT_FOUND,
                 f"Window with ID {window_id} not found",
                 {"requested_window_id": window_id, "available_windows": available_ids},
             )
-        # Focus the window first
-        await run_aerospace_command("focus", "--window-id", str(window_id))
+        # Address the window directly instead of focusing it first
+        await run_aerospace_command("fullscreen", "--window-id", str(window_id))
         actual_window_id = window_id
     else:
         focused = await get_focused_window()
-        if focused is None:
+        focused_id = focused.get("window-id") if focused is not None else None
+        if focused_id is None:
             raise AeroSpaceError(
                 ERROR_NO_WINDOW_FOCUSED,
                 "No window is currently focused",
                 {"suggestion": "Focus a window first"},
             )
-        actual_window_id = int(focused.get("window-id", 0))
-
-    await run_aerospace_command("fullscreen")
-
-    # Check new state - the window should now be fullscreen or not
-    updated_window = await get_window_by_id(actual_window_id)  # type: ignore[arg-type]
-    is_fullscreen = False
-    if updated_window:
-        # AeroSpace doesn't directly expose fullscreen state in list-windows
-        # We infer it from the command success
-        is_fullscreen = True  # Toggle happened, we assume it's now fullscreen
+        actual_window_id = focused_id
+        await run_aerospace_command("fullscreen")
 
+    # AeroSpace doesn't expose fullscreen state in list-windows, so the new
+    # state is inferred from the command succeeding
     return {
         "success": True,
         "window_id": actual_window_id,
-        "fullscreen": is_fullscreen,
+        "fullscreen": True,
     }
 
 
+@request_scope
 async def minimize_window(window_id: int | None = None) -> dict[str, Any]:
     """Minimize the focused window or a specific window.
 
@@ -361,27 +375,26 @@ async def minimize_window(window_id: int | None = None) -> dict[str, Any]:
     if window_id is not None:
         window = await get_window_by_id(window_id)
         if window is None:
-            available = await list_windows(all_windows=True)
-            available_ids = [w.get("window-id") for w in available]
+            available_ids = await list_window_ids()
             raise AeroSpaceError(
                 ERROR_WINDOW_NOT_FOUND,
                 f"Window with ID {window_id} not found",
                 {"requested_window_id": window_id, "available_windows": available_ids},
             )
-        # Focus the window first
-        await run_aerospace_command("focus", "--window-id", str(window_id))
+        # Address the window directly instead of focusing it first
+        await run_aerospace_command("macos-native-minimize", "--window-id", str(window_id))
         actual_window_id = window_id
     else:
         focused = await get_focused_window()
-        if focused is None:
+        focused_id = focused.get("window-id") if focused is not None else None
+        if focused_id is None:
             raise AeroSpaceError(
                 ERROR_NO_WINDOW_FOCUSED,
                 "No window is currently focused",
                 {"suggestion": "Focus a window first"},
             )
-        actual_window_id = int(focused.get("window-id", 0))
-
-    await run_aerospace_command("macos-native-minimize")
+        actual_window_id = focused_id
+        await run_aerospace_command("macos-native-minimize")
 
     return {
         "success": True,
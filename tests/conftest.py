@@ -1,20 +1,85 @@
 """Pytest fixtures for win_ctrl_mcp tests."""
 
-import json
+from collections.abc import Mapping
+from contextlib import ExitStack
+from types import MappingProxyType
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
+import orjson
 import pytest
 
+from win_ctrl_mcp.tools.display import clear_display_info_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_display_info():
+    """Keep cached display info from leaking between tests."""
+    clear_display_info_cache()
+    yield
+    clear_display_info_cache()
+
+
+@pytest.fixture
+def patch_async():
+    """Patch coroutine functions of a module with AsyncMocks in one go.
+
+    Call it with the module path and the return value for each function name;
+    it returns the mocks by name. All patches are undone at teardown.
+    """
+    with ExitStack() as stack:
+
+        def _patch(module: str, **return_values: Any) -> dict[str, AsyncMock]:
+            return {
+                name: stack.enter_context(
+                    patch(f"{module}.{name}", new_callable=AsyncMock, return_value=value)
+                )
+                for name, value in return_values.items()
+            }
+
+        yield _patch
+
+
+def _const_async(value: Any):
+    """Build a coroutine function that ignores its arguments and returns value."""
+
+    async def _const(*args: Any, **kwargs: Any) -> Any:  # noqa: ARG001
+        return value
+
+    return _const
+
+
+@pytest.fixture
+def patch_const():
+    """Patch coroutine functions of a module to return fixed values.
+
+    Like patch_async, but installs plain coroutine functions instead of
+    AsyncMocks, for tests that never assert on the calls.
+    """
+    with ExitStack() as stack:
+
+        def _patch(module: str, **return_values: Any) -> None:
+            for name, value in return_values.items():
+                stack.enter_context(patch(f"{module}.{name}", new=_const_async(value)))
+
+        yield _patch
+
 
 @pytest.fixture
 def mock_aerospace_command():
     """Fixture to mock aerospace command execution."""
 
+    def _output(stdout: str, raw: bool):
+        """Shape a response like run_aerospace_command would."""
+        if raw:
+            return stdout.encode(), b"", 0
+        return stdout, "", 0
+
     async def _mock_run(
         *args: str,
         json_output: bool = False,  # noqa: ARG001
         check: bool = True,  # noqa: ARG001
+        raw: bool = False,
     ):
         """Mock aerospace command runner."""
         cmd = args[0] if args else ""
@@ -39,7 +104,7 @@ def mock_aerospace_command():
                     "monitor": "Built-in Retina Display",
                 },
             ]
-            return json.dumps(data), "", 0
+            return _output(orjson.dumps(data).decode(), raw)
 
         elif cmd == "list-workspaces":
             data = [
@@ -47,68 +112,81 @@ def mock_aerospace_command():
                 {"workspace": "2", "monitor": "Built-in Retina Display"},
                 {"workspace": "dev", "monitor": "DELL U2720Q"},
             ]
-            return json.dumps(data), "", 0
+            return _output(orjson.dumps(data).decode(), raw)
 
         elif cmd == "list-monitors":
             data = [
                 {"name": "Built-in Retina Display"},
                 {"name": "DELL U2720Q"},
             ]
-            return json.dumps(data), "", 0
+            return _output(orjson.dumps(data).decode(), raw)
 
         else:
             # Default success for action commands
-            return "", "", 0
+            return _output("", raw)
 
     with patch("win_ctrl_mcp.aerospace.run_aerospace_command", side_effect=_mock_run):
         yield _mock_run
 
 
-@pytest.fixture
-def mock_window_list() -> list[dict[str, Any]]:
-    """Sample window list for testing."""
-    return [
-        {
-            "window-id": 1234,
-            "app-name": "Firefox",
-            "app-bundle-id": "org.mozilla.firefox",
-            "title": "GitHub - Mozilla Firefox",
-            "workspace": "1",
-            "monitor": "Built-in Retina Display",
-        },
-        {
-            "window-id": 5678,
-            "app-name": "Terminal",
-            "app-bundle-id": "com.apple.Terminal",
-            "title": "bash - 80x24",
-            "workspace": "1",
-            "monitor": "Built-in Retina Display",
-        },
-        {
-            "window-id": 9012,
-            "app-name": "Visual Studio Code",
-            "app-bundle-id": "com.microsoft.VSCode",
-            "title": "project - Visual Studio Code",
-            "workspace": "dev",
-            "monitor": "DELL U2720Q",
-        },
-    ]
+def _frozen(items: list[dict[str, Any]]) -> tuple[Mapping[str, Any], ...]:
+    """Make sample data read-only so a test that mutates it fails at once."""
+    return tuple(MappingProxyType(item) for item in items)
 
 
-@pytest.fixture
-def mock_workspace_list() -> list[dict[str, Any]]:
+# The sample lists below are built once per session and shared by every test,
+# so they are frozen to keep one test's changes from leaking into the next.
+@pytest.fixture(scope="session")
+def mock_window_list() -> tuple[Mapping[str, Any], ...]:
+    """Sample window list for testing."""
+    return _frozen(
+        [
+            {
+                "window-id": 1234,
+                "app-name": "Firefox",
+                "app-bundle-id": "org.mozilla.firefox",
+                "title": "GitHub - Mozilla Firefox",
+                "workspace": "1",
+                "monitor": "Built-in Retina Display",
+            },
+            {
+                "window-id": 5678,
+                "app-name": "Terminal",
+                "app-bundle-id": "com.apple.Terminal",
+                "title": "bash - 80x24",
+                "workspace": "1",
+                "monitor": "Built-in Retina Display",
+            },
+            {
+                "window-id": 9012,
+                "app-name": "Visual Studio Code",
+                "app-bundle-id": "com.microsoft.VSCode",
+                "title": "project - Visual Studio Code",
+                "workspace": "dev",
+                "monitor": "DELL U2720Q",
+            },
+        ]
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_workspace_list() -> tuple[Mapping[str, Any], ...]:
     """Sample workspace list for testing."""
-    return [
-        {"workspace": "1", "monitor": "Built-in Retina Display"},
-        {"workspace": "2", "monitor": "Built-in Retina Display"},
-        {"workspace": "dev", "monitor": "DELL U2720Q"},
-    ]
+    return _frozen(
+        [
+            {"workspace": "1", "monitor": "Built-in Retina Display"},
+            {"workspace": "2", "monitor": "Built-in Retina Display"},
+            {"workspace": "dev", "monitor": "DELL U2720Q"},
+        ]
+    )
 
 
-@pytest.fixture
-def mock_monitor_list() -> list[dict[str, Any]]:
+@pytest.fixture(scope="session")
+def mock_monitor_list() -> tuple[Mapping[str, Any], ...]:
     """Sample monitor list for testing."""
-    return [
-        {"name": "Built-in Retina Display"},
-        {"name": "DELL U2720Q"},
-    ]
+    return _frozen(
+        [
+            {"name": "Built-in Retina Display"},
+            {"name": "DELL U2720Q"},
+        ]
+    )
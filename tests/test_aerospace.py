@@ -1,13 +1,30 @@
 """Tests for aerospace module."""
 
+import asyncio
+import os
+import tempfile
+from unittest.mock import patch
+
+import orjson
 import pytest
 
+from win_ctrl_mcp import aerospace
 from win_ctrl_mcp.aerospace import (
+    ERROR_AEROSPACE_NOT_RUNNING,
+    ERROR_COMMAND_FAILED,
     ERROR_INVALID_DIRECTION,
     ERROR_INVALID_LAYOUT,
     VALID_DIRECTIONS,
     VALID_LAYOUTS,
     AeroSpaceError,
+    get_focused_window,
+    get_window_by_id,
+    list_window_ids,
+    list_workspaces,
+    request_scope,
+    run_aerospace_command,
+    run_aerospace_command_sync,
+    run_aerospace_commands,
     validate_direction,
     validate_layout,
 )
@@ -83,3 +100,463 @@ class TestValidateLayout:
         error = exc_info.value
         assert error.code == ERROR_INVALID_LAYOUT
         assert "invalid_layout" in error.message
+
+
+FAKE_AEROSPACE = """#!/bin/sh
+if [ -n "$FAKE_AEROSPACE_LOG" ]; then
+  echo "$*" >> "$FAKE_AEROSPACE_LOG"
+fi
+if [ "$1" = "missing" ]; then
+  exit 127
+fi
+if [ "$1" = "slow" ]; then
+  sleep 0.2
+fi
+if [ "$1" = "fail" ]; then
+  echo "bad command" >&2
+  exit 2
+fi
+echo "pid $$"
+printf '%s\\n' "$@"
+"""
+
+
+@pytest.fixture
+def fake_aerospace(tmp_path, monkeypatch):
+    """Put a fake aerospace CLI on PATH and reset the persistent worker."""
+    script = tmp_path / "aerospace"
+    script.write_text(FAKE_AEROSPACE)
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ.get('PATH', '')}")
+    monkeypatch.setattr(aerospace, "_daemon_down_at", None)
+    aerospace._worker.close()
+    aerospace._aerospace_path.cache_clear()
+    yield
+    aerospace._worker.close()
+
+
+@pytest.mark.usefixtures("fake_aerospace")
+class TestPersistentWorker:
+    """Tests for running commands through the persistent worker."""
+
+    @pytest.mark.asyncio
+    async def test_arguments_round_trip(self):
+        """Test that arguments with spaces and quotes reach the CLI intact."""
+        stdout, stderr, code = await run_aerospace_command("focus", 'it\'s a "title"')
+
+        assert code == 0
+        assert stderr == ""
+        assert stdout.splitlines()[1:] == ["focus", 'it\'s a "title"']
+
+    @pytest.mark.asyncio
+    async def test_worker_is_reused(self):
+        """Test that consecutive commands are served by the same worker."""
+        await run_aerospace_command("list-windows")
+        proc = aerospace._worker._proc
+        await run_aerospace_command("list-windows")
+
+        assert proc is not None
+        assert aerospace._worker._proc is proc
+        assert proc.poll() is None
+
+    @pytest.mark.asyncio
+    async def test_failure_reports_stderr(self):
+        """Test that a failing command raises with its stderr and exit code."""
+        with pytest.raises(AeroSpaceError) as exc_info:
+            await run_aerospace_command("fail")
+
+        error = exc_info.value
+        assert error.code == ERROR_COMMAND_FAILED
+        assert error.details["return_code"] == 2
+        assert error.details["stderr"] == "bad command"
+
+        # The worker keeps serving commands after a failure
+        _, _, code = await run_aerospace_command("list-windows")
+        assert code == 0
+
+    @pytest.mark.asyncio
+    async def test_exit_127_without_cli_on_path(self):
+        """Test that exit code 127 maps to not-running only when the CLI is absent."""
+        with pytest.raises(AeroSpaceError) as exc_info:
+            await run_aerospace_command("missing")
+        assert exc_info.value.code == ERROR_COMMAND_FAILED
+
+        with (
+            patch("win_ctrl_mcp.aerospace._aerospace_path", return_value=None),
+            pytest.raises(AeroSpaceError) as exc_info,
+        ):
+            await run_aerospace_command("missing")
+        assert exc_info.value.code == ERROR_AEROSPACE_NOT_RUNNING
+
+    @pytest.mark.asyncio
+    async def test_unchecked_query_without_cli(self, tmp_path, monkeypatch):
+        """Test that a query that tolerates failure still reports a missing CLI."""
+        monkeypatch.setenv("PATH", str(tmp_path / "empty"))
+        aerospace._aerospace_path.cache_clear()
+
+        with pytest.raises(AeroSpaceError) as exc_info:
+            await get_focused_window()
+
+        assert exc_info.value.code == ERROR_AEROSPACE_NOT_RUNNING
+        assert aerospace._daemon_down_at is not None
+
+    @pytest.mark.asyncio
+    async def test_not_running_fails_fast(self, monkeypatch):
+        """Test that commands fail without spawning while aerospace is known down."""
+        with (
+            patch("win_ctrl_mcp.aerospace._aerospace_path", return_value=None),
+            pytest.raises(AeroSpaceError),
+        ):
+            await run_aerospace_command("missing")
+
+        with (
+            patch.object(aerospace._worker, "run") as mock_run,
+            pytest.raises(AeroSpaceError) as exc_info,
+        ):
+            await run_aerospace_command("list-windows")
+        assert exc_info.value.code == ERROR_AEROSPACE_NOT_RUNNING
+        mock_run.assert_not_called()
+
+        # Once the verdict expires, commands run again and clear it
+        monkeypatch.setattr(aerospace, "_DAEMON_CHECK_TTL", 0.0)
+        _, _, code = await run_aerospace_command("list-windows")
+        assert code == 0
+        assert aerospace._daemon_down_at is None
+
+    @pytest.mark.asyncio
+    async def test_state_generation(self):
+        """Test that only state-changing commands bump the state generation."""
+        before = aerospace.state_generation()
+        await run_aerospace_command("list-windows")
+        assert aerospace.state_generation() == before
+
+        await run_aerospace_command("focus", "left")
+        assert aerospace.state_generation() > before
+
+    @pytest.mark.asyncio
+    async def test_concurrent_commands(self):
+        """Test that commands issued while the worker is busy still complete."""
+        results = await asyncio.gather(
+            *(run_aerospace_command("workspace", str(i)) for i in range(5))
+        )
+
+        assert [r[0].splitlines()[2] for r in results] == ["0", "1", "2", "3", "4"]
+
+    @pytest.mark.asyncio
+    async def test_newline_argument_falls_back(self):
+        """Test that arguments that cannot be framed use a one-shot process."""
+        stdout, _, code = await run_aerospace_command("focus", "two\nlines")
+
+        assert code == 0
+        assert stdout.splitlines()[1:] == ["focus", "two", "lines"]
+
+    @pytest.mark.asyncio
+    async def test_raw_output(self):
+        """Test that raw mode returns the command's bytes unmodified."""
+        stdout, stderr, code = await run_aerospace_command("list-windows", raw=True)
+
+        assert code == 0
+        assert stderr == b""
+        assert stdout.endswith(b"list-windows\n")
+
+    @pytest.mark.asyncio
+    async def test_command_sequence(self, tmp_path, monkeypatch):
+        """Test that a sequence runs in order through the worker."""
+        log = tmp_path / "commands.log"
+        monkeypatch.setenv("FAKE_AEROSPACE_LOG", str(log))
+        await run_aerospace_command("list-windows")
+        proc = aerospace._worker._proc
+
+        await run_aerospace_commands(("layout", "h_tiles"), ("resize", "width", "+30%"))
+
+        assert aerospace._worker._proc is proc
+        assert log.read_text().splitlines()[1:] == ["layout h_tiles", "resize width +30%"]
+
+    @pytest.mark.asyncio
+    async def test_command_sequence_stops_at_failure(self, tmp_path, monkeypatch):
+        """Test that a failing command raises and skips the rest of the sequence."""
+        log = tmp_path / "commands.log"
+        monkeypatch.setenv("FAKE_AEROSPACE_LOG", str(log))
+
+        with pytest.raises(AeroSpaceError) as exc_info:
+            await run_aerospace_commands(("focus", "1"), ("fail",), ("focus", "2"))
+
+        assert exc_info.value.details["stderr"] == "bad command"
+        assert log.read_text().splitlines() == ["focus 1", "fail"]
+
+    @pytest.mark.asyncio
+    async def test_command_waits_for_sequence(self, tmp_path, monkeypatch):
+        """Test that a mutating command cannot land between the steps of a sequence."""
+        log = tmp_path / "commands.log"
+        monkeypatch.setenv("FAKE_AEROSPACE_LOG", str(log))
+
+        sequence = asyncio.ensure_future(run_aerospace_commands(("slow",), ("layout", "h_tiles")))
+        await asyncio.sleep(0)
+        await run_aerospace_command("focus", "left")
+        await sequence
+
+        assert log.read_text().splitlines() == ["slow", "layout h_tiles", "focus left"]
+
+    def test_sync_runner(self):
+        """Test that the synchronous runner shares the persistent worker."""
+        stdout, _, code = run_aerospace_command_sync("list-windows", json_output=True)
+
+        assert code == 0
+        assert stdout.splitlines()[1:] == ["list-windows", "--json"]
+        assert aerospace._worker._proc is not None
+
+
+@pytest.fixture
+def fake_daemon(monkeypatch):
+    """Route commands to a fake aerospace daemon socket.
+
+    Yields the socket path, the list of decoded requests, a state dict whose
+    ``answer`` is the reply (with ``close`` set to hang up instead) and the
+    connection handler to serve on the path.
+    """
+    requests: list[dict] = []
+    state = {"answer": {"exitCode": 0, "stdout": "ok\n", "stderr": "", "close": False}}
+
+    async def handle(reader, writer):
+        requests.append(orjson.loads(await reader.read(65536)))
+        answer = dict(state["answer"])
+        if not answer.pop("close"):
+            body = orjson.dumps(answer)
+            # Split the answer to exercise reassembly
+            writer.write(body[:5])
+            await writer.drain()
+            await asyncio.sleep(0.01)
+            writer.write(body[5:])
+            await writer.drain()
+            await asyncio.sleep(0.05)
+        writer.close()
+
+    with tempfile.TemporaryDirectory(dir="/tmp") as directory:
+        path = os.path.join(directory, "aerospace.sock")
+        monkeypatch.setattr(aerospace, "_socket_path", lambda: path)
+        monkeypatch.setenv(aerospace.AEROSPACE_SOCKET_ENV, "1")
+        monkeypatch.setattr(aerospace, "_daemon_down_at", None)
+        yield path, requests, state, handle
+
+
+class TestDaemonSocket:
+    """Tests for sending commands straight to the aerospace daemon."""
+
+    @pytest.mark.asyncio
+    async def test_command_served_by_socket(self, fake_daemon):
+        """Test that a command is sent as a JSON request and its answer returned."""
+        path, requests, _, handle = fake_daemon
+        server = await asyncio.start_unix_server(handle, path)
+        async with server:
+            stdout, stderr, code = await run_aerospace_command("list-monitors", json_output=True)
+
+        assert (stdout, stderr, code) == ("ok", "", 0)
+        assert requests[0]["args"] == ["list-monitors", "--json"]
+
+    @pytest.mark.asyncio
+    async def test_failed_command(self, fake_daemon):
+        """Test that a non-zero exit code in the answer raises."""
+        path, _, state, handle = fake_daemon
+        state["answer"] = {"exitCode": 2, "stdout": "", "stderr": "bad command", "close": False}
+        server = await asyncio.start_unix_server(handle, path)
+        async with server:
+            with pytest.raises(AeroSpaceError) as exc_info:
+                await run_aerospace_command("fail")
+
+        assert exc_info.value.details["stderr"] == "bad command"
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("fake_aerospace")
+    async def test_hang_up_is_not_retried(self, fake_daemon, tmp_path, monkeypatch):
+        """Test that a request the daemon took but never answered is not re-run."""
+        path, requests, state, handle = fake_daemon
+        state["answer"] = {"close": True}
+        log = tmp_path / "commands.log"
+        monkeypatch.setenv("FAKE_AEROSPACE_LOG", str(log))
+        server = await asyncio.start_unix_server(handle, path)
+        async with server:
+            with pytest.raises(AeroSpaceError) as exc_info:
+                await run_aerospace_command("close")
+
+        assert exc_info.value.code == "COMMAND_FAILED"
+        assert len(requests) == 1
+        assert not log.exists()
+
+    @pytest.mark.asyncio
+    async def test_sequence_stops_at_failure(self, fake_daemon):
+        """Test that a sequence sent over the socket stops at the first failure."""
+        path, requests, state, handle = fake_daemon
+
+        async def failing_second(reader, writer):
+            if len(requests) == 1:
+                state["answer"] = {"exitCode": 2, "stdout": "", "stderr": "no", "close": False}
+            await handle(reader, writer)
+
+        server = await asyncio.start_unix_server(failing_second, path)
+        async with server:
+            with pytest.raises(AeroSpaceError) as exc_info:
+                await run_aerospace_commands(("focus", "1"), ("fail",), ("focus", "2"))
+
+        assert exc_info.value.details["stderr"] == "no"
+        assert [request["args"] for request in requests] == [["focus", "1"], ["fail"]]
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("fake_aerospace", "fake_daemon")
+    async def test_missing_socket_falls_back_to_cli(self):
+        """Test that the CLI is used when the socket cannot be connected to."""
+        stdout, _, code = await run_aerospace_command("list-monitors")
+
+        assert code == 0
+        assert stdout.splitlines()[1:] == ["list-monitors"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("fake_aerospace")
+    async def test_socket_is_opt_in(self, fake_daemon, monkeypatch):
+        """Test that the socket is not used unless enabled."""
+        path, requests, _, handle = fake_daemon
+        monkeypatch.delenv(aerospace.AEROSPACE_SOCKET_ENV)
+        server = await asyncio.start_unix_server(handle, path)
+        async with server:
+            stdout, _, _ = await run_aerospace_command("list-monitors")
+
+        assert stdout.startswith("pid ")
+        assert requests == []
+
+
+class TestRequestScope:
+    """Tests for the per-request query cache."""
+
+    @pytest.mark.asyncio
+    async def test_queries_cached_within_scope(self, mock_aerospace_command):
+        """Test that repeated queries in one scope run a single command."""
+
+        @request_scope
+        async def handler():
+            first = await list_workspaces(visible=True)
+            second = await list_workspaces(visible=True)
+            await list_workspaces(all_workspaces=True)
+            return first, second
+
+        with patch(
+            "win_ctrl_mcp.aerospace.run_aerospace_command", side_effect=mock_aerospace_command
+        ) as mock_cmd:
+            first, second = await handler()
+
+            assert first is second
+            assert mock_cmd.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_share_one_command(self, mock_aerospace_command):
+        """Test that overlapping identical queries wait on the same command."""
+
+        @request_scope
+        async def handler():
+            return await asyncio.gather(
+                list_workspaces(visible=True), list_workspaces(visible=True)
+            )
+
+        with patch(
+            "win_ctrl_mcp.aerospace.run_aerospace_command", side_effect=mock_aerospace_command
+        ) as mock_cmd:
+            first, second = await handler()
+
+            assert first is second
+            assert mock_cmd.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_mutation_invalidates_scope_cache(self, mock_aerospace_command, monkeypatch):
+        """Test that a query after a state-changing command runs again."""
+
+        @request_scope
+        async def handler():
+            await list_workspaces(visible=True)
+            monkeypatch.setattr(aerospace, "_state_generation", aerospace.state_generation() + 2)
+            await list_workspaces(visible=True)
+
+        with patch(
+            "win_ctrl_mcp.aerospace.run_aerospace_command", side_effect=mock_aerospace_command
+        ) as mock_cmd:
+            await handler()
+
+            assert mock_cmd.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_query_is_retried(self, mock_aerospace_command):
+        """Test that a failed query is not served from the cache."""
+        calls = 0
+
+        async def flaky(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise AeroSpaceError("COMMAND_FAILED", "boom")
+            return await mock_aerospace_command(*args, **kwargs)
+
+        @request_scope
+        async def handler():
+            with pytest.raises(AeroSpaceError):
+                await list_workspaces(visible=True)
+            return await list_workspaces(visible=True)
+
+        with patch("win_ctrl_mcp.aerospace.run_aerospace_command", side_effect=flaky):
+            assert await handler()
+            assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_no_caching_outside_scope(self, mock_aerospace_command):
+        """Test that queries outside a scope always run."""
+        with patch(
+            "win_ctrl_mcp.aerospace.run_aerospace_command", side_effect=mock_aerospace_command
+        ) as mock_cmd:
+            await list_workspaces(visible=True)
+            await list_workspaces(visible=True)
+
+            assert mock_cmd.await_count == 2
+
+
+class TestGetWindowById:
+    """Tests for window lookup by ID."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("mock_aerospace_command")
+    async def test_lookup(self):
+        """Test finding an existing window and missing a nonexistent one."""
+        window = await get_window_by_id(5678)
+
+        assert window is not None
+        assert window["app-name"] == "Terminal"
+        assert await get_window_by_id(9999) is None
+
+    @pytest.mark.asyncio
+    async def test_lookups_share_index_within_scope(self, mock_aerospace_command):
+        """Test that repeated lookups in one request scope list windows once."""
+
+        @request_scope
+        async def handler():
+            return await get_window_by_id(1234), await get_window_by_id(5678)
+
+        with patch(
+            "win_ctrl_mcp.aerospace.run_aerospace_command", side_effect=mock_aerospace_command
+        ) as mock_cmd:
+            first, second = await handler()
+
+            assert first["app-name"] == "Firefox"
+            assert second["app-name"] == "Terminal"
+            assert mock_cmd.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_window_ids_share_index_within_scope(self, mock_aerospace_command):
+        """Test that listing IDs after a failed lookup reuses the lookup's listing."""
+
+        @request_scope
+        async def handler():
+            return await get_window_by_id(42), await list_window_ids()
+
+        with patch(
+            "win_ctrl_mcp.aerospace.run_aerospace_command", side_effect=mock_aerospace_command
+        ) as mock_cmd:
+            window, ids = await handler()
+
+            assert window is None
+            assert ids == [1234, 5678]
+            assert mock_cmd.await_count == 1
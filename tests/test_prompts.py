@@ -1,6 +1,10 @@
 """Tests for MCP prompts."""
 
-from win_ctrl_mcp.prompts import PROMPTS
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from win_ctrl_mcp.prompts import PROMPTS, PromptArg, PromptSpec, load_template
 
 
 class TestPromptDefinitions:
@@ -10,72 +14,88 @@ class TestPromptDefinitions:
         """Test that organize_windows prompt is defined."""
         assert "organize_windows" in PROMPTS
         prompt = PROMPTS["organize_windows"]
-        assert "description" in prompt
-        assert "template" in prompt
-        assert "arguments" in prompt
+        assert prompt.description
+        assert prompt.template
+        assert prompt.arguments
 
     def test_smart_focus_prompt_exists(self):
         """Test that smart_focus prompt is defined."""
         assert "smart_focus" in PROMPTS
         prompt = PROMPTS["smart_focus"]
-        assert "description" in prompt
-        assert "template" in prompt
-        assert "arguments" in prompt
+        assert prompt.description
+        assert prompt.template
+        assert prompt.arguments
         # Smart focus should have multiple arguments
-        assert len(prompt["arguments"]) >= 3
+        assert len(prompt.arguments) >= 3
 
     def test_presentation_layout_prompt_exists(self):
         """Test that presentation_layout prompt is defined."""
         assert "presentation_layout" in PROMPTS
         prompt = PROMPTS["presentation_layout"]
-        assert "description" in prompt
-        assert "template" in prompt
-        assert "arguments" in prompt
+        assert prompt.description
+        assert prompt.template
+        assert prompt.arguments
 
     def test_debug_app_gui_prompt_exists(self):
         """Test that debug_app_gui prompt is defined."""
         assert "debug_app_gui" in PROMPTS
         prompt = PROMPTS["debug_app_gui"]
-        assert "description" in prompt
-        assert "template" in prompt
-        assert "arguments" in prompt
+        assert prompt.description
+        assert prompt.template
+        assert prompt.arguments
 
     def test_all_prompts_have_required_fields(self):
         """Test that all prompts have required fields."""
-        required_fields = ["description", "template", "arguments"]
-
         for name, prompt in PROMPTS.items():
-            for field in required_fields:
-                assert field in prompt, f"Prompt '{name}' missing field '{field}'"
+            assert isinstance(prompt, PromptSpec), f"Prompt '{name}' is not a PromptSpec"
+            assert prompt.description, f"Prompt '{name}' missing description"
+            assert prompt.template, f"Prompt '{name}' missing template"
 
     def test_prompt_arguments_have_required_fields(self):
         """Test that prompt arguments have required fields."""
         for name, prompt in PROMPTS.items():
-            for arg in prompt["arguments"]:
-                assert "name" in arg, f"Argument in '{name}' missing 'name'"
-                assert "description" in arg, f"Argument in '{name}' missing 'description'"
-                assert "required" in arg, f"Argument in '{name}' missing 'required'"
+            for arg in prompt.arguments:
+                assert isinstance(arg, PromptArg), f"Argument in '{name}' is not a PromptArg"
+                assert arg.name, f"Argument in '{name}' missing 'name'"
+                assert arg.description, f"Argument in '{name}' missing 'description'"
+                assert isinstance(arg.required, bool)
+
+    def test_prompts_are_read_only(self):
+        """Test that prompt definitions cannot be mutated."""
+        with pytest.raises(TypeError):
+            PROMPTS["new_prompt"] = PROMPTS["organize_windows"]  # type: ignore[index]
+        with pytest.raises(FrozenInstanceError):
+            PROMPTS["organize_windows"].description = ""  # type: ignore[misc]
+
+    def test_templates_loaded_once(self):
+        """Test that templates are read from package data and cached."""
+        load_template.cache_clear()
+        first = PROMPTS["smart_focus"].template
+        second = PROMPTS["smart_focus"].template
+
+        assert first is second
+        assert load_template.cache_info().misses == 1
 
     def test_organize_windows_template_content(self):
         """Test organize_windows template has expected content."""
-        template = PROMPTS["organize_windows"]["template"]
+        template = PROMPTS["organize_windows"].template
         assert "window management tools" in template.lower()
         assert "aerospace://windows" in template
 
     def test_smart_focus_template_content(self):
         """Test smart_focus template has expected content."""
-        template = PROMPTS["smart_focus"]["template"]
+        template = PROMPTS["smart_focus"].template
         assert "display" in template.lower()
         assert "focus" in template.lower()
 
     def test_presentation_layout_template_content(self):
         """Test presentation_layout template has expected content."""
-        template = PROMPTS["presentation_layout"]["template"]
+        template = PROMPTS["presentation_layout"].template
         assert "presentation" in template.lower()
         assert "fullscreen" in template.lower()
 
     def test_debug_app_gui_template_content(self):
         """Test debug_app_gui template has expected content."""
-        template = PROMPTS["debug_app_gui"]["template"]
+        template = PROMPTS["debug_app_gui"].template
         assert "capture" in template.lower()
         assert "debug" in template.lower()
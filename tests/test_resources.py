@@ -1,7 +1,5 @@
 """Tests for MCP resources."""
 
-from unittest.mock import AsyncMock, patch
-
 import pytest
 
 from win_ctrl_mcp.aerospace import AeroSpaceError
@@ -22,240 +20,270 @@ class TestWindowsResource:
     """Tests for windows resource."""
 
     @pytest.mark.asyncio
-    async def test_get_windows(self, mock_window_list):
+    async def test_get_windows(self, patch_async, mock_window_list):
         """Test getting all windows."""
-        with patch("win_ctrl_mcp.resources.list_windows", new_callable=AsyncMock) as mock_list:
-            mock_list.return_value = mock_window_list
+        patch_async(
+            "win_ctrl_mcp.resources",
+            list_windows=mock_window_list,
+            get_focused_window=mock_window_list[0],
+        )
+
+        result = await get_windows_resource()
 
-            with patch(
-                "win_ctrl_mcp.resources.get_focused_window", new_callable=AsyncMock
-            ) as mock_focused:
-                mock_focused.return_value = mock_window_list[0]
+        assert "windows" in result
+        assert "total_count" in result
+        assert result["total_count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_focused_window_queried_once(self, patch_async, mock_window_list):
+        """Test that the focused window is looked up once, not per window."""
+        mocks = patch_async(
+            "win_ctrl_mcp.resources",
+            list_windows=mock_window_list,
+            get_focused_window=mock_window_list[1],
+        )
 
-                result = await get_windows_resource()
+        result = await get_windows_resource()
 
-                assert "windows" in result
-                assert "total_count" in result
-                assert result["total_count"] == 3
+        mocks["get_focused_window"].assert_awaited_once()
+        assert [w["is_focused"] for w in result["windows"]] == [False, True, False]
 
 
 class TestWindowResource:
     """Tests for single window resource."""
 
     @pytest.mark.asyncio
-    async def test_get_existing_window(self, mock_window_list):
+    async def test_get_existing_window(self, patch_async, mock_window_list):
         """Test getting an existing window."""
-        with patch("win_ctrl_mcp.resources.list_windows", new_callable=AsyncMock) as mock_list:
-            mock_list.return_value = mock_window_list
-
-            with patch(
-                "win_ctrl_mcp.resources.get_focused_window", new_callable=AsyncMock
-            ) as mock_focused:
-                mock_focused.return_value = mock_window_list[0]
-
-                result = await get_window_resource(1234)
-
-                assert result["window_id"] == 1234
-                assert result["app_name"] == "Firefox"
+        patch_async(
+            "win_ctrl_mcp.resources",
+            list_windows=mock_window_list,
+            get_focused_window=mock_window_list[0],
+        )
 
-    @pytest.mark.asyncio
-    async def test_get_nonexistent_window(self, mock_window_list):
-        """Test error for non-existent window."""
-        with patch("win_ctrl_mcp.resources.list_windows", new_callable=AsyncMock) as mock_list:
-            mock_list.return_value = mock_window_list
-
-            with pytest.raises(AeroSpaceError) as exc_info:
-                await get_window_resource(9999)
+        result = await get_window_resource(1234)
 
-            assert "WINDOW_NOT_FOUND" in exc_info.value.code
+        assert result["window_id"] == 1234
+        assert result["app_name"] == "Firefox"
 
 
 class TestWorkspacesResource:
     """Tests for workspaces resource."""
 
     @pytest.mark.asyncio
-    async def test_get_workspaces(self, mock_workspace_list):
+    async def test_get_workspaces(self, patch_async, mock_workspace_list):
         """Test getting all workspaces."""
-        with patch("win_ctrl_mcp.resources.list_workspaces", new_callable=AsyncMock) as mock_list:
-            mock_list.return_value = mock_workspace_list
+        patch_async(
+            "win_ctrl_mcp.resources",
+            list_workspaces=mock_workspace_list,
+            list_windows=[],
+            get_focused_workspace=mock_workspace_list[0],
+        )
 
-            with patch("win_ctrl_mcp.resources.list_windows", new_callable=AsyncMock) as mock_win:
-                mock_win.return_value = []
+        result = await get_workspaces_resource()
 
-                with patch(
-                    "win_ctrl_mcp.resources.get_focused_workspace", new_callable=AsyncMock
-                ) as mock_focused:
-                    mock_focused.return_value = mock_workspace_list[0]
+        assert "workspaces" in result
+        assert "total_count" in result
+        assert result["total_count"] == 3
 
-                    result = await get_workspaces_resource()
-
-                    assert "workspaces" in result
-                    assert "total_count" in result
-                    assert result["total_count"] == 3
+    @pytest.mark.asyncio
+    async def test_shared_state_queried_once(
+        self, patch_async, mock_workspace_list, mock_window_list
+    ):
+        """Test that windows, focus and visibility are fetched once for all workspaces."""
+        mocks = patch_async(
+            "win_ctrl_mcp.resources",
+            list_workspaces=None,
+            list_windows=mock_window_list,
+            get_focused_workspace=mock_workspace_list[0],
+        )
+        mocks["list_workspaces"].side_effect = lambda **kwargs: (
+            mock_workspace_list[:1] if kwargs.get("visible") else mock_workspace_list
+        )
+
+        result = await get_workspaces_resource()
+
+        mocks["list_windows"].assert_awaited_once()
+        mocks["get_focused_workspace"].assert_awaited_once()
+        assert mocks["list_workspaces"].await_count == 2
+        counts = {ws["name"]: ws["window_count"] for ws in result["workspaces"]}
+        assert counts == {"1": 2, "2": 0, "dev": 1}
+        assert [ws["is_visible"] for ws in result["workspaces"]] == [True, False, False]
 
 
 class TestWorkspaceResource:
     """Tests for single workspace resource."""
 
     @pytest.mark.asyncio
-    async def test_get_existing_workspace(self, mock_workspace_list, mock_window_list):
+    async def test_get_existing_workspace(self, patch_async, mock_workspace_list, mock_window_list):
         """Test getting an existing workspace."""
-        with patch("win_ctrl_mcp.resources.list_workspaces", new_callable=AsyncMock) as mock_list:
-            mock_list.return_value = mock_workspace_list
-
-            with patch("win_ctrl_mcp.resources.list_windows", new_callable=AsyncMock) as mock_win:
-                mock_win.return_value = mock_window_list[:2]
-
-                with patch(
-                    "win_ctrl_mcp.resources.get_focused_workspace", new_callable=AsyncMock
-                ) as mock_focused:
-                    mock_focused.return_value = mock_workspace_list[0]
-
-                    result = await get_workspace_resource("1")
+        patch_async(
+            "win_ctrl_mcp.resources",
+            list_workspaces=mock_workspace_list,
+            list_windows=mock_window_list[:2],
+            get_focused_workspace=mock_workspace_list[0],
+        )
 
-                    assert result["name"] == "1"
-                    assert len(result["windows"]) == 2
+        result = await get_workspace_resource("1")
 
-    @pytest.mark.asyncio
-    async def test_get_nonexistent_workspace(self, mock_workspace_list):
-        """Test error for non-existent workspace."""
-        with patch("win_ctrl_mcp.resources.list_workspaces", new_callable=AsyncMock) as mock_list:
-            mock_list.return_value = mock_workspace_list
-
-            with pytest.raises(AeroSpaceError) as exc_info:
-                await get_workspace_resource("nonexistent")
-
-            assert "WORKSPACE_NOT_FOUND" in exc_info.value.code
+        assert result["name"] == "1"
+        assert len(result["windows"]) == 2
 
 
 class TestMonitorsResource:
     """Tests for monitors resource."""
 
     @pytest.mark.asyncio
-    async def test_get_monitors(self, mock_monitor_list, mock_workspace_list):
+    async def test_get_monitors(self, patch_async, mock_monitor_list, mock_workspace_list):
         """Test getting all monitors."""
-        with patch("win_ctrl_mcp.resources.list_monitors", new_callable=AsyncMock) as mock_mon:
-            mock_mon.return_value = mock_monitor_list
+        patch_async(
+            "win_ctrl_mcp.resources",
+            list_monitors=mock_monitor_list,
+            list_workspaces=mock_workspace_list,
+        )
 
-            with patch("win_ctrl_mcp.resources.list_workspaces", new_callable=AsyncMock) as mock_ws:
-                mock_ws.return_value = mock_workspace_list
+        result = await get_monitors_resource()
 
-                result = await get_monitors_resource()
+        assert "monitors" in result
+        assert "total_count" in result
+        assert result["total_count"] == 2
 
-                assert "monitors" in result
-                assert "total_count" in result
-                assert result["total_count"] == 2
+    @pytest.mark.asyncio
+    async def test_visible_workspaces_queried_once(
+        self, patch_async, mock_monitor_list, mock_workspace_list
+    ):
+        """Test that visible workspaces are fetched once for all monitors."""
+        mocks = patch_async(
+            "win_ctrl_mcp.resources", list_monitors=mock_monitor_list, list_workspaces=None
+        )
+        mocks["list_workspaces"].side_effect = lambda **kwargs: (
+            [mock_workspace_list[0], mock_workspace_list[2]]
+            if kwargs.get("visible")
+            else mock_workspace_list
+        )
+
+        result = await get_monitors_resource()
+
+        assert mocks["list_workspaces"].await_count == 2
+        assert [m["focused_workspace"] for m in result["monitors"]] == ["1", "dev"]
+        assert [m["workspaces"] for m in result["monitors"]] == [["1", "2"], ["dev"]]
 
 
 class TestTreeResource:
     """Tests for tree resource."""
 
     @pytest.mark.asyncio
-    async def test_get_tree(self, mock_workspace_list, mock_window_list):
+    async def test_get_tree(self, patch_async, mock_workspace_list, mock_window_list):
         """Test getting window tree."""
-        with patch(
-            "win_ctrl_mcp.resources.run_aerospace_command", new_callable=AsyncMock
-        ) as mock_cmd:
-            mock_cmd.return_value = ("", "", 0)
+        mocks = patch_async("win_ctrl_mcp.aerospace", run_aerospace_command=("", "", 0))
+        patch_async(
+            "win_ctrl_mcp.resources",
+            get_focused_workspace=mock_workspace_list[0],
+            list_windows=mock_window_list[:2],
+        )
 
-            with patch(
-                "win_ctrl_mcp.resources.get_focused_workspace", new_callable=AsyncMock
-            ) as mock_ws:
-                mock_ws.return_value = mock_workspace_list[0]
+        result = await get_tree_resource()
 
-                with patch(
-                    "win_ctrl_mcp.resources.list_windows", new_callable=AsyncMock
-                ) as mock_win:
-                    mock_win.return_value = mock_window_list[:2]
-
-                    result = await get_tree_resource()
-
-                    assert "tree" in result
-                    assert result["tree"]["type"] == "workspace"
-                    assert "children" in result["tree"]
+        assert "tree" in result
+        assert result["tree"]["type"] == "workspace"
+        assert "children" in result["tree"]
+        assert len(result["tree"]["children"]) == 2
+        mocks["run_aerospace_command"].assert_not_awaited()
 
 
 class TestFocusedResource:
     """Tests for focused resource."""
 
     @pytest.mark.asyncio
-    async def test_get_focused(self, mock_window_list, mock_workspace_list, mock_monitor_list):
+    async def test_get_focused(
+        self, patch_async, mock_window_list, mock_workspace_list, mock_monitor_list
+    ):
         """Test getting focused state."""
-        with patch("win_ctrl_mcp.resources.get_focused_window", new_callable=AsyncMock) as mock_win:
-            mock_win.return_value = mock_window_list[0]
-
-            with patch(
-                "win_ctrl_mcp.resources.get_focused_workspace", new_callable=AsyncMock
-            ) as mock_ws:
-                mock_ws.return_value = mock_workspace_list[0]
+        patch_async(
+            "win_ctrl_mcp.resources",
+            get_focused_window=mock_window_list[0],
+            get_focused_workspace=mock_workspace_list[0],
+            get_focused_monitor=mock_monitor_list[0],
+            list_windows=mock_window_list[:2],
+        )
 
-                with patch(
-                    "win_ctrl_mcp.resources.get_focused_monitor", new_callable=AsyncMock
-                ) as mock_mon:
-                    mock_mon.return_value = mock_monitor_list[0]
+        result = await get_focused_resource()
 
-                    with patch(
-                        "win_ctrl_mcp.resources.list_windows", new_callable=AsyncMock
-                    ) as mock_list_win:
-                        mock_list_win.return_value = mock_window_list[:2]
-
-                        result = await get_focused_resource()
-
-                        assert "window" in result
-                        assert "workspace" in result
-                        assert "monitor" in result
-                        assert result["window"]["window_id"] == 1234
+        assert "window" in result
+        assert "workspace" in result
+        assert "monitor" in result
+        assert result["window"]["window_id"] == 1234
 
 
 class TestDisplaysResource:
     """Tests for displays resource."""
 
     @pytest.mark.asyncio
-    async def test_get_displays(self, mock_workspace_list):
+    async def test_get_displays(self, patch_async, mock_workspace_list):
         """Test getting displays."""
-        with patch("win_ctrl_mcp.resources.get_display_info", new_callable=AsyncMock) as mock_info:
-            mock_info.return_value = {
+        patch_async(
+            "win_ctrl_mcp.resources",
+            get_display_info={
                 "displays": [
                     {"id": 1, "name": "Display 1"},
                     {"id": 2, "name": "Display 2"},
                 ],
                 "category": "dual_display",
-            }
+            },
+            list_workspaces=mock_workspace_list,
+        )
 
-            with patch("win_ctrl_mcp.resources.list_workspaces", new_callable=AsyncMock) as mock_ws:
-                mock_ws.return_value = mock_workspace_list
+        result = await get_displays_resource()
 
-                result = await get_displays_resource()
-
-                assert "displays" in result
-                assert len(result["displays"]) == 2
+        assert "displays" in result
+        assert len(result["displays"]) == 2
 
 
 class TestDisplayResource:
     """Tests for single display resource."""
 
     @pytest.mark.asyncio
-    async def test_get_existing_display(self):
+    async def test_get_existing_display(self, patch_const):
         """Test getting an existing display."""
-        with patch("win_ctrl_mcp.resources.get_display_by_id", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = {"id": 1, "name": "Display 1"}
-
-            result = await get_display_resource(1)
-
-            assert result["id"] == 1
-
+        patch_const("win_ctrl_mcp.resources", get_display_by_id={"id": 1, "name": "Display 1"})
+
+        result = await get_display_resource(1)
+
+        assert result["id"] == 1
+
+
+class TestNotFound:
+    """Tests for resources asked for an unknown ID or name."""
+
+    @pytest.mark.parametrize(
+        ("patches", "read", "code"),
+        [
+            pytest.param(
+                {"list_windows": [{"window-id": 1234}]},
+                lambda: get_window_resource(9999),
+                "WINDOW_NOT_FOUND",
+                id="window",
+            ),
+            pytest.param(
+                {"list_workspaces": [{"workspace": "1"}]},
+                lambda: get_workspace_resource("nonexistent"),
+                "WORKSPACE_NOT_FOUND",
+                id="workspace",
+            ),
+            pytest.param(
+                {"get_display_by_id": None, "get_display_info": {"displays": [{"id": 1}]}},
+                lambda: get_display_resource(999),
+                "DISPLAY_NOT_FOUND",
+                id="display",
+            ),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_get_nonexistent_display(self):
-        """Test error for non-existent display."""
-        with patch("win_ctrl_mcp.resources.get_display_by_id", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = None
-
-            with patch(
-                "win_ctrl_mcp.resources.get_display_info", new_callable=AsyncMock
-            ) as mock_info:
-                mock_info.return_value = {"displays": [{"id": 1}]}
+    async def test_not_found(self, patch_const, patches, read, code):
+        """Test that an unknown ID or name raises the matching error code."""
+        patch_const("win_ctrl_mcp.resources", **patches)
 
-                with pytest.raises(AeroSpaceError) as exc_info:
-                    await get_display_resource(999)
+        with pytest.raises(AeroSpaceError) as exc_info:
+            await read()
 
-                assert "DISPLAY_NOT_FOUND" in exc_info.value.code
+        assert exc_info.value.code == code
@@ -1,9 +1,32 @@
 """Tests for MCP server module."""
 
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastmcp import Client
+
+from win_ctrl_mcp import aerospace
 from win_ctrl_mcp.aerospace import AeroSpaceError
-from win_ctrl_mcp.server import handle_error, mcp
+from win_ctrl_mcp.server import _resource_cache, handle_error, mcp
+
+
+@pytest.fixture(autouse=True)
+def clear_resource_cache():
+    """Start every test with an empty resource cache."""
+    _resource_cache.clear()
+    yield
+    _resource_cache.clear()
 
 
+async def read_resource(uri: str) -> dict:
+    """Read a resource through an in-memory client and decode its JSON body."""
+    async with Client(mcp) as client:
+        contents = await client.read_resource(uri)
+    return json.loads(contents[0].text)
+
+
+@pytest.mark.fast
 class TestMCPServer:
     """Tests for MCP server setup."""
 
@@ -12,23 +35,22 @@ class TestMCPServer:
         assert mcp is not None
         assert mcp.name == "AeroSpace Window Manager"
 
-    def test_mcp_server_has_tools(self):
-        """Test that MCP server has registered tools."""
-        # FastMCP stores tools in _tool_manager
-        # We can check that tools were registered by checking the server exists
-        assert hasattr(mcp, "_tool_manager") or hasattr(mcp, "tools")
-
-    def test_mcp_server_has_resources(self):
-        """Test that MCP server has registered resources."""
-        # Resources are registered via decorators
-        assert hasattr(mcp, "_resource_manager") or hasattr(mcp, "resources")
-
-    def test_mcp_server_has_prompts(self):
-        """Test that MCP server has registered prompts."""
-        # Prompts are registered via decorators
-        assert hasattr(mcp, "_prompt_manager") or hasattr(mcp, "prompts")
+    @pytest.mark.parametrize(
+        "attrs",
+        [
+            ("_tool_manager", "tools"),
+            ("_resource_manager", "resources"),
+            ("_prompt_manager", "prompts"),
+        ],
+        ids=["tools", "resources", "prompts"],
+    )
+    def test_mcp_server_registers(self, attrs):
+        """Test that MCP server has its tool, resource and prompt registries."""
+        # FastMCP keeps registrations in per-kind managers
+        assert any(hasattr(mcp, attr) for attr in attrs)
 
 
+@pytest.mark.fast
 class TestHandleError:
     """Tests for error handling."""
 
@@ -62,3 +84,91 @@ class TestHandleError:
         result = handle_error(error)
 
         assert result["error"]["details"] == {}
+
+
+class TestResourceCache:
+    """Tests for short-lived caching of resource bodies."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_are_cached(self):
+        """Test that back-to-back reads reuse the serialized body."""
+        with patch("win_ctrl_mcp.server.get_windows_resource", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = {"windows": [], "total_count": 0}
+
+            first = await read_resource("aerospace://windows")
+            second = await read_resource("aerospace://windows")
+
+            assert first == second == {"windows": [], "total_count": 0}
+            mock_get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_mutation_invalidates_cache(self, monkeypatch):
+        """Test that a state-changing command forces a fresh read."""
+        with patch("win_ctrl_mcp.server.get_windows_resource", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = {"windows": [], "total_count": 0}
+
+            await read_resource("aerospace://windows")
+            monkeypatch.setattr(aerospace, "_state_generation", aerospace.state_generation() + 1)
+            await read_resource("aerospace://windows")
+
+            assert mock_get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_template_resources_cached_per_parameter(self):
+        """Test that templated resources are cached separately per parameter."""
+        with patch("win_ctrl_mcp.server.get_window_resource", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = lambda window_id: {"window_id": window_id}
+
+            assert (await read_resource("aerospace://windows/1"))["window_id"] == 1
+            assert (await read_resource("aerospace://windows/2"))["window_id"] == 2
+            assert (await read_resource("aerospace://windows/1"))["window_id"] == 1
+
+            assert mock_get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_dropped(self, monkeypatch):
+        """Test that entries and locks for parameters no longer read are not kept."""
+        monkeypatch.setattr(_resource_cache, "ttl", 0.0)
+        with patch("win_ctrl_mcp.server.get_window_resource", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = lambda window_id: {"window_id": window_id}
+
+            for window_id in range(1, 6):
+                await read_resource(f"aerospace://windows/{window_id}")
+
+        assert len(_resource_cache._entries) == 1
+        assert not _resource_cache._locks
+
+    @pytest.mark.asyncio
+    async def test_error_body(self):
+        """Test that resource errors are returned as a JSON error body."""
+        with patch("win_ctrl_mcp.server.get_window_resource", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = AeroSpaceError("WINDOW_NOT_FOUND", "Window not found", {})
+
+            result = await read_resource("aerospace://windows/999")
+
+            assert result["success"] is False
+            assert result["error"]["code"] == "WINDOW_NOT_FOUND"
+
+
+class TestToolErrors:
+    """Tests for error handling shared by all tools."""
+
+    @pytest.mark.asyncio
+    async def test_tool_error_returned_as_dict(self):
+        """Test that a failing tool returns its error as a result."""
+        async with Client(mcp) as client:
+            result = await client.call_tool("tool_focus_window", {})
+
+        assert result.structured_content["success"] is False
+        assert result.structured_content["error"]["code"] == "INVALID_PARAMETERS"
+
+    @pytest.mark.asyncio
+    async def test_tool_schema_keeps_parameter_descriptions(self):
+        """Test that tool parameters keep their annotated descriptions."""
+        async with Client(mcp) as client:
+            tools = {tool.name: tool for tool in await client.list_tools()}
+
+        schema = tools["tool_focus_monitor"].inputSchema
+        assert schema["properties"]["target"]["description"] == (
+            "Monitor identifier: direction, name, or pattern"
+        )
@@ -1,181 +1,227 @@
 """Tests for capture tools."""
 
 import os
-import tempfile
-from unittest.mock import AsyncMock, patch
+import shutil
 
 import pytest
 
 from win_ctrl_mcp.aerospace import AeroSpaceError
-from win_ctrl_mcp.tools.capture import capture_window, capture_workspace
+from win_ctrl_mcp.tools.capture import (
+    _run_screencapture,
+    capture_window,
+    capture_workspace,
+)
+
+FAKE_SCREENCAPTURE = """#!/bin/sh
+for last in "$@"; do :; done
+if [ "$1" = "-fail" ]; then
+  echo "could not create image" >&2
+  exit 1
+fi
+printf '%s\\n' "$@" > "$last"
+"""
+
+
+@pytest.fixture
+def fake_screencapture(tmp_path, monkeypatch):
+    """Put a fake screencapture utility on PATH."""
+    script = tmp_path / "screencapture"
+    script.write_text(FAKE_SCREENCAPTURE)
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ.get('PATH', '')}")
+    return tmp_path
+
+
+@pytest.fixture
+def capture_mocks(patch_async, mock_window_list):
+    """Patch the window lookups and screencapture run used by capture_window.
+
+    The first sample window is focused, no window is found by ID until a test
+    sets the lookup's return_value, and captures succeed without running
+    screencapture.
+    """
+    return patch_async(
+        "win_ctrl_mcp.tools.capture",
+        get_focused_window=mock_window_list[0],
+        get_window_by_id=None,
+        _run_screencapture=None,
+    )
 
 
 class TestCaptureWindow:
     """Tests for capture_window tool."""
 
     @pytest.mark.asyncio
-    async def test_capture_focused_window(self, mock_window_list):
+    @pytest.mark.usefixtures("capture_mocks")
+    async def test_capture_focused_window(self):
         """Test capturing the focused window."""
-        with patch(
-            "win_ctrl_mcp.tools.capture.get_focused_window", new_callable=AsyncMock
-        ) as mock_focused:
-            mock_focused.return_value = mock_window_list[0]
+        result = await capture_window()
 
-            with patch("win_ctrl_mcp.tools.capture._run_screencapture", new_callable=AsyncMock):
-                result = await capture_window()
-
-                assert result["success"] is True
-                assert result["capture"]["window_id"] == 1234
-                assert result["capture"]["app_name"] == "Firefox"
-                assert result["capture"]["format"] == "png"
+        assert result["success"] is True
+        assert result["capture"]["window_id"] == 1234
+        assert result["capture"]["app_name"] == "Firefox"
+        assert result["capture"]["format"] == "png"
 
     @pytest.mark.asyncio
-    async def test_capture_specific_window(self, mock_window_list):
+    async def test_capture_specific_window(self, capture_mocks, mock_window_list):
         """Test capturing a specific window by ID."""
-        with patch(
-            "win_ctrl_mcp.tools.capture.get_window_by_id", new_callable=AsyncMock
-        ) as mock_get:
-            mock_get.return_value = mock_window_list[1]
+        capture_mocks["get_window_by_id"].return_value = mock_window_list[1]
 
-            with patch("win_ctrl_mcp.tools.capture._run_screencapture", new_callable=AsyncMock):
-                result = await capture_window(window_id=5678)
+        result = await capture_window(window_id=5678)
 
-                assert result["success"] is True
-                assert result["capture"]["window_id"] == 5678
-                assert result["capture"]["app_name"] == "Terminal"
+        assert result["success"] is True
+        assert result["capture"]["window_id"] == 5678
+        assert result["capture"]["app_name"] == "Terminal"
 
     @pytest.mark.asyncio
-    async def test_capture_with_custom_path(self, mock_window_list):
+    @pytest.mark.usefixtures("capture_mocks")
+    async def test_capture_with_custom_path(self, tmp_path_factory):
         """Test capturing to a custom output path."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, "test.png")
+        # screencapture is mocked, so nothing is written and nothing needs cleaning up
+        output_path = str(tmp_path_factory.mktemp("capture") / "test.png")
+
+        result = await capture_window(output_path=output_path)
 
-            with patch(
-                "win_ctrl_mcp.tools.capture.get_focused_window", new_callable=AsyncMock
-            ) as mock_focused:
-                mock_focused.return_value = mock_window_list[0]
+        assert result["success"] is True
+        assert result["capture"]["file_path"] == output_path
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("capture_mocks")
+    async def test_capture_creates_output_directory(self, tmp_path):
+        """Test that a missing directory for a custom path is created."""
+        output_path = str(tmp_path / "shots" / "window.png")
 
-                with patch("win_ctrl_mcp.tools.capture._run_screencapture", new_callable=AsyncMock):
-                    result = await capture_window(output_path=output_path)
+        await capture_window(output_path=output_path)
 
-                    assert result["success"] is True
-                    assert result["capture"]["file_path"] == output_path
+        assert (tmp_path / "shots").is_dir()
 
     @pytest.mark.asyncio
-    async def test_capture_jpg_format(self, mock_window_list):
-        """Test capturing in JPG format."""
-        with patch(
-            "win_ctrl_mcp.tools.capture.get_focused_window", new_callable=AsyncMock
-        ) as mock_focused:
-            mock_focused.return_value = mock_window_list[0]
+    @pytest.mark.usefixtures("capture_mocks")
+    async def test_capture_recreates_removed_directory(self, tmp_path):
+        """Test that an output directory removed after a capture is created again."""
+        output_path = str(tmp_path / "shots" / "window.png")
+        await capture_window(output_path=output_path)
+        shutil.rmtree(tmp_path / "shots")
 
-            with patch("win_ctrl_mcp.tools.capture._run_screencapture", new_callable=AsyncMock):
-                result = await capture_window(format="jpg")
+        await capture_window(output_path=output_path)
 
-                assert result["success"] is True
-                assert result["capture"]["format"] == "jpg"
+        assert (tmp_path / "shots").is_dir()
 
     @pytest.mark.asyncio
-    async def test_capture_invalid_format(self, mock_window_list):
-        """Test that invalid format raises error."""
-        with patch(
-            "win_ctrl_mcp.tools.capture.get_focused_window", new_callable=AsyncMock
-        ) as mock_focused:
-            mock_focused.return_value = mock_window_list[0]
+    @pytest.mark.usefixtures("capture_mocks")
+    async def test_capture_jpg_format(self):
+        """Test capturing in JPG format."""
+        result = await capture_window(format="jpg")
 
-            with pytest.raises(AeroSpaceError) as exc_info:
-                await capture_window(format="bmp")
+        assert result["success"] is True
+        assert result["capture"]["format"] == "jpg"
 
-            assert "Invalid format" in str(exc_info.value)
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("capture_mocks")
+    async def test_capture_invalid_format(self):
+        """Test that invalid format raises error."""
+        with pytest.raises(AeroSpaceError) as exc_info:
+            await capture_window(format="bmp")
+
+        assert "Invalid format" in str(exc_info.value)
+        assert exc_info.value.details["valid_options"] == ["jpeg", "jpg", "pdf", "png"]
 
     @pytest.mark.asyncio
-    async def test_capture_no_focused_window(self):
+    async def test_capture_no_focused_window(self, capture_mocks):
         """Test error when no window is focused."""
-        with patch(
-            "win_ctrl_mcp.tools.capture.get_focused_window", new_callable=AsyncMock
-        ) as mock_focused:
-            mock_focused.return_value = None
+        capture_mocks["get_focused_window"].return_value = None
 
-            with pytest.raises(AeroSpaceError) as exc_info:
-                await capture_window()
+        with pytest.raises(AeroSpaceError) as exc_info:
+            await capture_window()
 
-            assert "NO_WINDOW_FOCUSED" in exc_info.value.code
+        assert "NO_WINDOW_FOCUSED" in exc_info.value.code
 
 
 class TestCaptureWorkspace:
     """Tests for capture_workspace tool."""
 
     @pytest.mark.asyncio
-    async def test_capture_focused_workspace(self, mock_workspace_list, mock_monitor_list):
+    async def test_capture_focused_workspace(
+        self, patch_async, mock_workspace_list, mock_monitor_list
+    ):
         """Test capturing the focused workspace."""
-        with patch(
-            "win_ctrl_mcp.tools.capture.get_focused_workspace", new_callable=AsyncMock
-        ) as mock_ws:
-            mock_ws.return_value = mock_workspace_list[0]
-
-            with patch(
-                "win_ctrl_mcp.tools.capture.get_focused_monitor", new_callable=AsyncMock
-            ) as mock_mon:
-                mock_mon.return_value = mock_monitor_list[0]
-
-                with patch(
-                    "win_ctrl_mcp.tools.capture.list_monitors", new_callable=AsyncMock
-                ) as mock_mons:
-                    mock_mons.return_value = mock_monitor_list
-
-                    with patch(
-                        "win_ctrl_mcp.tools.capture.list_windows", new_callable=AsyncMock
-                    ) as mock_win:
-                        mock_win.return_value = []
-
-                        with patch(
-                            "win_ctrl_mcp.tools.capture._run_screencapture",
-                            new_callable=AsyncMock,
-                        ):
-                            result = await capture_workspace()
-
-                            assert result["success"] is True
-                            assert result["capture"]["workspace"] == "1"
+        patch_async(
+            "win_ctrl_mcp.tools.capture",
+            get_focused_workspace=mock_workspace_list[0],
+            get_focused_monitor=mock_monitor_list[0],
+            list_monitors=mock_monitor_list,
+            list_windows=[],
+            _run_screencapture=None,
+        )
+
+        result = await capture_workspace()
+
+        assert result["success"] is True
+        assert result["capture"]["workspace"] == "1"
 
     @pytest.mark.asyncio
     async def test_capture_specific_workspace(
-        self,
-        mock_workspace_list,  # noqa: ARG002
-        mock_monitor_list,
-        mock_window_list,  # noqa: ARG002
+        self, patch_async, mock_monitor_list, mock_window_list
     ):
         """Test capturing a specific workspace."""
-        with patch(
-            "win_ctrl_mcp.aerospace.run_aerospace_command", new_callable=AsyncMock
-        ) as mock_cmd:
-            mock_cmd.return_value = ("", "", 0)
-
-            with patch(
-                "win_ctrl_mcp.tools.capture.get_focused_workspace", new_callable=AsyncMock
-            ) as mock_ws:
-                mock_ws.return_value = {"workspace": "dev"}
-
-                with patch(
-                    "win_ctrl_mcp.tools.capture.get_focused_monitor", new_callable=AsyncMock
-                ) as mock_mon:
-                    mock_mon.return_value = mock_monitor_list[1]
-
-                    with patch(
-                        "win_ctrl_mcp.tools.capture.list_monitors", new_callable=AsyncMock
-                    ) as mock_mons:
-                        mock_mons.return_value = mock_monitor_list
-
-                        with patch(
-                            "win_ctrl_mcp.tools.capture.list_windows", new_callable=AsyncMock
-                        ) as mock_win:
-                            mock_win.return_value = [mock_window_list[2]]
-
-                            with patch(
-                                "win_ctrl_mcp.tools.capture._run_screencapture",
-                                new_callable=AsyncMock,
-                            ):
-                                result = await capture_workspace(workspace="dev")
-
-                                assert result["success"] is True
-                                assert result["capture"]["workspace"] == "dev"
-                                assert len(result["capture"]["windows_captured"]) == 1
+        patch_async("win_ctrl_mcp.aerospace", run_aerospace_command=("", "", 0))
+        mocks = patch_async(
+            "win_ctrl_mcp.tools.capture",
+            get_focused_workspace={"workspace": "dev"},
+            get_focused_monitor=mock_monitor_list[1],
+            list_monitors=mock_monitor_list,
+            list_windows=[mock_window_list[2]],
+            _run_screencapture=None,
+        )
+
+        result = await capture_workspace(workspace="dev")
+
+        assert result["success"] is True
+        assert result["capture"]["workspace"] == "dev"
+        assert len(result["capture"]["windows_captured"]) == 1
+        # The named workspace is used without asking for focus
+        mocks["get_focused_workspace"].assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_jpeg_encoded_by_screencapture(
+        self, patch_async, mock_workspace_list, mock_monitor_list, tmp_path
+    ):
+        """Test that JPEG workspace captures use screencapture's own encoder."""
+        mocks = patch_async(
+            "win_ctrl_mcp.tools.capture",
+            get_focused_workspace=mock_workspace_list[0],
+            get_focused_monitor=mock_monitor_list[1],
+            list_monitors=mock_monitor_list,
+            list_windows=[],
+            _run_screencapture=None,
+        )
+        output_path = str(tmp_path / "workspace.jpg")
+
+        await capture_workspace(output_path=output_path, format="jpeg")
+
+        mocks["_run_screencapture"].assert_awaited_once_with(
+            "-D", "2", "-t", "jpg", output_path=output_path
+        )
+
+
+class TestRunScreencapture:
+    """Tests for running the screencapture utility."""
+
+    @pytest.mark.asyncio
+    async def test_arguments_passed(self, fake_screencapture):
+        """Test that the capture arguments and output path reach screencapture."""
+        output_path = str(fake_screencapture / "shot one.png")
+
+        await _run_screencapture("-l", "5678", output_path=output_path)
+
+        with open(output_path) as f:
+            assert f.read().splitlines() == ["-l", "5678", output_path]
+
+    @pytest.mark.asyncio
+    async def test_capture_failure(self, fake_screencapture):
+        """Test that a failed capture raises with the utility's stderr."""
+        with pytest.raises(AeroSpaceError) as exc_info:
+            await _run_screencapture("-fail", output_path=str(fake_screencapture / "x.png"))
+
+        assert exc_info.value.code == "CAPTURE_FAILED"
+        assert exc_info.value.details["reason"] == "could not create image"
@@ -1,130 +1,315 @@
 """Tests for display information tools."""
 
+import os
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from win_ctrl_mcp.aerospace import request_scope
+from win_ctrl_mcp.tools import display
 from win_ctrl_mcp.tools.display import (
     _calculate_display_category,
     _get_size_category,
+    _get_system_display_info,
+    _parse_wxh,
     get_display_by_id,
     get_display_category,
     get_display_info,
 )
 
+FAKE_SYSTEM_PROFILER = """#!/bin/sh
+if [ -n "$FAKE_PROFILER_GARBAGE" ]; then
+  echo "not json"
+  exit 0
+fi
+cat <<'JSON'
+{"SPDisplaysDataType": [{"spdisplays_ndrvs": [
+  {"_name": "Color LCD", "_spdisplays_resolution": "1728 x 1117 @ 120.00Hz",
+   "_spdisplays_pixels": "3456 x 2234", "spdisplays_builtin": "spdisplays_yes",
+   "spdisplays_main": "spdisplays_yes"},
+  {"_name": "DELL U2720Q", "_spdisplays_resolution": "3840 x 2160 @ 60.00Hz"}
+]}]}
+JSON
+"""
+
+FAKE_IOREG = """#!/bin/sh
+echo "+-o IODisplayConnect ${FAKE_IOREG_DISPLAYS:-2}"
+"""
+
+
+@pytest.fixture
+def fake_system_profiler(tmp_path, monkeypatch, patch_async):
+    """Put fake system_profiler and ioreg utilities on PATH.
+
+    AeroSpace reports the two monitors system_profiler lists.
+    """
+    patch_async(
+        "win_ctrl_mcp.tools.display",
+        list_monitors=[
+            {"monitor-id": 1, "monitor-name": "Color LCD"},
+            {"monitor-id": 2, "monitor-name": "DELL U2720Q"},
+        ],
+    )
+    for name, body in (("system_profiler", FAKE_SYSTEM_PROFILER), ("ioreg", FAKE_IOREG)):
+        script = tmp_path / name
+        script.write_text(body)
+        script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ.get('PATH', '')}")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+@pytest.mark.usefixtures("fake_system_profiler")
+class TestGetSystemDisplayInfo:
+    """Tests for parsing system_profiler display output."""
 
-class TestCalculateDisplayCategory:
-    """Tests for display category calculation."""
+    @pytest.mark.asyncio
+    async def test_parses_displays(self):
+        """Test that display names, resolutions and flags are extracted."""
+        displays = await _get_system_display_info()
 
-    def test_no_displays(self):
-        """Test with no displays."""
-        category, _ = _calculate_display_category([])
-        assert category == "unknown"
+        assert [d["name"] for d in displays] == ["Color LCD", "DELL U2720Q"]
+        assert displays[0]["resolution"] == {"width": 1728, "height": 1117}
+        assert displays[0]["native_resolution"] == {"width": 3456, "height": 2234}
+        assert displays[0]["is_builtin"] is True
+        assert displays[1]["is_main"] is False
+        assert "native_resolution" not in displays[1]
 
-    def test_single_small_display(self):
-        """Test single small display categorization."""
-        displays = [
-            {
-                "effective_resolution": {"width": 1366, "height": 768},
-                "size_inches": 13,
-            }
-        ]
-        category, _ = _calculate_display_category(displays)
-        assert category == "small_single"
+    @pytest.mark.asyncio
+    async def test_invalid_output(self, monkeypatch):
+        """Test that unparseable output yields no displays."""
+        monkeypatch.setenv("FAKE_PROFILER_GARBAGE", "1")
 
-    def test_single_medium_display(self):
-        """Test single medium display categorization."""
-        displays = [
-            {
-                "effective_resolution": {"width": 1920, "height": 1080},
-                "size_inches": 21,
-            }
-        ]
-        category, _ = _calculate_display_category(displays)
-        assert category == "medium_single"
+        assert await _get_system_display_info() == []
 
-    def test_single_large_display(self):
-        """Test single large display categorization."""
-        displays = [
-            {
-                "effective_resolution": {"width": 2560, "height": 1440},
-                "size_inches": 27,
-            }
-        ]
-        category, _ = _calculate_display_category(displays)
-        assert category == "large_single"
+    @pytest.mark.asyncio
+    async def test_disk_cache_reused_across_processes(self, monkeypatch):
+        """Test that saved output is used while the display fingerprint matches."""
+        monkeypatch.setenv(display.DISPLAY_DISK_CACHE_ENV, "1")
+        first = await _get_system_display_info()
 
-    def test_dual_display(self):
-        """Test dual display categorization."""
-        displays = [
-            {"effective_resolution": {"width": 1920, "height": 1080}},
-            {"effective_resolution": {"width": 2560, "height": 1440}},
-        ]
-        category, _ = _calculate_display_category(displays)
-        assert category == "dual_display"
-
-    def test_triple_display(self):
-        """Test triple+ display categorization."""
-        displays = [
-            {"effective_resolution": {"width": 1920, "height": 1080}},
-            {"effective_resolution": {"width": 1920, "height": 1080}},
-            {"effective_resolution": {"width": 1920, "height": 1080}},
-        ]
+        # A new process would find the file; system_profiler is not consulted
+        monkeypatch.setenv("FAKE_PROFILER_GARBAGE", "1")
+        assert await _get_system_display_info() == first
+
+        # Connecting a display changes the fingerprint and forces a new query
+        monkeypatch.setenv("FAKE_IOREG_DISPLAYS", "3")
+        assert await _get_system_display_info() == []
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_follows_monitor_list(self, monkeypatch):
+        """Test that a changed monitor list invalidates saved output even if ioreg does not."""
+        monkeypatch.setenv(display.DISPLAY_DISK_CACHE_ENV, "1")
+        await _get_system_display_info()
+
+        monkeypatch.setenv("FAKE_PROFILER_GARBAGE", "1")
+        display.list_monitors.return_value = [{"monitor-id": 1, "monitor-name": "Color LCD"}]
+        assert await _get_system_display_info() == []
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_expires(self, monkeypatch):
+        """Test that saved output older than the maximum age is ignored."""
+        monkeypatch.setenv(display.DISPLAY_DISK_CACHE_ENV, "1")
+        monkeypatch.setattr(display, "DISPLAY_DISK_CACHE_MAX_AGE", 0.0)
+        await _get_system_display_info()
+
+        monkeypatch.setenv("FAKE_PROFILER_GARBAGE", "1")
+        assert await _get_system_display_info() == []
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_off_by_default(self, monkeypatch):
+        """Test that nothing is written to disk unless the cache is enabled."""
+        monkeypatch.delenv(display.DISPLAY_DISK_CACHE_ENV, raising=False)
+        await _get_system_display_info()
+
+        assert not os.path.exists(display._disk_cache_path())
+
+
+class TestParseWxh:
+    """Tests for resolution string parsing."""
+
+    def test_resolution_with_refresh_rate(self):
+        """Test a resolution followed by a refresh rate."""
+        assert _parse_wxh("3456 x 2234 @ 120.00Hz") == (3456, 2234)
+
+    def test_resolution_without_spaces(self):
+        """Test a resolution written without spaces."""
+        assert _parse_wxh("2560x1440") == (2560, 1440)
+
+    def test_unparseable(self):
+        """Test strings that carry no resolution."""
+        assert _parse_wxh("") is None
+        assert _parse_wxh("Unknown") is None
+        assert _parse_wxh("1920 x ") is None
+
+
+class TestCalculateDisplayCategory:
+    """Tests for display category calculation."""
+
+    @pytest.mark.parametrize(
+        ("displays", "expected"),
+        [
+            pytest.param([], "unknown", id="no_displays"),
+            pytest.param(
+                [{"effective_resolution": {"width": 1366, "height": 768}, "size_inches": 13}],
+                "small_single",
+                id="single_small",
+            ),
+            pytest.param(
+                [{"effective_resolution": {"width": 1920, "height": 1080}, "size_inches": 21}],
+                "medium_single",
+                id="single_medium",
+            ),
+            pytest.param(
+                [{"effective_resolution": {"width": 2560, "height": 1440}, "size_inches": 27}],
+                "large_single",
+                id="single_large",
+            ),
+            pytest.param(
+                [
+                    {"effective_resolution": {"width": 1920, "height": 1080}},
+                    {"effective_resolution": {"width": 2560, "height": 1440}},
+                ],
+                "dual_display",
+                id="dual",
+            ),
+            pytest.param(
+                [{"effective_resolution": {"width": 1920, "height": 1080}}] * 3,
+                "triple_plus",
+                id="triple",
+            ),
+            pytest.param([{"size_inches": 15}], "medium_single", id="size_boundary"),
+        ],
+    )
+    def test_category(self, displays, expected):
+        """Test categorization by display count, size and resolution."""
         category, _ = _calculate_display_category(displays)
-        assert category == "triple_plus"
+        assert category == expected
+
+    def test_single_display_by_resolution(self):
+        """Test single display categorization without size info."""
+        category, description = _calculate_display_category(
+            [{"effective_resolution": {"width": 2560, "height": 1440}}]
+        )
+        assert category == "large_single"
+        assert "27" not in description
 
 
 class TestGetSizeCategory:
     """Tests for size category calculation."""
 
-    def test_small_resolution(self):
-        """Test small resolution categorization."""
-        result = _get_size_category({"width": 1024, "height": 768})
-        assert result == "small"
-
-    def test_medium_resolution(self):
-        """Test medium resolution categorization."""
-        result = _get_size_category({"width": 1920, "height": 1080})
-        assert result == "medium"
-
-    def test_large_resolution(self):
-        """Test large resolution categorization."""
-        result = _get_size_category({"width": 2560, "height": 1440})
-        assert result == "large"
+    @pytest.mark.parametrize(
+        ("resolution", "expected"),
+        [
+            ({"width": 1024, "height": 768}, "small"),
+            ({"width": 1920, "height": 1080}, "medium"),
+            ({"width": 2560, "height": 1440}, "large"),
+        ],
+    )
+    def test_size_category(self, resolution, expected):
+        """Test resolution categorization."""
+        assert _get_size_category(resolution) == expected
 
 
 class TestGetDisplayInfo:
     """Tests for get_display_info tool."""
 
     @pytest.mark.asyncio
-    async def test_get_display_info(self, mock_monitor_list):
+    async def test_get_display_info(self, patch_const, mock_monitor_list):
         """Test getting display information."""
+        patch_const(
+            "win_ctrl_mcp.tools.display",
+            list_monitors=mock_monitor_list,
+            _get_system_display_info=[],
+        )
+
+        result = await get_display_info()
+
+        assert "displays" in result
+        assert "arrangement" in result
+        assert "category" in result
+        assert len(result["displays"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_monitors_matched_to_system_displays(self, mock_monitor_list):
+        """Test matching monitors to system displays by exact and partial name."""
+        system_displays = [
+            {
+                "name": "Color LCD",
+                "resolution": {"width": 1728, "height": 1117},
+                "is_builtin": True,
+                "is_main": True,
+            },
+            {
+                "name": "DELL U2720Q",
+                "resolution": {"width": 3840, "height": 2160},
+                "is_builtin": False,
+                "is_main": False,
+            },
+        ]
         with patch("win_ctrl_mcp.tools.display.list_monitors", new_callable=AsyncMock) as mock_mon:
             mock_mon.return_value = mock_monitor_list
 
             with patch(
                 "win_ctrl_mcp.tools.display._get_system_display_info", new_callable=AsyncMock
             ) as mock_sys:
-                mock_sys.return_value = []
+                mock_sys.return_value = system_displays
 
                 result = await get_display_info()
 
-                assert "displays" in result
-                assert "arrangement" in result
-                assert "category" in result
-                assert len(result["displays"]) == 2
+                builtin, external = result["displays"]
+                assert builtin["resolution"] == {"width": 1728, "height": 1117}
+                assert builtin["is_builtin"] is True
+                assert external["resolution"] == {"width": 3840, "height": 2160}
+                assert external["is_primary"] is False
+                assert (builtin["ppi"], builtin["size_inches"]) == (220, 9.3)
+                assert (external["ppi"], external["size_inches"]) == (110, 41.2)
+
+    @pytest.mark.asyncio
+    async def test_display_info_is_cached(self, mock_monitor_list):
+        """Test that repeated queries within the TTL reuse one result."""
+        with patch("win_ctrl_mcp.tools.display.list_monitors", new_callable=AsyncMock) as mock_mon:
+            mock_mon.return_value = mock_monitor_list
+
+            with patch(
+                "win_ctrl_mcp.tools.display._get_system_display_info", new_callable=AsyncMock
+            ) as mock_sys:
+                mock_sys.return_value = []
+
+                first = await get_display_info()
+                first["displays"][0]["name"] = "changed"
+                second = await get_display_info()
+
+                mock_sys.assert_awaited_once()
+                # Callers get independent copies of the cached result
+                assert second["displays"][0]["name"] == "Built-in Retina Display"
+
+    @pytest.mark.asyncio
+    async def test_display_info_cache_expires(self, mock_monitor_list, monkeypatch):
+        """Test that display info is queried again once the TTL has passed."""
+        monkeypatch.setattr(display, "DISPLAY_INFO_TTL", 0.0)
+        with patch("win_ctrl_mcp.tools.display.list_monitors", new_callable=AsyncMock) as mock_mon:
+            mock_mon.return_value = mock_monitor_list
+
+            with patch(
+                "win_ctrl_mcp.tools.display._get_system_display_info", new_callable=AsyncMock
+            ) as mock_sys:
+                mock_sys.return_value = []
+
+                await get_display_info()
+                await get_display_info()
+
+                assert mock_sys.await_count == 2
 
 
 class TestGetDisplayCategory:
     """Tests for get_display_category tool."""
 
     @pytest.mark.asyncio
-    async def test_get_display_category(self, mock_monitor_list):  # noqa: ARG002
+    async def test_get_display_category(self, patch_const):
         """Test getting display category."""
-        with patch(
-            "win_ctrl_mcp.tools.display.get_display_info", new_callable=AsyncMock
-        ) as mock_info:
-            mock_info.return_value = {
+        patch_const(
+            "win_ctrl_mcp.tools.display",
+            get_display_info={
                 "displays": [
                     {
                         "effective_resolution": {"width": 1920, "height": 1080},
@@ -135,58 +320,96 @@ class TestGetDisplayCategory:
                         "is_primary": False,
                     },
                 ],
+            },
+        )
+
+        result = await get_display_category()
+
+        assert "category" in result
+        assert result["category"] == "dual_display"
+        assert "recommended_strategy" in result
+
+    @pytest.mark.asyncio
+    async def test_primary_and_secondary_sizes(self):
+        """Test that the primary display is sized apart from the others."""
+        with patch(
+            "win_ctrl_mcp.tools.display.get_display_info", new_callable=AsyncMock
+        ) as mock_info:
+            mock_info.return_value = {
+                "displays": [
+                    {"effective_resolution": {"width": 1024, "height": 768}},
+                    {"effective_resolution": {"width": 2560, "height": 1440}, "is_primary": True},
+                    {"resolution": {"width": 1920, "height": 1080}},
+                ],
             }
 
             result = await get_display_category()
 
-            assert "category" in result
-            assert result["category"] == "dual_display"
-            assert "recommended_strategy" in result
+            assert result["primary_size"] == "large"
+            assert result["secondary_sizes"] == ["small", "medium"]
+
+    @pytest.mark.asyncio
+    async def test_scoped_callers_get_own_copy(self, patch_async):
+        """Test that callers in one request share the work but not the result."""
+        mocks = patch_async(
+            "win_ctrl_mcp.tools.display",
+            get_display_info={
+                "displays": [
+                    {"effective_resolution": {"width": 2560, "height": 1440}, "is_primary": True},
+                    {"effective_resolution": {"width": 1920, "height": 1080}},
+                ],
+            },
+        )
+
+        @request_scope
+        async def two_callers():
+            first = await get_display_category()
+            first["category"] = "changed"
+            first["secondary_sizes"].append("changed")
+            return await get_display_category()
+
+        second = await two_callers()
+
+        mocks["get_display_info"].assert_awaited_once()
+        assert second["category"] == "dual_display"
+        assert second["secondary_sizes"] == ["medium"]
 
 
 class TestGetDisplayById:
     """Tests for get_display_by_id function."""
 
     @pytest.mark.asyncio
-    async def test_get_existing_display(
-        self,
-        mock_monitor_list,  # noqa: ARG002
-        mock_workspace_list,  # noqa: ARG002
-    ):
+    async def test_get_existing_display(self, patch_const, mock_monitor_list, mock_workspace_list):
         """Test getting an existing display by ID."""
-        with patch(
-            "win_ctrl_mcp.tools.display.get_display_info", new_callable=AsyncMock
-        ) as mock_info:
-            mock_info.return_value = {
+        patch_const(
+            "win_ctrl_mcp.tools.display",
+            list_monitors=mock_monitor_list,
+            get_display_info={
                 "displays": [
                     {"id": 1, "name": "Built-in Retina Display"},
                     {"id": 2, "name": "DELL U2720Q"},
                 ]
-            }
-
-            with patch(
-                "win_ctrl_mcp.tools.display.list_workspaces", new_callable=AsyncMock
-            ) as mock_ws:
-                mock_ws.return_value = mock_workspace_list
-
-                with patch(
-                    "win_ctrl_mcp.aerospace.list_windows", new_callable=AsyncMock
-                ) as mock_win:
-                    mock_win.return_value = []
+            },
+            list_workspaces=mock_workspace_list,
+            list_windows=[],
+        )
 
-                    result = await get_display_by_id(1)
+        result = await get_display_by_id(1)
 
-                    assert result is not None
-                    assert result["id"] == 1
+        assert result is not None
+        assert result["id"] == 1
 
     @pytest.mark.asyncio
-    async def test_get_nonexistent_display(self):
+    async def test_get_nonexistent_display(self, mock_monitor_list):
         """Test getting a non-existent display."""
-        with patch(
-            "win_ctrl_mcp.tools.display.get_display_info", new_callable=AsyncMock
-        ) as mock_info:
-            mock_info.return_value = {"displays": [{"id": 1}]}
+        with patch("win_ctrl_mcp.tools.display.list_monitors", new_callable=AsyncMock) as mock_mon:
+            mock_mon.return_value = mock_monitor_list
 
-            result = await get_display_by_id(999)
+            with patch(
+                "win_ctrl_mcp.tools.display.get_display_info", new_callable=AsyncMock
+            ) as mock_info:
+                result = await get_display_by_id(999)
 
-            assert result is None
+                assert result is None
+                # Unknown IDs are rejected without collecting display info
+                mock_info.assert_not_awaited()
@@ -1,15 +1,19 @@
 """Tests for smart focus tools."""
 
-import tempfile
-from pathlib import Path
+import json
+import os
+import shutil
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from win_ctrl_mcp.aerospace import AeroSpaceError
 from win_ctrl_mcp.tools.focus import (
+    APP_CATEGORIES,
     _get_app_category,
+    _preset_names,
     apply_focus_preset,
+    load_focus_preset,
     move_app_category_to_monitor,
     resize_window_optimal,
     save_focus_preset,
@@ -20,224 +24,340 @@ from win_ctrl_mcp.tools.focus import (
 class TestGetAppCategory:
     """Tests for app category detection."""
 
-    def test_communication_app(self):
-        """Test detecting communication apps."""
-        assert _get_app_category("Slack") == "communication"
-        assert _get_app_category("Discord") == "communication"
-        assert _get_app_category("Microsoft Teams") == "communication"
-
-    def test_development_app(self):
-        """Test detecting development apps."""
-        assert _get_app_category("Visual Studio Code") == "development"
-        assert _get_app_category("Terminal") == "development"
-        assert _get_app_category("Xcode") == "development"
-
-    def test_reference_app(self):
-        """Test detecting reference apps."""
-        assert _get_app_category("Safari") == "reference"
-        assert _get_app_category("Notes") == "reference"
-        assert _get_app_category("Notion") == "reference"
-
-    def test_media_app(self):
-        """Test detecting media apps."""
-        assert _get_app_category("Spotify") == "media"
-        assert _get_app_category("VLC") == "media"
-
-    def test_unknown_app(self):
-        """Test that unknown apps return None."""
-        assert _get_app_category("SomeRandomApp") is None
-
-    def test_partial_match(self):
-        """Test partial name matching."""
-        # Should match "Chrome" in "Google Chrome"
-        assert _get_app_category("Google Chrome") == "reference"
+    @pytest.mark.parametrize(
+        ("app_name", "category"),
+        [(app, category) for category, apps in APP_CATEGORIES.items() for app in apps],
+    )
+    def test_catalog_app(self, app_name, category):
+        """Test that every catalogued app maps to its own category."""
+        assert _get_app_category(app_name) == category
+
+    @pytest.mark.parametrize(
+        ("app_name", "category"),
+        [
+            ("Google Chrome Canary", "reference"),
+            ("Visual Studio Code - Insiders", "development"),
+            ("terminal", "development"),
+            ("SomeRandomApp", None),
+        ],
+    )
+    def test_uncatalogued_app(self, app_name, category):
+        """Test that other names match a catalogued name they contain, ignoring case."""
+        assert _get_app_category(app_name) == category
 
 
 class TestApplyFocusPreset:
     """Tests for apply_focus_preset tool."""
 
     @pytest.mark.asyncio
-    async def test_apply_auto_preset(self, mock_window_list, mock_monitor_list):
+    async def test_apply_auto_preset(self, patch_async, mock_window_list, mock_monitor_list):
         """Test applying auto preset."""
-        with patch(
-            "win_ctrl_mcp.tools.focus.get_display_category", new_callable=AsyncMock
-        ) as mock_cat:
-            mock_cat.return_value = {"category": "medium_single"}
-
-            with patch(
-                "win_ctrl_mcp.tools.focus.get_focused_window", new_callable=AsyncMock
-            ) as mock_focused:
-                mock_focused.return_value = mock_window_list[0]
-
-                with patch(
-                    "win_ctrl_mcp.tools.focus.list_windows", new_callable=AsyncMock
-                ) as mock_win:
-                    mock_win.return_value = mock_window_list
+        mocks = patch_async(
+            "win_ctrl_mcp.tools.focus",
+            get_display_category={"category": "medium_single"},
+            get_focused_window=mock_window_list[0],
+            list_windows=mock_window_list,
+            list_monitors=mock_monitor_list,
+            run_aerospace_command=("", "", 0),
+            run_aerospace_commands=None,
+        )
+
+        result = await apply_focus_preset(preset="auto")
+
+        assert result["success"] is True
+        assert result["display_category"] == "medium_single"
+        mocks["run_aerospace_commands"].assert_awaited_once_with(
+            ("layout", "h_tiles"), ("resize", "width", "+30%")
+        )
+        # A single-display layout never looks at other windows
+        mocks["list_windows"].assert_not_awaited()
+        mocks["list_monitors"].assert_not_awaited()
 
-                    with patch(
-                        "win_ctrl_mcp.tools.focus.list_monitors", new_callable=AsyncMock
-                    ) as mock_mon:
-                        mock_mon.return_value = mock_monitor_list
+    @pytest.mark.asyncio
+    async def test_apply_preset_no_focused_window(self, patch_async):
+        """Test error when no window is focused."""
+        patch_async(
+            "win_ctrl_mcp.tools.focus",
+            get_display_category={"category": "medium_single"},
+            get_focused_window=None,
+        )
 
-                        with patch(
-                            "win_ctrl_mcp.tools.focus.run_aerospace_command",
-                            new_callable=AsyncMock,
-                        ) as mock_cmd:
-                            mock_cmd.return_value = ("", "", 0)
+        with pytest.raises(AeroSpaceError) as exc_info:
+            await apply_focus_preset()
 
-                            result = await apply_focus_preset(preset="auto")
+        assert "NO_WINDOW_FOCUSED" in exc_info.value.code
 
-                            assert result["success"] is True
-                            assert result["display_category"] == "medium_single"
+    @pytest.mark.asyncio
+    async def test_saved_preset_reuses_display_category(self, tmp_path):
+        """Test that loading a saved preset does not query the displays again."""
+        (tmp_path / "work.json").write_text('{"display_category": "dual_display", "windows": []}')
+        with (
+            patch("win_ctrl_mcp.tools.focus.PRESET_DIR", tmp_path),
+            patch("win_ctrl_mcp.tools.focus.list_windows", new_callable=AsyncMock) as mock_win,
+            patch(
+                "win_ctrl_mcp.tools.display.get_display_info", new_callable=AsyncMock
+            ) as mock_info,
+        ):
+            mock_win.return_value = []
+            mock_info.return_value = {"displays": [{}, {}]}
+
+            result = await apply_focus_preset(preset="work")
+
+            assert result["preset_loaded"] == "work"
+            assert result["adapted"] is False
+            mock_info.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_apply_preset_no_focused_window(self):
-        """Test error when no window is focused."""
+    async def test_unknown_window_lists_windows_once(self, mock_aerospace_command):
+        """Test that reporting an unknown window reuses the lookup's listing."""
         with patch(
             "win_ctrl_mcp.tools.focus.get_display_category", new_callable=AsyncMock
         ) as mock_cat:
             mock_cat.return_value = {"category": "medium_single"}
 
             with patch(
-                "win_ctrl_mcp.tools.focus.get_focused_window", new_callable=AsyncMock
-            ) as mock_focused:
-                mock_focused.return_value = None
-
+                "win_ctrl_mcp.aerospace.run_aerospace_command",
+                side_effect=mock_aerospace_command,
+            ) as mock_cmd:
                 with pytest.raises(AeroSpaceError) as exc_info:
-                    await apply_focus_preset()
+                    await apply_focus_preset(preset="medium_split", focus_window_id=42)
 
-                assert "NO_WINDOW_FOCUSED" in exc_info.value.code
+                assert exc_info.value.details["available_windows"] == [1234, 5678]
+                assert mock_cmd.await_count == 1
 
 
 class TestSaveFocusPreset:
     """Tests for save_focus_preset tool."""
 
     @pytest.mark.asyncio
-    async def test_save_preset(self, mock_window_list, mock_monitor_list):
+    async def test_save_preset(self, patch_async, tmp_path, mock_window_list, mock_monitor_list):
         """Test saving a focus preset."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            preset_dir = Path(tmpdir)
-
-            with (
-                patch("win_ctrl_mcp.tools.focus.PRESET_DIR", preset_dir),
-                patch(
-                    "win_ctrl_mcp.tools.focus.get_display_category", new_callable=AsyncMock
-                ) as mock_cat,
-            ):
-                mock_cat.return_value = {"category": "medium_single"}
+        patch_async(
+            "win_ctrl_mcp.tools.focus",
+            get_display_category={"category": "medium_single"},
+            list_windows=mock_window_list,
+            list_monitors=mock_monitor_list,
+        )
+
+        with patch("win_ctrl_mcp.tools.focus.PRESET_DIR", tmp_path):
+            result = await save_focus_preset(name="test_preset", description="Test description")
+
+        assert result["success"] is True
+        assert result["preset"]["name"] == "test_preset"
+
+        # Verify file was created
+        preset_file = tmp_path / "test_preset.json"
+        assert preset_file.exists()
+        saved = json.loads(preset_file.read_text())
+        assert saved["description"] == "Test description"
+        assert saved["created_at"] == result["preset"]["created_at"]
 
-                with patch(
-                    "win_ctrl_mcp.tools.focus.list_windows", new_callable=AsyncMock
-                ) as mock_win:
-                    mock_win.return_value = mock_window_list
-
-                    with patch(
-                        "win_ctrl_mcp.tools.focus.list_monitors", new_callable=AsyncMock
-                    ) as mock_mon:
-                        mock_mon.return_value = mock_monitor_list
+    @pytest.mark.asyncio
+    async def test_save_recreates_removed_directory(self, patch_async, tmp_path):
+        """Test that saving works again after the preset directory is removed."""
+        preset_dir = tmp_path / "presets"
+        patch_async(
+            "win_ctrl_mcp.tools.focus",
+            get_display_category={"category": "medium_single"},
+            list_windows=[],
+            list_monitors=[],
+        )
+
+        with patch("win_ctrl_mcp.tools.focus.PRESET_DIR", preset_dir):
+            await save_focus_preset(name="work")
+            shutil.rmtree(preset_dir)
+            await save_focus_preset(name="play")
+
+        assert (preset_dir / "play.json").exists()
 
-                        result = await save_focus_preset(
-                            name="test_preset", description="Test description"
-                        )
+    @pytest.mark.asyncio
+    async def test_save_refreshes_preset_listing(self, patch_async, tmp_path):
+        """Test that a saved preset is listed even if the directory mtime did not change."""
+        (tmp_path / "work.json").write_text("{}")
+        mtime_ns = tmp_path.stat().st_mtime_ns
+        patch_async(
+            "win_ctrl_mcp.tools.focus",
+            get_display_category={"category": "medium_single"},
+            list_windows=[],
+            list_monitors=[],
+        )
 
-                        assert result["success"] is True
-                        assert result["preset"]["name"] == "test_preset"
+        with patch("win_ctrl_mcp.tools.focus.PRESET_DIR", tmp_path):
+            assert _preset_names() == {"work"}
+            await save_focus_preset(name="play")
+            os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
 
-                        # Verify file was created
-                        preset_file = preset_dir / "test_preset.json"
-                        assert preset_file.exists()
+            assert _preset_names() == {"play", "work"}
 
 
-class TestResizeWindowOptimal:
-    """Tests for resize_window_optimal tool."""
+class TestLoadFocusPreset:
+    """Tests for load_focus_preset tool."""
 
     @pytest.mark.asyncio
-    async def test_resize_code_editor(self, mock_window_list):
-        """Test resizing for code editor."""
-        with patch(
-            "win_ctrl_mcp.tools.focus.get_focused_window", new_callable=AsyncMock
-        ) as mock_focused:
-            mock_focused.return_value = mock_window_list[2]  # VS Code
-
-            with patch(
-                "win_ctrl_mcp.tools.focus.get_display_info", new_callable=AsyncMock
-            ) as mock_display:
-                mock_display.return_value = {
-                    "displays": [{"effective_resolution": {"width": 1920, "height": 1080}}]
-                }
+    async def test_missing_preset_lists_available(self, tmp_path):
+        """Test that a missing preset reports the saved ones."""
+        (tmp_path / "work.json").write_text("{}")
+        (tmp_path / "notes.txt").write_text("")
+        with patch("win_ctrl_mcp.tools.focus.PRESET_DIR", tmp_path):
+            with pytest.raises(AeroSpaceError) as exc_info:
+                await load_focus_preset(name="play")
 
-                with patch(
-                    "win_ctrl_mcp.tools.focus.run_aerospace_command", new_callable=AsyncMock
-                ) as mock_cmd:
-                    mock_cmd.return_value = ("", "", 0)
+            assert exc_info.value.code == "PRESET_NOT_FOUND"
+            assert exc_info.value.details["available_presets"] == ["work"]
 
-                    result = await resize_window_optimal(content_type="code_editor")
+            # A preset saved afterwards is seen despite the cached listing
+            (tmp_path / "play.json").write_text("{}")
+            with pytest.raises(AeroSpaceError) as exc_info:
+                await load_focus_preset(name="other")
 
-                    assert result["success"] is True
-                    assert result["content_type"] == "code_editor"
-                    assert "new_dimensions" in result
+            assert exc_info.value.details["available_presets"] == ["play", "work"]
 
     @pytest.mark.asyncio
-    async def test_resize_invalid_content_type(self, mock_window_list):
-        """Test error with invalid content type."""
-        with patch(
-            "win_ctrl_mcp.tools.focus.get_focused_window", new_callable=AsyncMock
-        ) as mock_focused:
-            mock_focused.return_value = mock_window_list[0]
+    async def test_preset_added_within_mtime_tick(self, patch_async, tmp_path):
+        """Test that a preset is found even if the directory mtime did not change."""
+        (tmp_path / "work.json").write_text("{}")
+        mtime_ns = tmp_path.stat().st_mtime_ns
+        patch_async(
+            "win_ctrl_mcp.tools.focus",
+            get_display_category={"category": "medium_single"},
+            list_windows=[],
+        )
 
-            with pytest.raises(AeroSpaceError) as exc_info:
-                await resize_window_optimal(content_type="invalid_type")
+        with patch("win_ctrl_mcp.tools.focus.PRESET_DIR", tmp_path):
+            assert _preset_names() == {"work"}
+            (tmp_path / "play.json").write_text("{}")
+            os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
 
-            assert "Invalid content_type" in str(exc_info.value)
+            result = await load_focus_preset(name="play")
 
+        assert result["preset_loaded"] == "play"
 
-class TestSetWindowZone:
-    """Tests for set_window_zone tool."""
+    @pytest.mark.asyncio
+    async def test_entries_claim_distinct_windows(self, patch_async, tmp_path):
+        """Test that preset entries for one app arrange different windows."""
+        (tmp_path / "work.json").write_text(
+            '{"display_category": "dual_display", "windows": ['
+            '{"app_name": "Terminal", "workspace": "1"},'
+            '{"app_name": "Terminal", "workspace": "2"},'
+            '{"app_name": "Terminal", "workspace": "3"}]}'
+        )
+        windows = [
+            {"window-id": 10, "app-name": "Terminal"},
+            {"window-id": 20, "app-name": "Firefox"},
+            {"window-id": 30, "app-name": "Terminal"},
+        ]
+        mocks = patch_async(
+            "win_ctrl_mcp.tools.focus",
+            get_display_category={"category": "dual_display"},
+            list_windows=windows,
+            run_aerospace_command=("", "", 0),
+        )
+
+        with patch("win_ctrl_mcp.tools.focus.PRESET_DIR", tmp_path):
+            result = await load_focus_preset(name="work")
+
+        assert result["windows_arranged"] == 2
+        assert [c.args for c in mocks["run_aerospace_command"].await_args_list] == [
+            ("move-node-to-workspace", "--window-id", "10", "1"),
+            ("move-node-to-workspace", "--window-id", "30", "2"),
+        ]
 
     @pytest.mark.asyncio
-    async def test_set_center_focus_zone(self, mock_window_list):
-        """Test setting center focus zone."""
-        with patch(
-            "win_ctrl_mcp.tools.focus.get_focused_window", new_callable=AsyncMock
-        ) as mock_focused:
-            mock_focused.return_value = mock_window_list[0]
+    async def test_entry_without_workspace_keeps_its_window(self, patch_async, tmp_path):
+        """Test that an entry without a workspace claims a window but leaves it in place."""
+        (tmp_path / "work.json").write_text(
+            '{"display_category": "dual_display", "windows": ['
+            '{"app_name": "Terminal"},'
+            '{"app_name": "Terminal", "workspace": "2"}]}'
+        )
+        windows = [
+            {"window-id": 10, "app-name": "Terminal"},
+            {"window-id": 30, "app-name": "Terminal"},
+        ]
+        mocks = patch_async(
+            "win_ctrl_mcp.tools.focus",
+            get_display_category={"category": "dual_display"},
+            list_windows=windows,
+            run_aerospace_command=("", "", 0),
+        )
+
+        with patch("win_ctrl_mcp.tools.focus.PRESET_DIR", tmp_path):
+            result = await load_focus_preset(name="work")
+
+        assert result["windows_arranged"] == 2
+        mocks["run_aerospace_command"].assert_awaited_once_with(
+            "move-node-to-workspace", "--window-id", "30", "2"
+        )
 
-            with patch(
-                "win_ctrl_mcp.tools.focus.get_display_info", new_callable=AsyncMock
-            ) as mock_display:
-                mock_display.return_value = {
-                    "displays": [{"effective_resolution": {"width": 1920, "height": 1080}}]
-                }
+    @pytest.mark.asyncio
+    async def test_missing_preset_directory(self, tmp_path):
+        """Test that no presets are listed when the directory does not exist."""
+        with patch("win_ctrl_mcp.tools.focus.PRESET_DIR", tmp_path / "missing"):
+            with pytest.raises(AeroSpaceError) as exc_info:
+                await load_focus_preset(name="work")
 
-                with patch(
-                    "win_ctrl_mcp.tools.focus.run_aerospace_command", new_callable=AsyncMock
-                ) as mock_cmd:
-                    mock_cmd.return_value = ("", "", 0)
+            assert exc_info.value.details["available_presets"] == []
 
-                    result = await set_window_zone(zone="center_focus")
 
-                    assert result["success"] is True
-                    assert result["zone"] == "center_focus"
+class TestResizeWindowOptimal:
+    """Tests for resize_window_optimal tool."""
 
     @pytest.mark.asyncio
-    async def test_set_invalid_zone(self, mock_window_list):
-        """Test error with invalid zone."""
-        with patch(
-            "win_ctrl_mcp.tools.focus.get_focused_window", new_callable=AsyncMock
-        ) as mock_focused:
-            mock_focused.return_value = mock_window_list[0]
+    async def test_resize_code_editor(self, patch_async, mock_window_list):
+        """Test resizing for code editor."""
+        mocks = patch_async(
+            "win_ctrl_mcp.tools.focus",
+            get_focused_window=mock_window_list[2],  # VS Code
+            get_display_info={
+                "displays": [{"effective_resolution": {"width": 1920, "height": 1080}}]
+            },
+            run_aerospace_commands=None,
+        )
+
+        result = await resize_window_optimal(content_type="code_editor")
+
+        assert result["success"] is True
+        assert result["content_type"] == "code_editor"
+        assert "new_dimensions" in result
+        mocks["run_aerospace_commands"].assert_awaited_once_with(
+            ("focus", "--window-id", "9012"),
+            ("layout", "h_tiles"),
+            ("resize", "width", "65%"),
+        )
 
-            with pytest.raises(AeroSpaceError) as exc_info:
-                await set_window_zone(zone="invalid_zone")
 
-            assert "Invalid zone" in str(exc_info.value)
+class TestSetWindowZone:
+    """Tests for set_window_zone tool."""
+
+    @pytest.mark.asyncio
+    async def test_set_center_focus_zone(self, patch_async, mock_window_list):
+        """Test setting center focus zone."""
+        mocks = patch_async(
+            "win_ctrl_mcp.tools.focus",
+            get_focused_window=mock_window_list[0],
+            get_display_info={
+                "displays": [{"effective_resolution": {"width": 1920, "height": 1080}}]
+            },
+            run_aerospace_commands=None,
+        )
+
+        result = await set_window_zone(zone="center_focus")
+
+        assert result["success"] is True
+        assert result["zone"] == "center_focus"
+        # Focus and arrangement run as one sequence
+        mocks["run_aerospace_commands"].assert_awaited_once_with(
+            ("focus", "--window-id", "1234"),
+            ("layout", "tiling"),
+            ("resize", "width", "65%"),
+        )
 
 
 class TestMoveAppCategoryToMonitor:
     """Tests for move_app_category_to_monitor tool."""
 
     @pytest.mark.asyncio
-    async def test_move_communication_apps(self, mock_window_list, mock_monitor_list):
+    async def test_move_communication_apps(self, patch_async, mock_window_list, mock_monitor_list):
         """Test moving communication apps to monitor."""
         # Add a communication app to the mock list
         comm_window = {
@@ -245,41 +365,83 @@ class TestMoveAppCategoryToMonitor:
             "app-name": "Slack",
             "workspace": "1",
         }
-        test_windows = mock_window_list + [comm_window]
-
-        with patch("win_ctrl_mcp.tools.focus.list_monitors", new_callable=AsyncMock) as mock_mon:
-            mock_mon.return_value = mock_monitor_list
-
-            with patch("win_ctrl_mcp.tools.focus.list_windows", new_callable=AsyncMock) as mock_win:
-                mock_win.return_value = test_windows
-
-                with patch(
-                    "win_ctrl_mcp.tools.focus.run_aerospace_command", new_callable=AsyncMock
-                ) as mock_cmd:
-                    mock_cmd.return_value = ("", "", 0)
-
-                    result = await move_app_category_to_monitor(
-                        category="communication", monitor="secondary"
-                    )
-
-                    assert result["success"] is True
-                    assert result["category"] == "communication"
-                    assert len(result["windows_moved"]) == 1
+        mocks = patch_async(
+            "win_ctrl_mcp.tools.focus",
+            list_monitors=mock_monitor_list,
+            list_windows=[*mock_window_list, comm_window],
+            run_aerospace_command=("", "", 0),
+        )
+
+        result = await move_app_category_to_monitor(category="communication", monitor="secondary")
+
+        assert result["success"] is True
+        assert result["category"] == "communication"
+        assert len(result["windows_moved"]) == 1
+        # Windows are moved by ID rather than by focusing them first
+        mocks["run_aerospace_command"].assert_any_await(
+            "move-node-to-monitor",
+            "--window-id",
+            "9999",
+            mock_monitor_list[1]["name"],
+        )
 
     @pytest.mark.asyncio
-    async def test_move_invalid_category(self, mock_monitor_list):  # noqa: ARG002
-        """Test error with invalid category."""
-        with pytest.raises(AeroSpaceError) as exc_info:
-            await move_app_category_to_monitor(category="invalid_category", monitor="primary")
-
-        assert "Invalid category" in str(exc_info.value)
-
+    async def test_closed_window_is_skipped(self, patch_async, mock_monitor_list):
+        """Test that a window that fails to move is left out of the result."""
+        test_windows = [
+            {"window-id": 1, "app-name": "Slack", "workspace": "1"},
+            {"window-id": 2, "app-name": "Discord", "workspace": "1"},
+        ]
+
+        async def run(*args):
+            if "1" in args:
+                raise AeroSpaceError("COMMAND_FAILED", "Window not found", {})
+            return "", "", 0
+
+        patch_async(
+            "win_ctrl_mcp.tools.focus", list_monitors=mock_monitor_list, list_windows=test_windows
+        )
+
+        with patch("win_ctrl_mcp.tools.focus.run_aerospace_command", side_effect=run):
+            result = await move_app_category_to_monitor(category="communication", monitor="primary")
+
+        assert [w["window_id"] for w in result["windows_moved"]] == [2]
+
+
+class TestInvalidParameters:
+    """Tests for focus tools rejecting invalid arguments."""
+
+    @pytest.mark.parametrize(
+        ("call", "code"),
+        [
+            pytest.param(
+                lambda: resize_window_optimal(content_type="invalid_type"),
+                "INVALID_PARAMETERS",
+                id="content_type",
+            ),
+            pytest.param(
+                lambda: set_window_zone(zone="invalid_zone"), "INVALID_PARAMETERS", id="zone"
+            ),
+            pytest.param(
+                lambda: move_app_category_to_monitor(
+                    category="invalid_category", monitor="primary"
+                ),
+                "INVALID_PARAMETERS",
+                id="category",
+            ),
+            pytest.param(
+                lambda: move_app_category_to_monitor(
+                    category="communication", monitor="primary", layout="invalid_layout"
+                ),
+                "INVALID_PARAMETERS",
+                id="layout",
+            ),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_move_invalid_layout(self, mock_monitor_list):  # noqa: ARG002
-        """Test error with invalid layout."""
+    async def test_invalid_argument(self, call, code):
+        """Test that an invalid argument is rejected before any window is looked up."""
         with pytest.raises(AeroSpaceError) as exc_info:
-            await move_app_category_to_monitor(
-                category="communication", monitor="primary", layout="invalid_layout"
-            )
+            await call()
 
-        assert "Invalid layout" in str(exc_info.value)
+        assert exc_info.value.code == code
@@ -1,7 +1,5 @@
 """Tests for window management tools."""
 
-from unittest.mock import AsyncMock, patch
-
 import pytest
 
 from win_ctrl_mcp.aerospace import AeroSpaceError
@@ -17,50 +15,47 @@ from win_ctrl_mcp.tools.window import (
 )
 
 
+@pytest.fixture
+def window_mocks(patch_async):
+    """Patch the command runner and window lookups used by the window tools.
+
+    Commands succeed, and no window is focused or found until a test sets
+    the lookup's return_value.
+    """
+    return patch_async(
+        "win_ctrl_mcp.tools.window",
+        run_aerospace_command=("", "", 0),
+        get_focused_window=None,
+        get_window_by_id=None,
+    )
+
+
 class TestFocusWindow:
     """Tests for focus_window tool."""
 
     @pytest.mark.asyncio
-    async def test_focus_by_direction(self, mock_window_list):
+    async def test_focus_by_direction(self, window_mocks, mock_window_list):
         """Test focusing window by direction."""
-        with patch(
-            "win_ctrl_mcp.tools.window.run_aerospace_command", new_callable=AsyncMock
-        ) as mock_cmd:
-            mock_cmd.return_value = ("", "", 0)
+        window_mocks["get_focused_window"].return_value = mock_window_list[0]
 
-            with patch(
-                "win_ctrl_mcp.tools.window.get_focused_window", new_callable=AsyncMock
-            ) as mock_focused:
-                mock_focused.return_value = mock_window_list[0]
+        result = await focus_window(direction="left")
 
-                result = await focus_window(direction="left")
-
-                assert result["success"] is True
-                assert "focused_window" in result
-                mock_cmd.assert_called_once_with("focus", "left")
+        assert result["success"] is True
+        assert "focused_window" in result
+        window_mocks["run_aerospace_command"].assert_called_once_with("focus", "left")
 
     @pytest.mark.asyncio
-    async def test_focus_by_window_id(self, mock_window_list):
+    async def test_focus_by_window_id(self, window_mocks, mock_window_list):
         """Test focusing window by ID."""
-        with patch(
-            "win_ctrl_mcp.tools.window.run_aerospace_command", new_callable=AsyncMock
-        ) as mock_cmd:
-            mock_cmd.return_value = ("", "", 0)
-
-            with patch(
-                "win_ctrl_mcp.tools.window.get_window_by_id", new_callable=AsyncMock
-            ) as mock_get:
-                mock_get.return_value = mock_window_list[0]
+        window_mocks["get_window_by_id"].return_value = mock_window_list[0]
+        window_mocks["get_focused_window"].return_value = mock_window_list[0]
 
-                with patch(
-                    "win_ctrl_mcp.tools.window.get_focused_window", new_callable=AsyncMock
-                ) as mock_focused:
-                    mock_focused.return_value = mock_window_list[0]
+        result = await focus_window(window_id=1234)
 
-                    result = await focus_window(window_id=1234)
-
-                    assert result["success"] is True
-                    assert result["focused_window"]["window_id"] == 1234
+        assert result["success"] is True
+        assert result["focused_window"]["window_id"] == 1234
+        # The looked-up window is reported without querying focus again
+        window_mocks["get_focused_window"].assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_focus_requires_parameter(self):
@@ -78,205 +73,174 @@ class TestFocusWindow:
 
         assert "Cannot specify both" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_focus_invalid_direction(self):
-        """Test that invalid direction raises error."""
-        with pytest.raises(AeroSpaceError) as exc_info:
-            await focus_window(direction="diagonal")
-
-        assert "INVALID_DIRECTION" in str(exc_info.value.code)
-
 
 class TestFocusMonitor:
     """Tests for focus_monitor tool."""
 
     @pytest.mark.asyncio
-    async def test_focus_monitor(self, mock_monitor_list):
+    async def test_focus_monitor(self, window_mocks, patch_async, mock_monitor_list):
         """Test focusing a monitor."""
-        with patch(
-            "win_ctrl_mcp.tools.window.run_aerospace_command", new_callable=AsyncMock
-        ) as mock_cmd:
-            mock_cmd.return_value = ("", "", 0)
-
-            with patch(
-                "win_ctrl_mcp.aerospace.get_focused_workspace", new_callable=AsyncMock
-            ) as mock_ws:
-                mock_ws.return_value = {"workspace": "1", "monitor": "DELL U2720Q"}
+        patch_async(
+            "win_ctrl_mcp.aerospace",
+            get_focused_workspace={"workspace": "1", "monitor": "DELL U2720Q"},
+            list_monitors=mock_monitor_list,
+        )
 
-                with patch(
-                    "win_ctrl_mcp.aerospace.list_monitors", new_callable=AsyncMock
-                ) as mock_mon:
-                    mock_mon.return_value = mock_monitor_list
+        result = await focus_monitor(target="right")
 
-                    result = await focus_monitor(target="right")
-
-                    assert result["success"] is True
-                    mock_cmd.assert_called_once_with("focus-monitor", "right")
+        assert result["success"] is True
+        window_mocks["run_aerospace_command"].assert_called_once_with("focus-monitor", "right")
 
 
 class TestFocusWorkspace:
     """Tests for focus_workspace tool."""
 
     @pytest.mark.asyncio
-    async def test_focus_workspace(self, mock_workspace_list):
+    async def test_focus_workspace(self, patch_async, mock_workspace_list):
         """Test focusing a workspace."""
-        with patch(
-            "win_ctrl_mcp.tools.window.run_aerospace_command", new_callable=AsyncMock
-        ) as mock_cmd:
-            mock_cmd.return_value = ("", "", 0)
-
-            with patch("win_ctrl_mcp.aerospace.list_workspaces", new_callable=AsyncMock) as mock_ws:
-                mock_ws.return_value = mock_workspace_list
+        patch_async("win_ctrl_mcp.tools.window", run_aerospace_command=("", "", 0), list_windows=[])
+        patch_async("win_ctrl_mcp.aerospace", list_workspaces=mock_workspace_list)
 
-                with patch(
-                    "win_ctrl_mcp.tools.window.list_windows", new_callable=AsyncMock
-                ) as mock_win:
-                    mock_win.return_value = []
+        result = await focus_workspace(workspace="dev")
 
-                    result = await focus_workspace(workspace="dev")
-
-                    assert result["success"] is True
-                    assert result["workspace"]["name"] == "dev"
+        assert result["success"] is True
+        assert result["workspace"]["name"] == "dev"
 
 
 class TestMoveWindow:
     """Tests for move_window tool."""
 
     @pytest.mark.asyncio
-    async def test_move_to_workspace(self, mock_window_list):
+    async def test_move_to_workspace(self, window_mocks, mock_window_list):
         """Test moving window to workspace."""
-        with patch(
-            "win_ctrl_mcp.tools.window.run_aerospace_command", new_callable=AsyncMock
-        ) as mock_cmd:
-            mock_cmd.return_value = ("", "", 0)
-
-            with patch(
-                "win_ctrl_mcp.tools.window.get_focused_window", new_callable=AsyncMock
-            ) as mock_focused:
-                mock_focused.return_value = mock_window_list[0]
+        window_mocks["get_focused_window"].return_value = mock_window_list[0]
 
-                result = await move_window(target_type="workspace", target="2")
+        result = await move_window(target_type="workspace", target="2")
 
-                assert result["success"] is True
-                assert result["moved_to"]["type"] == "workspace"
-                assert result["moved_to"]["name"] == "2"
+        assert result["success"] is True
+        assert result["moved_to"]["type"] == "workspace"
+        assert result["moved_to"]["name"] == "2"
 
     @pytest.mark.asyncio
-    async def test_move_invalid_target_type(self, mock_window_list):
-        """Test that invalid target_type raises error."""
-        with patch(
-            "win_ctrl_mcp.tools.window.get_focused_window", new_callable=AsyncMock
-        ) as mock_focused:
-            mock_focused.return_value = mock_window_list[0]
+    async def test_move_by_window_id(self, window_mocks, mock_window_list):
+        """Test that moving a window by ID addresses it without focusing it."""
+        window_mocks["get_window_by_id"].return_value = mock_window_list[1]
 
-            with pytest.raises(AeroSpaceError) as exc_info:
-                await move_window(target_type="invalid", target="2")
+        result = await move_window(target_type="monitor", target="next", window_id=5678)
 
-            assert "Invalid target_type" in str(exc_info.value)
+        assert result["success"] is True
+        assert result["window_id"] == 5678
+        window_mocks["run_aerospace_command"].assert_awaited_once_with(
+            "move-node-to-monitor", "--window-id", "5678", "next"
+        )
 
 
 class TestResizeWindow:
     """Tests for resize_window tool."""
 
     @pytest.mark.asyncio
-    async def test_resize_window(self, mock_window_list):
+    async def test_resize_window(self, window_mocks, mock_window_list):
         """Test resizing a window."""
-        with patch(
-            "win_ctrl_mcp.tools.window.run_aerospace_command", new_callable=AsyncMock
-        ) as mock_cmd:
-            mock_cmd.return_value = ("", "", 0)
+        window_mocks["get_focused_window"].return_value = mock_window_list[0]
 
-            with patch(
-                "win_ctrl_mcp.tools.window.get_focused_window", new_callable=AsyncMock
-            ) as mock_focused:
-                mock_focused.return_value = mock_window_list[0]
+        result = await resize_window(dimension="width", amount="+50")
 
-                result = await resize_window(dimension="width", amount="+50")
-
-                assert result["success"] is True
-                assert result["resize"]["dimension"] == "width"
-                assert result["resize"]["amount"] == "+50"
-
-    @pytest.mark.asyncio
-    async def test_resize_invalid_dimension(self, mock_window_list):
-        """Test that invalid dimension raises error."""
-        with patch(
-            "win_ctrl_mcp.tools.window.get_focused_window", new_callable=AsyncMock
-        ) as mock_focused:
-            mock_focused.return_value = mock_window_list[0]
-
-            with pytest.raises(AeroSpaceError) as exc_info:
-                await resize_window(dimension="invalid", amount="+50")
-
-            assert "Invalid dimension" in str(exc_info.value)
+        assert result["success"] is True
+        assert result["resize"]["dimension"] == "width"
+        assert result["resize"]["amount"] == "+50"
 
 
 class TestCloseWindow:
     """Tests for close_window tool."""
 
     @pytest.mark.asyncio
-    async def test_close_focused_window(self, mock_window_list):
+    async def test_close_focused_window(self, window_mocks, mock_window_list):
         """Test closing focused window."""
-        with patch(
-            "win_ctrl_mcp.tools.window.run_aerospace_command", new_callable=AsyncMock
-        ) as mock_cmd:
-            mock_cmd.return_value = ("", "", 0)
-
-            with patch(
-                "win_ctrl_mcp.tools.window.get_focused_window", new_callable=AsyncMock
-            ) as mock_focused:
-                mock_focused.return_value = mock_window_list[0]
+        window_mocks["get_focused_window"].return_value = mock_window_list[0]
 
-                result = await close_window()
+        result = await close_window()
 
-                assert result["success"] is True
-                assert result["closed_window"]["window_id"] == 1234
+        assert result["success"] is True
+        assert result["closed_window"]["window_id"] == 1234
 
 
 class TestFullscreenToggle:
     """Tests for fullscreen_toggle tool."""
 
     @pytest.mark.asyncio
-    async def test_fullscreen_toggle(self, mock_window_list):
+    async def test_fullscreen_toggle(self, window_mocks, mock_window_list):
         """Test toggling fullscreen."""
-        with patch(
-            "win_ctrl_mcp.tools.window.run_aerospace_command", new_callable=AsyncMock
-        ) as mock_cmd:
-            mock_cmd.return_value = ("", "", 0)
-
-            with patch(
-                "win_ctrl_mcp.tools.window.get_focused_window", new_callable=AsyncMock
-            ) as mock_focused:
-                mock_focused.return_value = mock_window_list[0]
-
-                with patch(
-                    "win_ctrl_mcp.tools.window.get_window_by_id", new_callable=AsyncMock
-                ) as mock_get:
-                    mock_get.return_value = mock_window_list[0]
+        window_mocks["get_focused_window"].return_value = mock_window_list[0]
+        window_mocks["get_window_by_id"].return_value = mock_window_list[0]
 
-                    result = await fullscreen_toggle()
+        result = await fullscreen_toggle()
 
-                    assert result["success"] is True
-                    assert "fullscreen" in result
+        assert result["success"] is True
+        assert "fullscreen" in result
 
 
 class TestMinimizeWindow:
     """Tests for minimize_window tool."""
 
     @pytest.mark.asyncio
-    async def test_minimize_window(self, mock_window_list):
+    async def test_minimize_window(self, window_mocks, mock_window_list):
         """Test minimizing a window."""
-        with patch(
-            "win_ctrl_mcp.tools.window.run_aerospace_command", new_callable=AsyncMock
-        ) as mock_cmd:
-            mock_cmd.return_value = ("", "", 0)
+        window_mocks["get_focused_window"].return_value = mock_window_list[0]
+
+        result = await minimize_window()
+
+        assert result["success"] is True
+        assert result["minimized"] is True
+
+
+class TestInvalidParameters:
+    """Tests for window tools rejecting invalid arguments."""
+
+    @pytest.mark.parametrize(
+        ("call", "code"),
+        [
+            pytest.param(
+                lambda: focus_window(direction="diagonal"), "INVALID_DIRECTION", id="direction"
+            ),
+            pytest.param(
+                lambda: resize_window(dimension="invalid", amount="+50"),
+                "INVALID_PARAMETERS",
+                id="dimension",
+            ),
+            pytest.param(
+                lambda: move_window(target_type="invalid", target="2"),
+                "INVALID_PARAMETERS",
+                id="target_type",
+            ),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_invalid_argument(self, call, code):
+        """Test that an invalid argument is rejected before any command runs."""
+        with pytest.raises(AeroSpaceError) as exc_info:
+            await call()
+
+        assert exc_info.value.code == code
+
 
-            with patch(
-                "win_ctrl_mcp.tools.window.get_focused_window", new_callable=AsyncMock
-            ) as mock_focused:
-                mock_focused.return_value = mock_window_list[0]
+class TestFocusedWindowWithoutId:
+    """Tests for tools acting on a focused window that reports no ID."""
 
-                result = await minimize_window()
+    @pytest.mark.parametrize(
+        "call",
+        [
+            pytest.param(lambda: move_window(target_type="workspace", target="2"), id="move"),
+            pytest.param(fullscreen_toggle, id="fullscreen"),
+            pytest.param(minimize_window, id="minimize"),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_reports_no_window_focused(self, window_mocks, call):
+        """Test that a focused entry without a window-id counts as nothing focused."""
+        window_mocks["get_focused_window"].return_value = {"app-name": "Safari"}
+
+        with pytest.raises(AeroSpaceError) as exc_info:
+            await call()
 
-                assert result["success"] is True
-                assert result["minimized"] is True
+        assert exc_info.value.code == "NO_WINDOW_FOCUSED"
+        window_mocks["run_aerospace_command"].assert_not_awaited()